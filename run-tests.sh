@@ -41,6 +41,29 @@ commands=(
         "{ python -m unittest tests.sdk.testPixReversal; }"
         "{ python -m unittest tests.sdk.testPixReversalLog; }"
         "{ python -m unittest tests.sdk.testPixStatement; }"
+        "{ python -m unittest tests.sdk.testSession; }"
+        "{ python -c 'import sys; sys.exit(sys.version_info >= (3, 7))' || python -m unittest tests.sdk.testAio; }"
+        "{ python -m unittest tests.sdk.testPrefetch; }"
+        "{ python -m unittest tests.sdk.testShard; }"
+        "{ python -m unittest tests.sdk.testBulk; }"
+        "{ python -m unittest tests.sdk.testBatch; }"
+        "{ python -m unittest tests.sdk.testCrypto; }"
+        "{ python -m unittest tests.sdk.testPublicKey; }"
+        "{ python -m unittest tests.sdk.testIssuingPurchaseAuthorizer; }"
+        "{ python -m unittest tests.sdk.testImport; }"
+        "{ python -m unittest tests.sdk.testCompact; }"
+        "{ python -m unittest tests.sdk.testRaw; }"
+        "{ python -m unittest tests.sdk.testDecoder; }"
+        "{ python -m unittest tests.sdk.testLazy; }"
+        "{ python -m unittest tests.sdk.testProjection; }"
+        "{ python -m unittest tests.sdk.testColumnar; }"
+        "{ python -m unittest tests.sdk.testSerializer; }"
+        "{ python -m unittest tests.sdk.testCodec; }"
+        "{ python -m unittest tests.sdk.testParseCache; }"
+        "{ python -m unittest tests.sdk.testParseMany; }"
+        "{ python -m unittest tests.sdk.testEventDispatcher; }"
+        "{ python -m unittest tests.sdk.testIdempotency; }"
+        "{ python -m unittest tests.sdk.testEventDrain; }"
     )
 
 clen=`expr "${#commands[@]}" - 1` # get length of commands - 1
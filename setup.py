@@ -1,4 +1,5 @@
 from re import search
+from sys import version_info
 from setuptools import setup, find_packages
 
 with open('README.md') as f:
@@ -7,10 +8,17 @@ with open('README.md') as f:
 with open('starkinfra/__init__.py') as f:
     version = search(r'version = \"(.*)\"', f.read()).group(1)
 
+exclude = ["tests", "tests.*"]
+exclude_package_data = {}
+if version_info < (3, 7):
+    exclude += ["starkinfra.aio", "starkinfra.aio.*"]
+    exclude_package_data["starkinfra"] = ["aio/*"]
+
 setup(
     name="starkinfra",
-    packages=find_packages(exclude=["tests"]),
+    packages=find_packages(exclude=exclude),
     include_package_data=True,
+    exclude_package_data=exclude_package_data,
     description="SDK to facilitate Python integrations with Stark Infra",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -23,4 +31,9 @@ setup(
     install_requires=[
         "starkcore>=0.1.0",
     ],
+    extras_require={
+        "native": ["cryptography", "orjson"],
+        "aio": ["aiohttp"],
+        "columnar": ["numpy"],
+    },
 )
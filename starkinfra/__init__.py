@@ -2,139 +2,153 @@ version = "0.10.1"
 language = "en-US"
 timeout = 15
 user = None
-
+pool_size = 10
+pool_idle_timeout = 60
+public_key_ttl = 3600
+parse_cache_size = 0
+parse_cache_ttl = 600
+compact = False
+interned_fields = {
+    "PixRequest": ["status", "flow", "method", "sender_account_type", "receiver_account_type",
+                   "sender_bank_code", "receiver_bank_code", "cashier_type", "cashier_bank_code"],
+    "PixRequestLog": ["type"],
+    "PixReversal": ["status", "flow", "reason"],
+    "PixReversalLog": ["type"],
+    "IssuingPurchase": ["status", "purpose", "merchant_category_code", "merchant_category_type", "merchant_country_code",
+                        "merchant_currency_code", "merchant_currency_symbol", "issuer_currency_code",
+                        "issuer_currency_symbol", "method_code", "wallet_id"],
+    "IssuingPurchaseLog": ["type"],
+    "Event": ["subscription", "workspace_id"],
+}
+
+from sys import version_info as _python_version
+from importlib import import_module as _import_module
 from starkcore import Project, Organization, key, error
 
-from . import event
-from .event.__event import Event
-
-from . import brcodepreview
-from .brcodepreview.__brcodepreview import BrcodePreview
-
-from . import pixrequest
-from .pixrequest.__pixrequest import PixRequest
-
-from . import pixreversal
-from .pixreversal.__pixreversal import PixReversal
-
-from . import pixstatement
-from .pixstatement.__pixstatement import PixStatement
-
-from . import pixbalance
-from .pixbalance.__pixbalance import PixBalance
-
-from . import pixdirector
-from .pixdirector.__pixdirector import PixDirector
-
-from . import pixkey
-from .pixkey.__pixkey import PixKey
-
-from . import pixclaim
-from .pixclaim.__pixclaim import PixClaim
-
-from . import pixdomain
-from .pixdomain.__pixdomain import PixDomain
-
-from . import pixfraud
-from .pixfraud.__pixfraud import PixFraud
-
-from . import pixinfraction
-from .pixinfraction.__pixinfraction import PixInfraction
-
-from . import pixchargeback
-from .pixchargeback.__pixchargeback import PixChargeback
-
-from . import pixuser
-from .pixuser.__pixuser import PixUser
-
-from . import issuingbalance
-from .issuingbalance.__issuingbalance import IssuingBalance
-
-from . import creditnote
-from .creditnote.__creditnote import CreditNote
-
-from . import creditsigner
-from .creditsigner.__creditsigner import CreditSigner
-
-from . import creditpreview
-from .creditpreview.__creditpreview import CreditPreview
-
-from . import creditholmes
-from .creditholmes.__creditholmes import CreditHolmes
-
-from . import individualidentity
-from .individualidentity.__individualidentity import IndividualIdentity
-
-from . import individualdocument
-from .individualdocument.__individualdocument import IndividualDocument
-
-from . import dynamicbrcode
-from .dynamicbrcode.__dynamicbrcode import DynamicBrcode
-
-from . import staticbrcode
-from .staticbrcode.__staticbrcode import StaticBrcode
-
-from . import issuingtransaction
-from .issuingtransaction.__issuingtransaction import IssuingTransaction
-
-from . import issuingholder
-from .issuingholder.__issuingholder import IssuingHolder
-
-from . import issuingcard
-from .issuingcard.__issuingcard import IssuingCard
-
-from . import issuingpurchase
-from .issuingpurchase.__issuingpurchase import IssuingPurchase
-
-from . import issuinginvoice
-from .issuinginvoice.__issuinginvoice import IssuingInvoice
-
-from . import issuingwithdrawal
-from .issuingwithdrawal.__issuingwithdrawal import IssuingWithdrawal
-
-from . import issuingproduct
-from .issuingproduct.__issuingproduct import IssuingProduct
-
-from . import issuingrule
-from .issuingrule.__issuingrule import IssuingRule
-
-from . import issuingstock
-from .issuingstock.__issuingstock import IssuingStock
-
-from . import issuingrestock
-from .issuingrestock.__issuingrestock import IssuingRestock
-
-from . import issuingdesign
-from .issuingdesign.__issuingdesign import IssuingDesign
-
-from . import issuingembossingrequest
-from .issuingembossingrequest.__issuingembossingrequest import IssuingEmbossingRequest
-
-from . import issuingembossingkit
-from .issuingembossingkit.__issuingembossingkit import IssuingEmbossingKit
-
-from . import issuingtoken
-from .issuingtoken.__issuingtoken import IssuingToken
-
-from . import issuingtokendesign
-from .issuingtokendesign.__issuingtokendesign import IssuingTokenDesign
-
-from . import issuingtokenrequest
-from .issuingtokenrequest.__issuingtokenrequest import IssuingTokenRequest
-
-from . import issuingtokenactivation
-from .issuingtokenactivation.__issuingtokenactivation import IssuingTokenActivation
-
-from . import merchantcategory
-from .merchantcategory.__merchantcategory import MerchantCategory
-
-from . import merchantcountry
-from .merchantcountry.__merchantcountry import MerchantCountry
-
-from . import cardmethod
-from .cardmethod.__cardmethod import CardMethod
-
-from . import webhook
-from .webhook.__webhook import Webhook
-
-from .utils import endtoendid, returnid
+_modules = {
+    "event": ".event",
+    "brcodepreview": ".brcodepreview",
+    "pixrequest": ".pixrequest",
+    "pixreversal": ".pixreversal",
+    "pixstatement": ".pixstatement",
+    "pixbalance": ".pixbalance",
+    "pixdirector": ".pixdirector",
+    "pixkey": ".pixkey",
+    "pixclaim": ".pixclaim",
+    "pixdomain": ".pixdomain",
+    "pixfraud": ".pixfraud",
+    "pixinfraction": ".pixinfraction",
+    "pixchargeback": ".pixchargeback",
+    "pixuser": ".pixuser",
+    "issuingbalance": ".issuingbalance",
+    "creditnote": ".creditnote",
+    "creditsigner": ".creditsigner",
+    "creditpreview": ".creditpreview",
+    "creditholmes": ".creditholmes",
+    "individualidentity": ".individualidentity",
+    "individualdocument": ".individualdocument",
+    "dynamicbrcode": ".dynamicbrcode",
+    "staticbrcode": ".staticbrcode",
+    "issuingtransaction": ".issuingtransaction",
+    "issuingholder": ".issuingholder",
+    "issuingcard": ".issuingcard",
+    "issuingpurchase": ".issuingpurchase",
+    "issuinginvoice": ".issuinginvoice",
+    "issuingwithdrawal": ".issuingwithdrawal",
+    "issuingproduct": ".issuingproduct",
+    "issuingrule": ".issuingrule",
+    "issuingstock": ".issuingstock",
+    "issuingrestock": ".issuingrestock",
+    "issuingdesign": ".issuingdesign",
+    "issuingembossingrequest": ".issuingembossingrequest",
+    "issuingembossingkit": ".issuingembossingkit",
+    "issuingtoken": ".issuingtoken",
+    "issuingtokendesign": ".issuingtokendesign",
+    "issuingtokenrequest": ".issuingtokenrequest",
+    "issuingtokenactivation": ".issuingtokenactivation",
+    "merchantcategory": ".merchantcategory",
+    "merchantcountry": ".merchantcountry",
+    "cardmethod": ".cardmethod",
+    "webhook": ".webhook",
+    "endtoendid": ".utils.endtoendid",
+    "returnid": ".utils.returnid",
+    "shard": ".utils.shard",
+    "bulk": ".utils.bulk",
+    "batch": ".utils.batch",
+    "crypto": ".utils.crypto",
+    "publickey": ".utils.publickey",
+    "codec": ".utils.codec",
+    "parsecache": ".utils.parsecache",
+    "idempotency": ".utils.idempotency",
+    "columnar": ".utils.columnar",
+}
+
+_classes = {
+    "Event": ".event.__event",
+    "BrcodePreview": ".brcodepreview.__brcodepreview",
+    "PixRequest": ".pixrequest.__pixrequest",
+    "PixReversal": ".pixreversal.__pixreversal",
+    "PixStatement": ".pixstatement.__pixstatement",
+    "PixBalance": ".pixbalance.__pixbalance",
+    "PixDirector": ".pixdirector.__pixdirector",
+    "PixKey": ".pixkey.__pixkey",
+    "PixClaim": ".pixclaim.__pixclaim",
+    "PixDomain": ".pixdomain.__pixdomain",
+    "PixFraud": ".pixfraud.__pixfraud",
+    "PixInfraction": ".pixinfraction.__pixinfraction",
+    "PixChargeback": ".pixchargeback.__pixchargeback",
+    "PixUser": ".pixuser.__pixuser",
+    "IssuingBalance": ".issuingbalance.__issuingbalance",
+    "CreditNote": ".creditnote.__creditnote",
+    "CreditSigner": ".creditsigner.__creditsigner",
+    "CreditPreview": ".creditpreview.__creditpreview",
+    "CreditHolmes": ".creditholmes.__creditholmes",
+    "IndividualIdentity": ".individualidentity.__individualidentity",
+    "IndividualDocument": ".individualdocument.__individualdocument",
+    "DynamicBrcode": ".dynamicbrcode.__dynamicbrcode",
+    "StaticBrcode": ".staticbrcode.__staticbrcode",
+    "IssuingTransaction": ".issuingtransaction.__issuingtransaction",
+    "IssuingHolder": ".issuingholder.__issuingholder",
+    "IssuingCard": ".issuingcard.__issuingcard",
+    "IssuingPurchase": ".issuingpurchase.__issuingpurchase",
+    "IssuingInvoice": ".issuinginvoice.__issuinginvoice",
+    "IssuingWithdrawal": ".issuingwithdrawal.__issuingwithdrawal",
+    "IssuingProduct": ".issuingproduct.__issuingproduct",
+    "IssuingRule": ".issuingrule.__issuingrule",
+    "IssuingStock": ".issuingstock.__issuingstock",
+    "IssuingRestock": ".issuingrestock.__issuingrestock",
+    "IssuingDesign": ".issuingdesign.__issuingdesign",
+    "IssuingEmbossingRequest": ".issuingembossingrequest.__issuingembossingrequest",
+    "IssuingEmbossingKit": ".issuingembossingkit.__issuingembossingkit",
+    "IssuingToken": ".issuingtoken.__issuingtoken",
+    "IssuingTokenDesign": ".issuingtokendesign.__issuingtokendesign",
+    "IssuingTokenRequest": ".issuingtokenrequest.__issuingtokenrequest",
+    "IssuingTokenActivation": ".issuingtokenactivation.__issuingtokenactivation",
+    "MerchantCategory": ".merchantcategory.__merchantcategory",
+    "MerchantCountry": ".merchantcountry.__merchantcountry",
+    "CardMethod": ".cardmethod.__cardmethod",
+    "Webhook": ".webhook.__webhook",
+}
+
+__all__ = ["version", "language", "timeout", "user", "pool_size", "pool_idle_timeout", "public_key_ttl", "parse_cache_size",
+           "parse_cache_ttl", "compact", "interned_fields", "Project", "Organization", "key", "error"] + list(_modules) + list(_classes)
+
+
+def __getattr__(name):
+    if name in _modules:
+        value = _import_module(_modules[name], __name__)
+    elif name in _classes:
+        value = getattr(_import_module(_classes[name], __name__), name)
+    else:
+        raise AttributeError("module {module!r} has no attribute {name!r}".format(module=__name__, name=name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules) | set(_classes))
+
+
+if _python_version < (3, 7):
+    for _name in list(_modules) + list(_classes):
+        __getattr__(_name)
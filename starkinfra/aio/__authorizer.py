@@ -0,0 +1,122 @@
+import asyncio
+from time import perf_counter
+from functools import partial
+from starkcore.error import InvalidSignatureError
+from ..utils import publickey
+from ..utils.histogram import Histogram
+from ..issuingpurchase.__issuingpurchase import parse, response
+
+
+class Authorizer:
+    """# Authorizer object
+    ASGI application that answers IssuingPurchase authorization requests posted to your endpoint.
+    Every request has its signature verified and is parsed into an IssuingPurchase, which is handed to the decide callback.
+    If the whole process takes longer than the deadline, or the callback raises an exception, the fallback answer is sent,
+    so Stark Infra always receives an HTTP 200 before its 2-second limit. Requests with invalid signatures receive HTTP 401.
+    On ASGI startup, the Stark Infra public key is preloaded.
+    Use starkinfra.issuingpurchase.authorizer() to create it.
+    ## Attributes:
+    - decide [function]: callback receiving the IssuingPurchase object and returning the answer
+    - deadline [float]: maximum number of seconds spent before the fallback answer is sent
+    - fallback [string]: dumped JSON answer sent on timeouts and errors
+    - user [Organization/Project object]: user used to fetch the Stark Infra public key
+    - latency [dictionary of Histogram objects]: latencies of the "verification", "decision" and "total" stages
+    - fallbacks [dictionary of integers]: number of fallback answers sent by "timeout" and "error"
+    """
+
+    def __init__(self, decide, deadline, fallback, user):
+        self.decide = decide
+        self.deadline = deadline
+        self.fallback = fallback
+        self.user = user
+        self.latency = {
+            "verification": Histogram(),
+            "decision": Histogram(),
+            "total": Histogram(),
+        }
+        self.fallbacks = {"timeout": 0, "error": 0}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self._lifespan(receive, send)
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            return await self._send(send, 405, b"")
+
+        start = perf_counter()
+        content = await self._read(receive)
+        headers = dict(scope.get("headers") or [])
+        signature = headers.get(b"digital-signature", b"").decode("latin-1")
+
+        try:
+            answer = await asyncio.wait_for(
+                self._authorize(content, signature),
+                timeout=max(self.deadline - (perf_counter() - start), 0),
+            )
+        except InvalidSignatureError:
+            return await self._send(send, 401, b"")
+        except asyncio.TimeoutError:
+            self.fallbacks["timeout"] += 1
+            answer = self.fallback
+        except Exception:
+            self.fallbacks["error"] += 1
+            answer = self.fallback
+
+        await self._send(send, 200, answer.encode("utf-8"))
+        self.latency["total"].observe(perf_counter() - start)
+
+    async def _authorize(self, content, signature):
+        loop = asyncio.get_event_loop()
+
+        start = perf_counter()
+        purchase = await loop.run_in_executor(None, partial(parse, content=content, signature=signature, user=self.user))
+        self.latency["verification"].observe(perf_counter() - start)
+
+        start = perf_counter()
+        if asyncio.iscoroutinefunction(self.decide):
+            answer = await self.decide(purchase)
+        else:
+            answer = await loop.run_in_executor(None, self.decide, purchase)
+        self.latency["decision"].observe(perf_counter() - start)
+
+        if isinstance(answer, dict):
+            answer = response(**answer)
+        return answer
+
+    async def _lifespan(self, receive, send):
+        loop = asyncio.get_event_loop()
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await loop.run_in_executor(None, partial(publickey.preload, user=self.user))
+                except Exception as exception:
+                    await send({"type": "lifespan.startup.failed", "message": str(exception)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read(receive):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                return body.decode("utf-8")
+
+    @staticmethod
+    async def _send(send, status, body):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
@@ -0,0 +1,51 @@
+import sys
+from types import FunctionType, ModuleType
+from importlib import import_module
+from . import __rest as _rest
+from .__request import close
+
+
+_resources = [
+    "event", "brcodepreview", "pixrequest", "pixreversal", "pixstatement", "pixbalance", "pixdirector", "pixkey",
+    "pixclaim", "pixdomain", "pixfraud", "pixinfraction", "pixchargeback", "pixuser", "issuingbalance", "creditnote",
+    "creditsigner", "creditpreview", "creditholmes", "individualidentity", "individualdocument", "dynamicbrcode",
+    "staticbrcode", "issuingtransaction", "issuingholder", "issuingcard", "issuingpurchase", "issuinginvoice",
+    "issuingwithdrawal", "issuingproduct", "issuingrule", "issuingstock", "issuingrestock", "issuingdesign",
+    "issuingembossingrequest", "issuingembossingkit", "issuingtoken", "issuingtokendesign", "issuingtokenrequest",
+    "issuingtokenactivation", "merchantcategory", "merchantcountry", "cardmethod", "webhook",
+]
+
+
+async def _anext(iterator):
+    return await iterator.__anext__()
+
+
+def _mirror_module(module, name):
+    mirror = ModuleType(name, module.__doc__)
+    namespaces = {}
+    for attribute, value in vars(module).items():
+        if attribute.startswith("_"):
+            continue
+        if isinstance(value, ModuleType):
+            if value.__name__.startswith(module.__name__ + "."):
+                value = _mirror_module(value, name="{name}.{attribute}".format(name=name, attribute=attribute))
+        elif isinstance(value, FunctionType) and "rest" in value.__code__.co_names:
+            value = _mirror_function(value, namespaces)
+        setattr(mirror, attribute, value)
+    sys.modules[name] = mirror
+    return mirror
+
+
+def _mirror_function(function, namespaces):
+    namespace = namespaces.get(function.__module__)
+    if namespace is None:
+        namespace = namespaces[function.__module__] = dict(function.__globals__, rest=_rest, next=_anext)
+    mirror = FunctionType(function.__code__, namespace, function.__name__, function.__defaults__, function.__closure__)
+    mirror.__kwdefaults__ = function.__kwdefaults__
+    mirror.__doc__ = function.__doc__
+    mirror.__module__ = function.__module__
+    return mirror
+
+
+for _name in _resources:
+    globals()[_name] = _mirror_module(import_module("starkinfra." + _name), name=__name__ + "." + _name)
@@ -0,0 +1,82 @@
+import asyncio
+from weakref import WeakKeyDictionary
+from functools import partial
+from starkcore.error import UnknownError
+from starkcore.utils.checks import check_user
+from ..utils.request import fetch as _sync_fetch, prepare, respond
+from ..utils.session import _key
+import starkinfra
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+_sessions = WeakKeyDictionary()
+
+
+async def fetch(host, sdk_version, user, method, path, payload=None, query=None,
+                api_version="v2", language="en-US", timeout=15):
+    if aiohttp is None:
+        return await asyncio.get_running_loop().run_in_executor(None, partial(
+            _sync_fetch,
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            method=method,
+            path=path,
+            payload=payload,
+            query=query,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+        ))
+
+    user = check_user(user)
+    url, body, headers = prepare(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+    )
+
+    try:
+        async with _session(user).request(
+            method=method,
+            url=url,
+            data=body,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as request:
+            status, content = request.status, await request.read()
+    except Exception as exception:
+        raise UnknownError("{}: {}".format(exception.__class__.__name__, str(exception)))
+
+    return respond(status=status, content=content)
+
+
+async def close():
+    """# Close all pooled asynchronous HTTP sessions
+    Closes the aiohttp sessions opened by the SDK on the running event loop.
+    Call it before closing the event loop to release its connections cleanly.
+    """
+    sessions = _sessions.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+def _session(user):
+    sessions = _sessions.setdefault(asyncio.get_running_loop(), {})
+    key = _key(user)
+    session = sessions.get(key)
+    if session is None or session.closed:
+        session = sessions[key] = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+            limit=starkinfra.pool_size,
+            keepalive_timeout=starkinfra.pool_idle_timeout,
+        ))
+    return session
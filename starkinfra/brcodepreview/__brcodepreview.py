@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime_or_date
+from ..utils.lazy import LazyDatetime
 
 
 class BrcodePreview(Resource):
@@ -37,6 +38,8 @@ class BrcodePreview(Resource):
     - tax_id [string]: Payment receiver tax ID. ex: "012.345.678-90"
     """
 
+    scheduled = LazyDatetime(check_datetime_or_date)
+
     def __init__(self, id, payer_id, account_number=None, account_type=None, amount=None, amount_type=None, bank_code=None,
                  branch_code=None, cash_amount=None, cashier_bank_code=None, cashier_type=None, discount_amount=None,
                  fine_amount=None, interest_amount=None, key_id=None, name=None, nominal_amount=None, end_to_end_id=None,
@@ -62,7 +65,7 @@ class BrcodePreview(Resource):
         self.nominal_amount = nominal_amount
         self.reconciliation_id = reconciliation_id
         self.reduction_amount = reduction_amount
-        self.scheduled = check_datetime_or_date(scheduled)
+        self.scheduled = scheduled
         self.status = status
         self.tax_id = tax_id
 
@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -24,6 +25,9 @@ class CreditHolmes(Resource):
     - updated [datetime.datetime]: latest update datetime for the CreditHolmes. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, tax_id, competence, result=None, tags=None, id=None, status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
@@ -32,8 +36,8 @@ class CreditHolmes(Resource):
         self.status = status
         self.tags = tags
         self.result = result
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": CreditHolmes, "name": "CreditHolmes"}
@@ -65,7 +69,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve CreditHolmes
     Receive a generator of CreditHolmes objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -75,6 +79,9 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: "created", "failed", "success"
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["tax_id", "status", "result"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of CreditHolmes objects with updated attributes
@@ -87,11 +94,14 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, raw=False, fields=None, user=None):
     """# Retrieve paged CreditHolmes
     Receive a list of up to 100 CreditHolmes objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -103,6 +113,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: "created", "failed", "success"
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["tax_id", "status", "result"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of CreditHolmes objects with updated attributes
@@ -117,5 +129,7 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
         status=status,
         tags=tags,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -5,9 +5,10 @@ from ..creditsigner.__creditsigner import _resource as _creditsigner_resource
 from .__transfer import Transfer
 from .__transfer import _resource as _transfer_resource
 from ..utils import rest
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ..utils.api import from_api_json
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class CreditNote(Resource):
@@ -52,6 +53,9 @@ class CreditNote(Resource):
     - updated [datetime.datetime]: latest update datetime for the CreditNote. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, template_id, name, tax_id, scheduled, invoices, payment, signers, external_id,
                  street_line_1, street_line_2, district, city, state_code, zip_code, payment_type=None,
                  nominal_amount=None, amount=None, rebate_amount=None, tags=None, expiration=None, id=None,
@@ -84,8 +88,8 @@ class CreditNote(Resource):
         self.tax_amount = tax_amount
         self.nominal_interest = nominal_interest
         self.interest = interest
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
         self.payment, self.payment_type = _parse_payment(payment=payment, payment_type=payment_type)
 
@@ -162,7 +166,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve CreditNotes
     Receive a generator of CreditNote objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -172,6 +176,9 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["canceled", "created", "expired", "failed", "processing", "signed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of CreditNote objects with updated attributes
@@ -184,11 +191,14 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, raw=False, fields=None, user=None):
     """# Retrieve paged CreditNotes
     Receive a list of up to 100 CreditNote objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -200,6 +210,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["canceled", "created", "expired", "failed", "processing", "signed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of CreditNote objects with updated attributes
@@ -214,6 +226,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
         status=status,
         tags=tags,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_datetime_or_date
+from ..utils.lazy import LazyDatetime
 
 
 class Transfer(Resource):
@@ -27,6 +28,10 @@ class Transfer(Resource):
     - updated [datetime.datetime]: latest update datetime for the transfer. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    scheduled = LazyDatetime(check_datetime_or_date)
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, name, tax_id, bank_code, branch_code, account_number, account_type=None, tags=None, id=None,
                  amount=None, external_id=None, scheduled=None, description=None, fee=None, status=None,
                  transaction_ids=None, created=None, updated=None):
@@ -41,13 +46,13 @@ class Transfer(Resource):
         self.tags = tags
         self.amount = amount
         self.external_id = external_id
-        self.scheduled = check_datetime_or_date(scheduled)
+        self.scheduled = scheduled
         self.description = description
         self.fee = fee
         self.status = status
         self.transaction_ids = transaction_ids
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": Transfer, "name": "Transfer"}
@@ -1,6 +1,7 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.api import from_api_json
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_datetime_or_date, check_timedelta
+from ...utils.lazy import LazyDatetime
 from .__discount import Discount
 from .__discount import resource as _discount_resource
 from .__description import Description
@@ -38,6 +39,10 @@ class Invoice(Resource):
     - updated [datetime.datetime]: latest update datetime for the Invoice. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    due = LazyDatetime(check_datetime_or_date)
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, amount, due=None, expiration=None, tags=None, descriptions=None, id=None, name=None, tax_id=None,
                  pdf=None, link=None, fine=None, interest=None, nominal_amount=None, fine_amount=None,
                  interest_amount=None, discount_amount=None, discounts=None, brcode=None, status=None, fee=None,
@@ -45,7 +50,7 @@ class Invoice(Resource):
         Resource.__init__(self, id=id)
 
         self.amount = amount
-        self.due = check_datetime_or_date(due)
+        self.due = due
         self.expiration = check_timedelta(expiration)
         self.fine = fine
         self.interest = interest
@@ -64,8 +69,8 @@ class Invoice(Resource):
         self.status = status
         self.fee = fee
         self.transaction_ids = transaction_ids
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 def parse_discounts(discounts):
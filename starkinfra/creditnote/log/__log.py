@@ -1,7 +1,7 @@
 from ...utils import rest
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
-from starkcore.utils.api import from_api_json
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__creditnote import _resource as _creditNote_resource
 
 
@@ -19,13 +19,16 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    note = LazyEntity(_creditNote_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, created, type, errors, note):
         Resource.__init__(self, id=id)
 
-        self.created = check_datetime(created)
+        self.created = created
         self.type = type
         self.errors = errors
-        self.note = from_api_json(_creditNote_resource, note)
+        self.note = note
 
 
 _resource = {"class": Log, "name": "CreditNoteLog"}
@@ -44,7 +47,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, note_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, note_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve creditnote.Logs
     Receive a generator of creditnote.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -53,6 +56,9 @@ def query(limit=None, after=None, before=None, types=None, note_ids=None, user=N
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["canceled", "created", "expired", "failed", "refunded", "registered", "sending", "sent", "signed", "success"]
     - note_ids [list of strings, default None]: list of CreditNote ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "note", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of creditnote.Log objects with updated attributes
@@ -64,11 +70,14 @@ def query(limit=None, after=None, before=None, types=None, note_ids=None, user=N
         before=check_date(before),
         types=types,
         note_ids=note_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, types=None, note_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, types=None, note_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged creditnote.Logs
     Receive a list of up to 100 creditnote.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -79,6 +88,8 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, note_ids=
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["canceled", "created", "expired", "failed", "refunded", "registered", "sending", "sent", "signed", "success"]
     - note_ids [list of strings, default None]: list of CreditNote ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "note", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of creditnote.Log objects with updated attributes
@@ -92,5 +103,7 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, note_ids=
         before=check_date(before),
         types=types,
         note_ids=note_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
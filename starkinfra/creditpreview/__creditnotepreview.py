@@ -1,4 +1,4 @@
-from starkcore.utils.api import from_api_json
+from ..utils.api import from_api_json
 from starkcore.utils.subresource import SubResource
 from ..creditnote.invoice.__invoice import Invoice, _resource as _invoice_resource
 
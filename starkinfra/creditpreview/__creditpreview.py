@@ -1,4 +1,4 @@
-from starkcore.utils.api import from_api_json
+from ..utils.api import from_api_json
 from starkcore.utils.subresource import SubResource
 from ..utils import rest
 from .__creditnotepreview import _sub_resource as _credit_note_preview_sub_resource, CreditNotePreview
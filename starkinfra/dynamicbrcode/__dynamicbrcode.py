@@ -1,9 +1,10 @@
-from json import dumps
+from ..utils import codec
 from ..utils import rest
 from ..utils import parse
-from starkcore.utils.api import api_json
-from starkcore.utils.resource import Resource
+from ..utils.api import api_json
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class DynamicBrcode(Resource):
@@ -33,6 +34,9 @@ class DynamicBrcode(Resource):
     - created [datetime.datetime]: creation datetime for the DynamicBrcode. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, name, city, external_id, id=None, type=None, tags=None, uuid=None, url=None, 
                     updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -44,8 +48,8 @@ class DynamicBrcode(Resource):
         self.tags = tags
         self.uuid = uuid
         self.url = url
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": DynamicBrcode, "name": "DynamicBrcode"}
@@ -77,7 +81,7 @@ def get(uuid, user=None):
     return rest.get_id(resource=_resource, id=uuid, user=user)
 
 
-def query(limit=None, after=None, before=None, external_id=None, uuids=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, external_id=None, uuids=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve DynamicBrcodes
     Receive a generator of DynamicBrcode objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -87,6 +91,9 @@ def query(limit=None, after=None, before=None, external_id=None, uuids=None, tag
     - external_ids [list of strings, default None]: list of external_ids to filter retrieved objects. ex: ["my_external_id1", "my_external_id2"]
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["901e71f2447c43c886f58366a5432c4b", "4e2eab725ddd495f9c98ffd97440702d"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["uuid", "url", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of DynamicBrcode objects with updated attributes
@@ -99,11 +106,14 @@ def query(limit=None, after=None, before=None, external_id=None, uuids=None, tag
         external_id=external_id,
         uuids=uuids,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, external_id=None, uuids=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, external_id=None, uuids=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve DynamicBrcodes
     Receive a list of DynamicBrcode objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -114,6 +124,8 @@ def page(cursor=None, limit=None, after=None, before=None, external_id=None, uui
     - external_ids [list of strings, default None]: list of external_ids to filter retrieved objects. ex: ["my_external_id1", "my_external_id2"]
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["901e71f2447c43c886f58366a5432c4b", "4e2eab725ddd495f9c98ffd97440702d"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["uuid", "url", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of DynamicBrcode objects with updated attributes
@@ -128,6 +140,8 @@ def page(cursor=None, limit=None, after=None, before=None, external_id=None, uui
         external_id=external_id,
         uuids=uuids,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -188,7 +202,7 @@ def response_due(version, created, due, key_id, status, reconciliation_id, nomin
         "discounts": discounts,
         "description": description,
     }
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
 
 
 def response_instant(version, created, key_id, status, reconciliation_id, amount, expiration=None, sender_name=None, sender_tax_id=None,
@@ -233,7 +247,7 @@ def response_instant(version, created, key_id, status, reconciliation_id, amount
         "amountType": amount_type,
         "description": description,
     }
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
 
 
 def verify(uuid, signature, user=None):
@@ -0,0 +1,158 @@
+from threading import Lock
+from collections import deque
+from ..utils.lazy import LazyEntity
+from .__event import _resource_by_subscription
+
+
+class Dispatcher:
+    """# Dispatcher object
+    The Dispatcher runs the handler registered for each Event subscription on a pool of worker threads.
+    Events of the same entity, such as all the Events of a single PixRequest, are handled one at a time in the order
+    they were dispatched, while Events of different entities are handled in parallel.
+    Handlers registered for a subscription family, such as "pix-request", receive both "pix-request.in" and
+    "pix-request.out" Events, unless a handler is registered for the exact subscription.
+    Each dispatch returns a concurrent.futures.Future resolved with the handler return value or exception.
+    Events without a handler are resolved with None.
+    When an idempotency store is given, Events whose ids were already handled successfully are skipped and resolved
+    with None, and an Event dispatched again while it is being handled receives the Future of the first dispatch.
+    ## Parameters (optional):
+    - workers [integer, default 4]: maximum number of Events handled at the same time. ex: 8
+    - store [MemoryStore, SqliteStore or similar object, default None]: idempotency store of handled Event ids. ex: starkinfra.idempotency.SqliteStore("events.sqlite3")
+    ## Attributes:
+    - handlers [dictionary]: handler function registered for each subscription
+    - store [object]: idempotency store of handled Event ids
+    - skipped [integer]: number of Events skipped because they were already handled
+    """
+
+    def __init__(self, workers=4, store=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.handlers = {}
+        self.store = store
+        self.skipped = 0
+
+        self._inflight = {}
+        self._closed = False
+        self._lock = Lock()
+        self._queues = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def on(self, subscription, handler=None):
+        """# Register the handler of a subscription
+        Can also be used as a decorator: @dispatcher.on("issuing-purchase")
+        ## Parameters (required):
+        - subscription [string]: subscription or subscription family to be handled. ex: "pix-request.in", "pix-request" or "credit-note"
+        ## Parameters (optional):
+        - handler [function, default None]: function receiving the Event object. Replaces any handler already registered for the subscription.
+        ## Return:
+        - registered handler, or a decorator if no handler was given
+        """
+        if subscription not in _subscriptions:
+            raise ValueError("unknown subscription {subscription}. Options: {options}".format(
+                subscription=subscription,
+                options=", ".join(sorted(_subscriptions)),
+            ))
+        if handler is None:
+            return lambda function: self.on(subscription, function)
+        self.handlers[subscription] = handler
+        return handler
+
+    def dispatch(self, event):
+        """# Dispatch an Event to its handler
+        ## Parameters (required):
+        - event [Event object]: Event to be handled, as returned by starkinfra.event.parse. ex: Event(...)
+        ## Return:
+        - concurrent.futures.Future resolved with the handler return value
+        """
+        from concurrent.futures import Future
+
+        future = Future()
+        handler = self.handlers.get(event.subscription) or self.handlers.get(event.subscription.split(".")[0])
+        if handler is None:
+            future.set_result(None)
+            return future
+
+        if self.store is not None:
+            with self._lock:
+                inflight = self._inflight.get(event.id)
+                if inflight is not None:
+                    return inflight
+            if self.store.seen(event.id):
+                with self._lock:
+                    self.skipped += 1
+                future.set_result(None)
+                return future
+
+        key = _entity_key(event)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot dispatch to a closed Dispatcher")
+            if self.store is not None:
+                inflight = self._inflight.get(event.id)
+                if inflight is not None:
+                    return inflight
+                self._inflight[event.id] = future
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append((event, handler, future))
+                return future
+            self._queues[key] = deque()
+        self._executor.submit(self._run, key, event, handler, future)
+        return future
+
+    def close(self):
+        """# Close the Dispatcher
+        Blocks until every dispatched Event is handled and flushes the idempotency store.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        if self.store is not None:
+            self.store.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def _run(self, key, event, handler, future):
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = handler(event)
+                    if self.store is not None:
+                        self.store.mark(event.id)
+                except Exception as exception:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                self._inflight.pop(event.id, None)
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                event, handler, future = queue.popleft()
+
+
+_subscriptions = set(_resource_by_subscription) | set(name.split(".")[0] for name in _resource_by_subscription)
+_entity_attributes = {}
+
+
+def _entity_key(event):
+    log = event.log
+    resource = _resource_by_subscription.get(event.subscription)
+    if resource is None or isinstance(log, dict):
+        return "event", event.id
+
+    cls = type(log)
+    if cls not in _entity_attributes:
+        _entity_attributes[cls] = next((
+            name for base in cls.__mro__ for name, value in vars(base).items() if isinstance(value, LazyEntity)
+        ), None)
+    attribute = _entity_attributes[cls]
+    entity = getattr(log, attribute, None) if attribute else None
+    if entity is None:
+        return "event", event.id
+    return resource["name"], entity.id
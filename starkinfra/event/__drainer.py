@@ -0,0 +1,130 @@
+from time import time, sleep
+from threading import Lock, BoundedSemaphore
+from starkcore.utils.subresource import SubResource
+from .__event import query, update
+
+
+class Drain(SubResource):
+    """# Event Drain object
+    Summary of a starkinfra.event.drain call.
+    ## Attributes (return-only):
+    - handled [integer]: number of Events successfully processed by the handler. ex: 500000
+    - skipped [integer]: number of Events found in the idempotency store, which were acknowledged without calling the handler. ex: 1200
+    - acknowledged [integer]: number of Events set as delivered in the API. ex: 501200
+    - failed [dictionary]: exception raised by the handler or by the acknowledgement of each failed Event id. Failed Events stay undelivered and are returned by the next drain. ex: {"5656565656565656": InternalServerError(...)}
+    """
+
+    def __init__(self, handled=0, skipped=0, acknowledged=0, failed=None):
+        self.handled = handled
+        self.skipped = skipped
+        self.acknowledged = acknowledged
+        self.failed = failed or {}
+
+
+def drain(handler, workers=8, acknowledgers=8, rate=None, store=None, limit=None, after=None, before=None,
+          prefetch=2, user=None):
+    """# Process and acknowledge undelivered Events
+    Streams the Events not yet delivered, calls the handler on each of them on a pool of worker threads and sets
+    every successfully handled Event as delivered with concurrent update requests, so a large backlog, such as the
+    Events left undelivered by an outage, is recovered without one sequential request per Event.
+    Events are handled in parallel and not necessarily in the order they were created.
+    Event ids are marked in the idempotency store as soon as they are handled, so if the drain is interrupted,
+    the next one acknowledges the Events already handled without calling the handler again.
+    Up to 4 Events per worker and acknowledger are kept in memory at any time.
+    ## Parameters (required):
+    - handler [function]: function receiving each Event object. Events whose handler raises an exception are not acknowledged. ex: lambda event: print(event.log)
+    ## Parameters (optional):
+    - workers [integer, default 8]: maximum number of Events handled at the same time. ex: 16
+    - acknowledgers [integer, default 8]: maximum number of concurrent update requests. ex: 16
+    - rate [float, default None]: maximum number of update requests per second. Unlimited if None. ex: 500
+    - store [MemoryStore, SqliteStore or similar object, default None]: idempotency store used to checkpoint handled Event ids. ex: starkinfra.idempotency.SqliteStore("events.sqlite3")
+    - limit [integer, default None]: maximum number of Events to be drained. Unlimited if None. ex: 10000
+    - after [datetime.date or string, default None]: only drain Events created after this date. ex: datetime.date(2020, 3, 10)
+    - before [datetime.date or string, default None]: only drain Events created before this date. ex: datetime.date(2020, 3, 10)
+    - prefetch [integer, default 2]: number of pages to fetch in the background while the current one is handled. ex: 4
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - Drain object with the number of handled, skipped and acknowledged Events and the errors of failed ones
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    result = Drain()
+    lock = Lock()
+    limiter = _Limiter(rate)
+    slots = BoundedSemaphore(4 * (workers + acknowledgers))
+    handlers = ThreadPoolExecutor(max_workers=workers)
+    senders = ThreadPoolExecutor(max_workers=acknowledgers)
+
+    def count(name):
+        with lock:
+            setattr(result, name, getattr(result, name) + 1)
+
+    def fail(id, error):
+        with lock:
+            result.failed[id] = error
+
+    def acknowledge(id):
+        try:
+            limiter.wait()
+            update(id, is_delivered=True, user=user)
+            count("acknowledged")
+        except Exception as error:
+            fail(id, error)
+        finally:
+            slots.release()
+
+    def handle(event):
+        submitted = False
+        try:
+            handler(event)
+            if store is not None:
+                store.mark(event.id)
+            count("handled")
+            senders.submit(acknowledge, event.id)
+            submitted = True
+        except Exception as error:
+            fail(event.id, error)
+        finally:
+            if not submitted:
+                slots.release()
+
+    try:
+        events = query(
+            limit=limit,
+            after=after,
+            before=before,
+            is_delivered=False,
+            prefetch=prefetch,
+            user=user,
+        )
+        for event in events:
+            slots.acquire()
+            if store is not None and store.seen(event.id):
+                count("skipped")
+                senders.submit(acknowledge, event.id)
+                continue
+            handlers.submit(handle, event)
+    finally:
+        handlers.shutdown(wait=True)
+        senders.shutdown(wait=True)
+        if store is not None:
+            store.flush()
+    return result
+
+
+class _Limiter:
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self.next = 0
+        self.lock = Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time()
+            start = max(now, self.next)
+            self.next = start + self.interval
+        if start > now:
+            sleep(start - now)
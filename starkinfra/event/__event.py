@@ -1,8 +1,8 @@
 from ..utils import rest
-from ..utils.parse import parse_and_verify
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ..utils.parse import parse_and_verify, parse_many_and_verify
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime, LazyEntity
 from ..creditnote.log.__log import _resource as _creditnote_log_resource
 from ..pixkey.log.__log import _resource as _pixkey_log_resource
 from ..pixclaim.log.__log import _resource as _pixclaim_log_resource
@@ -45,16 +45,17 @@ class Event(Resource):
     - workspace_id [string]: ID of the Workspace that generated this Event. Mostly used when multiple Workspaces have Webhooks registered to the same endpoint. ex: "4545454545454545"
     """
 
+    log = LazyEntity(lambda event: _resource_by_subscription.get(event.subscription), requires=["subscription"])
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, log, created, is_delivered, subscription, workspace_id, id):
         Resource.__init__(self, id=id)
 
+        self.subscription = subscription
         self.log = log
-        self.created = check_datetime(created)
+        self.created = created
         self.is_delivered = is_delivered
-        self.subscription = subscription
         self.workspace_id = workspace_id
-        if subscription in _resource_by_subscription:
-            self.log = from_api_json(resource=_resource_by_subscription[subscription], json=log)
 
 
 _resource = {"class": Event, "name": "Event"}
@@ -73,7 +74,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, is_delivered=None, user=None):
+def query(limit=None, after=None, before=None, is_delivered=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve notification Events
     Receive a generator of notification Event objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -81,6 +82,9 @@ def query(limit=None, after=None, before=None, is_delivered=None, user=None):
     - after [datetime.date or string, default None]: date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - is_delivered [bool, default None]: bool to filter successfully delivered events. ex: True or False
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["subscription", "log", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Event objects with updated attributes
@@ -91,11 +95,14 @@ def query(limit=None, after=None, before=None, is_delivered=None, user=None):
         after=check_date(after),
         before=check_date(before),
         is_delivered=is_delivered,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, raw=False, fields=None, user=None):
     """# Retrieve paged Events
     Receive a list of up to 100 Event objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -105,6 +112,8 @@ def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, us
     - after [datetime.date or string, default None]: date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - is_delivered [bool, default None]: bool to filter successfully delivered events. ex: True or False
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["subscription", "log", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of Event objects with updated attributes
@@ -117,6 +126,8 @@ def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, us
         after=check_date(after),
         before=check_date(before),
         is_delivered=is_delivered,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -173,3 +184,27 @@ def parse(content, signature, user=None):
         resource=_resource,
         key="event",
     )
+
+
+def parse_many(items, workers=None, user=None):
+    """# Create multiple verified Event objects from stored content strings
+    Use this method to reprocess backlogs of stored deliveries. Signatures are verified in a pool of processes,
+    so the work scales with the number of CPU cores, and the parsed objects are returned in the same order as the items.
+    If any digital signature does not check out with the StarkInfra public key, a
+    starkinfra.error.InvalidSignatureError will be raised.
+    Scripts using it must start from an if __name__ == "__main__" block, as required by Python process pools.
+    ## Parameters (required):
+    - items [list of tuples]: list of (content, signature) pairs, each with the response content received at user endpoint (not parsed) and the base-64 digital signature received at response header "Digital-Signature"
+    ## Parameters (optional):
+    - workers [integer, default None]: number of processes used to verify signatures. Use 1 to verify in the current process. Defaults to the number of CPU cores. ex: 4
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of parsed Event objects
+    """
+    return parse_many_and_verify(
+        items=items,
+        workers=workers,
+        user=user,
+        resource=_resource,
+        key="event",
+    )
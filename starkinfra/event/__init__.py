@@ -1,3 +1,5 @@
-from .__event import query, page, get, parse, delete, update
+from .__event import query, page, get, parse, parse_many, delete, update
+from .__dispatcher import Dispatcher
+from .__drainer import drain, Drain
 from .attempt.__attempt import Attempt
 from . import attempt
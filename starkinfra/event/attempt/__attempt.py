@@ -1,6 +1,7 @@
 from ...utils import rest
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime
 
 
 class Attempt(Resource):
@@ -16,6 +17,8 @@ class Attempt(Resource):
     - created [datetime.datetime]: datetime representing the moment when the attempt was made. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, code, message, event_id, webhook_id, created):
         Resource.__init__(self, id=id)
 
@@ -23,7 +26,7 @@ class Attempt(Resource):
         self.message = message
         self.webhook_id = webhook_id
         self.event_id = event_id
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Attempt, "name": "EventAttempt"}
@@ -42,7 +45,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None, user=None):
+def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve event.Attempts
     Receive a generator of event.Attempt objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +54,9 @@ def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - event_ids [list of strings, default None]: list of Event ids to filter attempts. ex: ["5656565656565656", "4545454545454545"]
     - webhook_ids [list of strings, default None]: list of Webhook ids to filter attempts. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["code", "message", "event_id"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of event.Attempt objects with updated attributes
@@ -62,11 +68,14 @@ def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None,
         before=check_date(before),
         event_ids=event_ids,
         webhook_ids=webhook_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, event_ids=None, webhook_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, event_ids=None, webhook_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged event.Attempts
     Receive a list of up to 100 event.Attempt objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -77,6 +86,8 @@ def page(cursor=None, limit=None, after=None, before=None, event_ids=None, webho
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - event_ids [list of strings, default None]: list of Event ids to filter attempts. ex: ["5656565656565656", "4545454545454545"]
     - webhook_ids [list of strings, default None]: list of Webhook ids to filter attempts. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["code", "message", "event_id"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of event.Attempt objects with updated attributes
@@ -90,5 +101,7 @@ def page(cursor=None, limit=None, after=None, before=None, event_ids=None, webho
         before=check_date(before),
         event_ids=event_ids,
         webhook_ids=webhook_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,7 +1,8 @@
 from base64 import b64encode
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class IndividualDocument(Resource):
@@ -25,13 +26,15 @@ class IndividualDocument(Resource):
     - created [datetime.datetime]: creation datetime for the IndividualDocument. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, type, content, identity_id, content_type=None, tags=None, id=None, status=None, created=None):
         Resource.__init__(self, id=id)
         self.type = type
         self.identity_id = identity_id
         self.tags = tags
         self.status = status
-        self.created = check_datetime(created)
+        self.created = created
         self.content = content
         self.content_type = content_type
 
@@ -72,7 +75,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IndividualDocuments
     Receive a generator of IndividualDocument objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -82,6 +85,9 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. Options: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "status", "identity_id"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IndividualDocument objects with updated attributes
@@ -94,11 +100,14 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, raw=False, fields=None, user=None):
     """# Retrieve paged IndividualDocuments
     Receive a list of up to 100 IndividualDocument objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -110,6 +119,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
     - status [list of strings, default None]: filter for status of retrieved objects. Options: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "status", "identity_id"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IndividualDocument objects with updated attributes
@@ -124,6 +135,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
         status=status,
         tags=tags,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class IndividualIdentity(Resource):
@@ -24,6 +25,8 @@ class IndividualIdentity(Resource):
     - created [datetime.datetime]: creation datetime for the IndividualIdentity. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, name, tax_id, tags=None, id=None, status=None, created=None):
         Resource.__init__(self, id=id)
 
@@ -31,7 +34,7 @@ class IndividualIdentity(Resource):
         self.tax_id = tax_id
         self.tags = tags
         self.status = status
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": IndividualIdentity, "name": "IndividualIdentity"}
@@ -63,7 +66,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IndividualIdentities
     Receive a generator of IndividualIdentity objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -73,6 +76,9 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "tax_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IndividualIdentity objects with updated attributes
@@ -85,11 +91,14 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, raw=False, fields=None, user=None):
     """# Retrieve paged IndividualIdentities
     Receive a list of up to 100 IndividualIdentity objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -101,6 +110,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "tax_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IndividualIdentity objects with updated attributes
@@ -115,6 +126,8 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
         status=status,
         tags=tags,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
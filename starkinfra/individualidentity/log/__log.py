@@ -1,7 +1,7 @@
 from ...utils import rest
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
-from starkcore.utils.api import from_api_json
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__individualidentity import _resource as _individualIdentity_resource
 
 
@@ -19,13 +19,16 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    individual = LazyEntity(_individualIdentity_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, created, type, errors, identity):
         Resource.__init__(self, id=id)
 
-        self.created = check_datetime(created)
+        self.created = created
         self.type = type
         self.errors = errors
-        self.individual = from_api_json(_individualIdentity_resource, identity)
+        self.individual = identity
 
 
 _resource = {"class": Log, "name": "IndividualIdentityLog"}
@@ -44,7 +47,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, identity_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, identity_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve individualidentity.Logs
     Receive a generator of individualidentity.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -53,6 +56,9 @@ def query(limit=None, after=None, before=None, types=None, identity_ids=None, us
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "canceled", "processing", "failed", "success"]
     - identity_ids [list of strings, default None]: list of IndividualIdentity ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "individual", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of individualidentity.Log objects with updated attributes
@@ -64,11 +70,14 @@ def query(limit=None, after=None, before=None, types=None, identity_ids=None, us
         before=check_date(before),
         types=types,
         identity_ids=identity_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, types=None, identity_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, types=None, identity_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged individualidentity.Logs
     Receive a list of up to 100 individualidentity.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -79,6 +88,8 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, identity_
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "canceled", "processing", "failed", "success"]
     - identity_ids [list of strings, default None]: list of IndividualIdentity ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "individual", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of individualidentity.Log objects with updated attributes
@@ -92,5 +103,7 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, identity_
         before=check_date(before),
         types=types,
         identity_ids=identity_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 from ..issuingrule import parse_rules
 
@@ -35,6 +36,10 @@ class IssuingCard(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingCard. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    expiration = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, holder_name, holder_tax_id, holder_external_id, display_name=None, rules=None, product_id=None,
                  tags=None, street_line_1=None, street_line_2=None, district=None, city=None, state_code=None,
                  zip_code=None, id=None, holder_id=None, type=None, status=None, number=None, security_code=None,
@@ -59,9 +64,9 @@ class IssuingCard(Resource):
         self.status = status
         self.number = number
         self.security_code = security_code
-        self.expiration = check_datetime(expiration)
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.expiration = expiration
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingCard, "name": "IssuingCard"}
@@ -82,7 +87,7 @@ def create(cards, expand=None, user=None):
 
 
 def query(limit=None, ids=None, after=None, before=None, status=None, types=None, holder_ids=None, tags=None,
-          expand=None, user=None):
+          expand=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingCards
     Receive a generator of IssuingCard objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -95,6 +100,9 @@ def query(limit=None, ids=None, after=None, before=None, status=None, types=None
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - expand [list of strings, default None]: fields to expand information. ex: ["rules", "security_code", "number", "expiration"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["holder_name", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingCard objects with updated attributes
@@ -110,12 +118,15 @@ def query(limit=None, ids=None, after=None, before=None, status=None, types=None
         holder_ids=holder_ids,
         tags=tags,
         expand=expand,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None, types=None, holder_ids=None,
-         tags=None, expand=None, user=None):
+         tags=None, expand=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingCards
     Receive a list of IssuingCard objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -129,6 +140,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [list of strings, default None]: fields to expand information. ex: ["rules", "security_code", "number", "expiration"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["holder_name", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingCard objects with updated attributes
@@ -146,6 +159,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
         holder_ids=holder_ids,
         tags=tags,
         expand=expand,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,6 +1,6 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ...utils import rest
 from ..__issuingcard import _resource as _issuing_card_resource
 
@@ -18,12 +18,15 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    card = LazyEntity(_issuing_card_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, card, type, created):
         Resource.__init__(self, id=id)
 
-        self.card = from_api_json(_issuing_card_resource, card)
+        self.card = card
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingCardLog"}
@@ -42,7 +45,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=None, user=None):
+def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuingcard.Log
     Receive a generator of issuingcard.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -52,6 +55,9 @@ def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=No
     - types [list of strings, default None]: filter for log event types. ex: ["blocked", "canceled", "created", "expired", "unblocked", "updated"]
     - card_ids [list of strings, default None]: list of IssuingCard ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "card", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingcard.Log objects with updated attributes
@@ -64,11 +70,14 @@ def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=No
         before=check_date(before),
         types=types,
         card_ids=card_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, card_ids=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, card_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuingcard.Log
     Receive a list of up to 100 issuingcard.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -80,6 +89,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["blocked", "canceled", "created", "expired", "unblocked", "updated"]
     - card_ids [list of strings, default None]: list of IssuingCard ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "card", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of issuingcard.Log objects with updated attributes
@@ -94,5 +105,7 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         card_ids=card_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,6 +1,7 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ..utils.api import from_api_json
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -16,14 +17,17 @@ class IssuingDesign(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingDesign. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, id=None, name=None, embosser_ids=None, type=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.name = name
         self.embosser_ids = embosser_ids
         self.type = type
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingDesign, "name": "IssuingDesign"}
@@ -41,12 +45,15 @@ def parse_designs(designs):
     return parsed_designs
 
 
-def query(limit=None, ids=None, user=None):
+def query(limit=None, ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingDesigns
     Receive a generator of IssuingDesign objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "type", "embosser_ids"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingDesign objects with updated attributes
@@ -55,11 +62,14 @@ def query(limit=None, ids=None, user=None):
         resource=_resource,
         limit=limit,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingDesigns
     Receive a list of up to 100 IssuingDesign objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -67,6 +77,8 @@ def page(cursor=None, limit=None, ids=None, user=None):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. Max = 100. ex: 35
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "type", "embosser_ids"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingDesign objects with updated attributes
@@ -77,6 +89,8 @@ def page(cursor=None, limit=None, ids=None, user=None):
         cursor=cursor,
         limit=limit,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
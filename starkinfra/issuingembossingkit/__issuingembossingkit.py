@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime
+from ..utils.lazy import LazyDatetime
 from ..issuingdesign.__issuingdesign import parse_designs
 from ..utils import rest
 
@@ -15,19 +16,22 @@ class IssuingEmbossingKit(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingEmbossingKit. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, id=None, name=None, designs=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.name = name
         self.designs = parse_designs(designs)
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingEmbossingKit, "name": "IssuingEmbossingKit"}
 
 
-def query(limit=None, after=None, before=None, status=None, design_ids=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, status=None, design_ids=None, ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingEmbossingKits
     Receive a generator of IssuingEmbossingKit objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -37,6 +41,9 @@ def query(limit=None, after=None, before=None, status=None, design_ids=None, ids
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "processing", "success", "failed"]
     - design_ids [list of string, default None]: list of design_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "designs"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingEmbossingKit objects with updated attributes
@@ -49,11 +56,14 @@ def query(limit=None, after=None, before=None, status=None, design_ids=None, ids
         status=status,
         design_ids=design_ids,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, design_ids=None, ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, design_ids=None, ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingEmbossingKits
     Receive a list of up to 100 IssuingEmbossingKit objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -65,6 +75,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, design_i
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "processing", "success", "failed"]
     - design_ids [list of string, default None]: list of design_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "designs"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingEmbossingKit objects with updated attributes
@@ -79,6 +91,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, design_i
         status=status,
         design_ids=design_ids,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user
     )
 
@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -33,6 +34,9 @@ class IssuingEmbossingRequest(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingEmbossingRequest. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, card_id, kit_id, display_name_1, shipping_city,
                  shipping_country_code, shipping_district, shipping_state_code, shipping_street_line_1, 
                  shipping_street_line_2, shipping_service, shipping_tracking_number, shipping_zip_code, 
@@ -59,8 +63,8 @@ class IssuingEmbossingRequest(Resource):
         self.tags = tags
         self.fee = fee
         self.status = status
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingEmbossingRequest, "name": "IssuingEmbossingRequest"}
@@ -79,7 +83,7 @@ def create(requests, user=None):
     return rest.post_multi(resource=_resource, entities=requests, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, card_ids=None, ids=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, card_ids=None, ids=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingEmbossingRequests
     Receive a generator of IssuingEmbossingRequest objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -90,6 +94,9 @@ def query(limit=None, after=None, before=None, status=None, card_ids=None, ids=N
     - card_ids [list of string, default None]: list of card_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["card_id", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingEmbossingRequest objects with updated attributes
@@ -103,11 +110,14 @@ def query(limit=None, after=None, before=None, status=None, card_ids=None, ids=N
         card_ids=card_ids,
         ids=ids,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids=None, ids=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids=None, ids=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingEmbossingRequests
     Receive a list of up to 100 IssuingEmbossingRequest objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -120,6 +130,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids
     - card_ids [list of string, default None]: list of card_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["card_id", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingEmbossingRequest objects with updated attributes
@@ -135,6 +147,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids
         card_ids=card_ids,
         ids=ids,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,6 +1,6 @@
-from starkcore.utils.api import from_api_json
 from starkcore.utils.checks import check_datetime, check_date
-from starkcore.utils.resource import Resource
+from ...utils.lazy import LazyDatetime, LazyEntity
+from ...utils.resource import Resource
 from ...utils import rest
 from ..__issuingembossingrequest import _resource as _issuing_embossing_request_resource
 from starkcore.error import Error
@@ -20,19 +20,22 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    request = LazyEntity(_issuing_embossing_request_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, request, errors, type, created):
         Resource.__init__(self, id=id)
 
-        self.request = from_api_json(_issuing_embossing_request_resource, request)
+        self.request = request
         self.errors = _parse_errors(errors)
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingEmbossingRequestLog"}
 
 
-def query(limit=None, ids=None, after=None, before=None, types=None, request_ids=None, user=None):
+def query(limit=None, ids=None, after=None, before=None, types=None, request_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuingembossingrequest.Log
     Receive a generator of issuingembossingrequest.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -42,6 +45,9 @@ def query(limit=None, ids=None, after=None, before=None, types=None, request_ids
     - types [list of strings, default None]: filter for log event types. ex: ["created", "sending", "sent", "processing", "success", "failed"]
     - request_ids [list of strings, default None]: list of IssuingEmbossingRequest ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "request", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingembossingrequest.Log objects with updated attributes
@@ -54,11 +60,14 @@ def query(limit=None, ids=None, after=None, before=None, types=None, request_ids
         before=check_date(before),
         types=types,
         request_ids=request_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, request_ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, request_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuingembossingrequest.Log
     Receive a list of up to 100 issuingembossingrequest.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -70,6 +79,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "sending", "sent", "processing", "success", "failed"]
     - request_ids [list of strings, default None]: list of IssuingEmbossingRequest ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "request", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of issuingembossingrequest.Log objects with updated attributes
@@ -84,6 +95,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         request_ids=request_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
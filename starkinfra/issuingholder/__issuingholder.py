@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 from ..issuingrule import parse_rules
 
@@ -21,6 +22,9 @@ class IssuingHolder(Resource):
     - updated [datetime.datetime]: latest update datetime for the IssuingHolder. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, name, tax_id, external_id, rules=None, tags=None, id=None, status=None, updated=None, created=None):
         Resource.__init__(self, id=id)
 
@@ -30,8 +34,8 @@ class IssuingHolder(Resource):
         self.rules = parse_rules(rules)
         self.tags = tags
         self.status = status
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingHolder, "name": "IssuingHolder"}
@@ -65,7 +69,7 @@ def get(id, expand=None, user=None):
     return rest.get_id(resource=_resource, id=id, expand=expand, user=user)
 
 
-def query(limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, user=None):
+def query(limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingHolders
     Receive a generator of IssuingHolder objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -76,6 +80,9 @@ def query(limit=None, ids=None, after=None, before=None, status=None, tags=None,
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [string, default None]: fields to expand information. Options: ["rules"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "tax_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingHolder objects with updated attributes
@@ -89,11 +96,14 @@ def query(limit=None, ids=None, after=None, before=None, status=None, tags=None,
         status=status,
         tags=tags,
         expand=expand,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, user=None):
+def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingHolders
     Receive a list of IssuingHolder objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -105,6 +115,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [string, default None]: fields to expand information. Options: ["rules"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "tax_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingHolder objects with updated attributes
@@ -120,6 +132,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
         status=status,
         tags=tags,
         expand=expand,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
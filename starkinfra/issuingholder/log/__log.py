@@ -1,6 +1,6 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ...utils import rest
 from ..__issuingholder import _resource as _issuing_holder_resource
 
@@ -18,12 +18,15 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    holder = LazyEntity(_issuing_holder_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, holder, type, created):
         Resource.__init__(self, id=id)
 
-        self.holder = from_api_json(_issuing_holder_resource, holder)
+        self.holder = holder
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingHolderLog"}
@@ -42,7 +45,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, holder_ids=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, types=None, holder_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuingholder.Log
     Receive a generator of issuingholder.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -52,6 +55,9 @@ def query(ids=None, limit=None, after=None, before=None, types=None, holder_ids=
     - types [list of strings, default None]: filter for log event types. ex: ["created", "blocked"]
     - holder_ids [list of strings, default None]: list of IssuingHolder ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "holder", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingholder.Log objects with updated attributes
@@ -64,11 +70,14 @@ def query(ids=None, limit=None, after=None, before=None, types=None, holder_ids=
         before=check_date(before),
         types=types,
         holder_ids=holder_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, holder_ids=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, holder_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuingholder.Log
     Receive a list of up to 100 issuingholder.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -80,6 +89,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - types [list of strings, default None]: filter for log event types. ex: ["created", "blocked"]
     - holder_ids [list of strings, default None]: list of IssuingHolder ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "holder", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of issuingholder.Log objects with updated attributes
@@ -94,5 +105,7 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         holder_ids=holder_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
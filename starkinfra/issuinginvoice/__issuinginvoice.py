@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date, check_datetime_or_date
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -23,6 +24,10 @@ class IssuingInvoice(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingInvoice. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    due = LazyDatetime(check_datetime_or_date)
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, amount, tax_id=None, name=None, tags=None, id=None, brcode=None, due=None, link=None, status=None, 
                 issuing_transaction_id=None, updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -32,12 +37,12 @@ class IssuingInvoice(Resource):
         self.name = name
         self.tags = tags
         self.brcode = brcode
-        self.due = check_datetime_or_date(due)
+        self.due = due
         self.link = link
         self.status = status
         self.issuing_transaction_id = issuing_transaction_id
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingInvoice, "name": "IssuingInvoice"}
@@ -69,7 +74,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingInvoices
     Receive a generator of IssuingInvoice objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -78,6 +83,9 @@ def query(limit=None, after=None, before=None, status=None, tags=None, user=None
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "expired", "overdue", "paid"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "status", "due"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingInvoice objects with updated attributes
@@ -89,11 +97,14 @@ def query(limit=None, after=None, before=None, status=None, tags=None, user=None
         before=check_date(before),
         tags=tags,
         limit=limit,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingInvoices
     Receive a list of IssuingInvoice objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -103,6 +114,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "expired", "overdue", "paid"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "status", "due"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingInvoice objects with updated attributes
@@ -116,6 +129,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         before=check_date(before),
         tags=tags,
         limit=limit,
+        raw=raw,
+        fields=fields,
         user=user,
     )
     
\ No newline at end of file
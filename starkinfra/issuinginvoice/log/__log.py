@@ -1,6 +1,6 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ...utils import rest
 from ..__issuinginvoice import _resource as _issuing_invoice_resource
 
@@ -18,12 +18,15 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    invoice = LazyEntity(_issuing_invoice_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, invoice, type, created):
         Resource.__init__(self, id=id)
 
-        self.invoice = from_api_json(_issuing_invoice_resource, invoice)
+        self.invoice = invoice
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingInvoiceLog"}
@@ -42,7 +45,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, types=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuinginvoice.Log
     Receive a generator of issuinginvoice.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +54,9 @@ def query(ids=None, limit=None, after=None, before=None, types=None, user=None):
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "credited", "expired", "overdue", "paid"]
     - ids [list of strings, default None]: list of IssuingInvoice ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "invoice", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of issuinginvoice.Log objects with updated attributes
@@ -62,11 +68,14 @@ def query(ids=None, limit=None, after=None, before=None, types=None, user=None):
         after=check_date(after),
         before=check_date(before),
         types=types,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuinginvoice.Log
     Receive a list of up to 100 issuinginvoice.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -77,6 +86,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "credited", "expired", "overdue", "paid"]
     - ids [list of strings, default None]: list of IssuingInvoice ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "invoice", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of issuinginvoice.Log objects with updated attributes
@@ -90,5 +101,7 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         after=check_date(after),
         before=check_date(before),
         types=types,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -28,11 +28,14 @@ class IssuingProduct(Resource):
 _resource = {"class": IssuingProduct, "name": "IssuingProduct"}
 
 
-def query(limit=None, user=None):
+def query(limit=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingProducts
     Receive a generator of IssuingProduct objects previously registered in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["network", "funding_type", "holder_type"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingProduct objects with updated attributes
@@ -40,16 +43,21 @@ def query(limit=None, user=None):
     return rest.get_stream(
         resource=_resource,
         limit=limit,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(limit=None, cursor=None, user=None):
+def page(limit=None, cursor=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingProducts
     Receive a list of up to 100 IssuingProduct objects previously registered in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. Max = 100. ex: 35
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["network", "funding_type", "holder_type"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingProduct objects with updated attributes
@@ -59,5 +67,7 @@ def page(limit=None, cursor=None, user=None):
         resource=_resource,
         limit=limit,
         cursor=cursor,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__issuingpurchase import query, get, update, parse, response
+from .__issuingpurchase import query, get, update, parse, parse_many, response, authorizer
@@ -1,9 +1,9 @@
-from json import dumps
-from ..utils import rest
-from ..utils.parse import parse_and_verify
-from starkcore.utils.api import api_json
-from starkcore.utils.resource import Resource
+from ..utils import rest, codec
+from ..utils.api import api_json
+from ..utils.parse import parse_and_verify, parse_many_and_verify
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class IssuingPurchase(Resource):
@@ -51,6 +51,9 @@ class IssuingPurchase(Resource):
     - holder_tags [list of strings]: tags of the IssuingHolder responsible for this purchase. ex: ["technology", "john snow"]
     """
 
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, holder_name=None, product_id=None, card_id=None, card_ending=None, purpose=None,
                 amount=None, tax=None, issuer_amount=None, issuer_currency_code=None, issuer_currency_symbol=None,
                 merchant_amount=None, merchant_currency_code=None, merchant_currency_symbol=None,
@@ -90,8 +93,8 @@ class IssuingPurchase(Resource):
         self.description = description
         self.metadata = metadata
         self.zip_code = zip_code
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
         self.is_partial_allowed = is_partial_allowed
         self.card_tags = card_tags
         self.holder_id = holder_id
@@ -115,7 +118,7 @@ def get(id, user=None):
 
 
 def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, holder_ids=None, card_ids=None,
-          status=None, user=None):
+          status=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingPurchase
     Receive a generator of IssuingPurchase objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -127,6 +130,9 @@ def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, ho
     - card_ids [list of strings, default None]: card  IDs. ex: ["5656565656565656", "4545454545454545"]
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["approved", "canceled", "denied", "confirmed", "voided"]
     - ids [list of strings, default None, default None]: purchase IDs
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "merchant_name", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingPurchase objects with updated attributes
@@ -141,12 +147,15 @@ def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, ho
         holder_ids=holder_ids,
         card_ids=card_ids,
         status=status,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(end_to_end_ids=None, holder_ids=None, card_ids=None, status=None, after=None, before=None, ids=None,
-        cursor=None, limit=None, user=None):
+        cursor=None, limit=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingPurchases
     Receive a list of IssuingPurchase objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -159,6 +168,8 @@ def page(end_to_end_ids=None, holder_ids=None, card_ids=None, status=None, after
     - card_ids [list of strings, default None]: card  IDs. ex: ["5656565656565656", "4545454545454545"]
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["approved", "canceled", "denied", "confirmed", "voided"]
     - ids [list of strings, default None]: purchase IDs
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "merchant_name", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingPurchase objects with updated attributes
@@ -175,6 +186,8 @@ def page(end_to_end_ids=None, holder_ids=None, card_ids=None, status=None, after
         holder_ids=holder_ids,
         card_ids=card_ids,
         status=status,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -220,6 +233,30 @@ def parse(content, signature, user=None):
     )
 
 
+def parse_many(items, workers=None, user=None):
+    """# Create multiple verified IssuingPurchase objects from stored content strings
+    Use this method to reprocess backlogs of stored deliveries. Signatures are verified in a pool of processes,
+    so the work scales with the number of CPU cores, and the parsed objects are returned in the same order as the items.
+    If any digital signature does not check out with the StarkInfra public key, a
+    starkinfra.error.InvalidSignatureError will be raised.
+    Scripts using it must start from an if __name__ == "__main__" block, as required by Python process pools.
+    ## Parameters (required):
+    - items [list of tuples]: list of (content, signature) pairs, each with the response content received at user endpoint (not parsed) and the base-64 digital signature received at response header "Digital-Signature"
+    ## Parameters (optional):
+    - workers [integer, default None]: number of processes used to verify signatures. Use 1 to verify in the current process. Defaults to the number of CPU cores. ex: 4
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of parsed IssuingPurchase objects
+    """
+    return parse_many_and_verify(
+        items=items,
+        workers=workers,
+        user=user,
+        resource=_resource,
+        key="",
+    )
+
+
 def response(status, amount=None, reason=None, tags=None):
     """# Helps you respond IssuingPurchase requests
     ## Parameters (required):
@@ -238,4 +275,24 @@ def response(status, amount=None, reason=None, tags=None):
         "reason": reason,
         "tags": tags,
     }}
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
+
+
+def authorizer(decide, deadline=1.5, fallback=None, user=None):
+    """# Create an IssuingPurchase authorization ASGI application
+    Builds an ASGI application that verifies, parses and answers the IssuingPurchase authorization requests
+    posted to your endpoint. It can be served by any ASGI server, such as uvicorn or hypercorn. Requires Python 3.7+.
+    ## Parameters (required):
+    - decide [function or coroutine function]: callback receiving the parsed IssuingPurchase object and returning either the string built by starkinfra.issuingpurchase.response() or a dictionary with its parameters. ex: lambda purchase: {"status": "approved", "amount": purchase.amount}
+    ## Parameters (optional):
+    - deadline [float, default 1.5]: maximum number of seconds, counted from the request arrival, before the fallback answer is sent. ex: 1.2
+    - fallback [string, default None]: answer built by starkinfra.issuingpurchase.response() sent on timeouts and callback errors. Defaults to a denial with reason "confirmationDeadline"
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - Authorizer ASGI application
+    """
+    from ..aio.__authorizer import Authorizer
+
+    if fallback is None:
+        fallback = response(status="denied", reason="confirmationDeadline")
+    return Authorizer(decide=decide, deadline=deadline, fallback=fallback, user=user)
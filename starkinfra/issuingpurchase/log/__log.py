@@ -1,6 +1,6 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ...utils import rest
 from ..__issuingpurchase import _resource as _issuing_purchase_resource
 from starkcore.error import Error
@@ -21,14 +21,17 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    purchase = LazyEntity(_issuing_purchase_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, purchase, issuing_transaction_id, errors, type, created):
         Resource.__init__(self, id=id)
 
-        self.purchase = from_api_json(_issuing_purchase_resource, purchase)
+        self.purchase = purchase
         self.issuing_transaction_id = issuing_transaction_id
         self.errors = _parse_errors(errors)
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingPurchaseLog"}
@@ -47,7 +50,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, purchase_ids=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, types=None, purchase_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuingpurchase.Log
     Receive a generator of issuingpurchase.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -57,6 +60,9 @@ def query(ids=None, limit=None, after=None, before=None, types=None, purchase_id
     - types [list of strings, default None]: filter for log event types. ex: ["approved", "canceled", "confirmed", "denied", "reversed", "voided"]
     - purchase_ids [list of strings, default None]: list of Purchase ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of IssuingPurchase ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "purchase", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of issuingpurchase.Log objects with updated attributes
@@ -69,11 +75,14 @@ def query(ids=None, limit=None, after=None, before=None, types=None, purchase_id
         before=check_date(before),
         types=types,
         purchase_ids=purchase_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, purchase_ids=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, purchase_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuingpurchase.Log
     Receive a list of up to 100 issuingpurchase.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -85,6 +94,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - types [list of strings, default None]: filter for log event types. ex: ["approved", "canceled", "confirmed", "denied", "reversed", "voided"]
     - purchase_ids [list of strings, default None]: list of Purchase ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of IssuingPurchase ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "purchase", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of issuingpurchase.Log objects with updated attributes
@@ -99,6 +110,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         purchase_ids=purchase_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
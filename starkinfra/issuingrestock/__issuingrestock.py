@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -19,6 +20,9 @@ class IssuingRestock(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingRestock. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, count, stock_id, tags=None, id=None, status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
@@ -26,8 +30,8 @@ class IssuingRestock(Resource):
         self.stock_id = stock_id
         self.tags = tags
         self.status = status
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingRestock, "name": "IssuingRestock"}
@@ -47,7 +51,7 @@ def create(restocks, user=None):
 
 
 def query(limit=None, after=None, before=None, status=None, stock_ids=None, ids=None, 
-          tags=None, user=None):
+          tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingRestocks
     Receive a generator of IssuingRestock objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -58,6 +62,9 @@ def query(limit=None, after=None, before=None, status=None, stock_ids=None, ids=
     - stock_ids [list of string, default None]: list of stock_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["card", "corporate"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["count", "stock_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingRestock objects with updated attributes
@@ -71,12 +78,15 @@ def query(limit=None, after=None, before=None, status=None, stock_ids=None, ids=
         stock_ids=stock_ids,
         ids=ids,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, stock_ids=None, 
-         ids=None, tags=None, user=None):
+         ids=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingRestocks
     Receive a list of up to 100 IssuingRestock objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -89,6 +99,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, stock_id
     - stock_ids [list of string, default None]: list of stock_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["card", "corporate"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["count", "stock_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingRestock objects with updated attributes
@@ -104,6 +116,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, stock_id
         stock_ids=stock_ids,
         ids=ids,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
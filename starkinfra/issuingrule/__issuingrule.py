@@ -1,4 +1,4 @@
-from starkcore.utils.api import from_api_json
+from ..utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkinfra.cardmethod.__cardmethod import _resource as _method_resource, CardMethod
 from starkinfra.merchantcountry.__merchantcountry import _resource as _country_resource, MerchantCountry
@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -15,21 +16,24 @@ class IssuingStock(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingStock. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, balance=None, design_id=None, embosser_id=None, id=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.balance = balance
         self.design_id = design_id
         self.embosser_id = embosser_id
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingStock, "name": "IssuingStock"}
 
 
 def query(limit=None, after=None, before=None, design_ids=None, embosser_ids=None, ids=None,
-          expand=None, user=None):
+          expand=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingStocks
     Receive a generator of IssuingStock objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -40,6 +44,9 @@ def query(limit=None, after=None, before=None, design_ids=None, embosser_ids=Non
     - embosser_ids [list of strings, default None]: Embosser unique ids. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - expand [list of strings, default None]: fields to expand information. ex: ["balance"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["balance", "design_id", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingStock objects with updated attributes
@@ -53,12 +60,15 @@ def query(limit=None, after=None, before=None, design_ids=None, embosser_ids=Non
         embosser_ids=embosser_ids,
         ids=ids,
         expand=expand,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, design_ids=None, embosser_ids=None, 
-         ids=None, expand=None, user=None):
+         ids=None, expand=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingStocks
     Receive a list of up to 100 IssuingStock objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -71,6 +81,8 @@ def page(cursor=None, limit=None, after=None, before=None, design_ids=None, embo
     - embosser_ids [list of strings, default None]: Embosser unique ids. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - expand [list of strings, default None]: fields to expand information. ex: ["balance"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["balance", "design_id", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingStock objects with updated attributes
@@ -86,6 +98,8 @@ def page(cursor=None, limit=None, after=None, before=None, design_ids=None, embo
         embosser_ids=embosser_ids,
         ids=ids,
         expand=expand,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,6 +1,6 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ...utils import rest
 from ..__issuingstock import _resource as _issuing_stock_resource
 
@@ -19,19 +19,22 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    stock = LazyEntity(_issuing_stock_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, stock, type, count, created):
         Resource.__init__(self, id=id)
 
-        self.stock = from_api_json(_issuing_stock_resource, stock)
+        self.stock = stock
         self.type = type
         self.count = count
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingStockLog"}
 
 
-def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, user=None):
+def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuingstock.Log
     Receive a generator of issuingstock.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -41,6 +44,9 @@ def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=N
     - types [list of strings, default None]: filter for log event types. ex: ["created", "spent", "restocked", "lost"]
     - stock_ids [list of strings, default None]: list of IssuingStock ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "count", "stock"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingstock.Log objects with updated attributes
@@ -53,11 +59,14 @@ def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=N
         before=check_date(before),
         types=types,
         stock_ids=stock_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuingstock.Log
     Receive a list of up to 100 issuingstock.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -69,6 +78,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
     - types [list of strings, default None]: filter for log event types. ex: ["created", "spent", "restocked", "lost"]
     - stock_ids [list of strings, default None]: list of IssuingStock ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "count", "stock"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of issuingstock.Log objects with updated attributes
@@ -83,6 +94,8 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         stock_ids=stock_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
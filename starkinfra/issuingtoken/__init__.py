@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__issuingtoken import get, query, page, update, cancel, parse, response_authorization, response_activation
+from .__issuingtoken import get, query, page, update, cancel, parse, parse_many, response_authorization, response_activation
@@ -1,7 +1,7 @@
-from json import dumps
+from ..utils import codec
 from starkinfra.utils import rest
-from starkcore.utils.api import api_json
-from ..utils.parse import parse_and_verify
+from ..utils.api import api_json
+from ..utils.parse import parse_and_verify, parse_many_and_verify
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 
@@ -75,7 +75,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, user=None, external_ids=None):
+def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, prefetch=None, raw=False, fields=None, user=None, external_ids=None):
     """# Retrieve IssuingTokens
     Receive a generator of IssuingToken objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -86,6 +86,9 @@ def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=
     - card_ids [list of strings, default None]: list of card_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: list of strings for tagging. ex: ["travel", "food"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["card_id", "wallet_name", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     - external_ids [list of strings, default None]: external IDs. ex: ["DSHRMC00002626944b0e3b539d4d459281bdba90c2588791", "DSHRMC00002626941c531164a0b14c66ad9602ee716f1e85"]
     ## Return:
@@ -100,12 +103,15 @@ def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=
         card_ids=card_ids,
         tags=tags,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
         external_ids=external_ids,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, user=None, external_ids=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, raw=False, fields=None, user=None, external_ids=None):
     """# Retrieve paged IssuingTokens
     Receive a list of IssuingToken objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -118,6 +124,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids
     - card_ids [list of strings, default None]: list of card_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: list of strings for tagging. ex: ["travel", "food"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["card_id", "wallet_name", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
     ## Return:
@@ -134,6 +142,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids
         card_ids=card_ids,
         tags=tags,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
         external_ids=external_ids,
     )
@@ -193,6 +203,30 @@ def parse(content, signature, user=None):
     )
 
 
+def parse_many(items, workers=None, user=None):
+    """# Create multiple verified IssuingToken objects from stored content strings
+    Use this method to reprocess backlogs of stored deliveries. Signatures are verified in a pool of processes,
+    so the work scales with the number of CPU cores, and the parsed objects are returned in the same order as the items.
+    If any digital signature does not check out with the StarkInfra public key, a
+    starkinfra.error.InvalidSignatureError will be raised.
+    Scripts using it must start from an if __name__ == "__main__" block, as required by Python process pools.
+    ## Parameters (required):
+    - items [list of tuples]: list of (content, signature) pairs, each with the response content received at user endpoint (not parsed) and the base-64 digital signature received at response header "Digital-Signature"
+    ## Parameters (optional):
+    - workers [integer, default None]: number of processes used to verify signatures. Use 1 to verify in the current process. Defaults to the number of CPU cores. ex: 4
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of parsed IssuingToken objects
+    """
+    return parse_many_and_verify(
+        items=items,
+        workers=workers,
+        user=user,
+        resource=_resource,
+        key="",
+    )
+
+
 def response_authorization(status, reason=None, activation_methods=None, design_id=None, tags=None):
     """# Helps you respond IssuingToken authorization requests
     When a new tokenization is triggered by your user, a POST request will be made to your registered URL to get your decision to complete the tokenization.
@@ -215,7 +249,7 @@ def response_authorization(status, reason=None, activation_methods=None, design_
         "designId": design_id,
         "tags": tags,
     }}
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
 
 
 def response_activation(status, reason=None, tags=None):
@@ -235,4 +269,4 @@ def response_activation(status, reason=None, tags=None):
         "reason": reason or "",
         "tags": tags,
     }}
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
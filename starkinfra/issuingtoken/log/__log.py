@@ -1,5 +1,5 @@
-from starkcore.utils.api import from_api_json
-from starkcore.utils.resource import Resource
+from ...utils.lazy import LazyEntity
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ...utils import rest
 from ..__issuingtoken import _resource as _issuing_token_resource
@@ -18,10 +18,12 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    token = LazyEntity(_issuing_token_resource)
+
     def __init__(self, id, type, errors, token, created):
         Resource.__init__(self, id=id)
 
-        self.token = from_api_json(_issuing_token_resource, token)
+        self.token = token
         self.type = type
         self.created = created
         self.errors = errors
@@ -43,7 +45,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve issuingtoken.Log
     Receive a generator of issuingtoken.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -53,6 +55,9 @@ def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=N
     - types [list of strings, default None]: filter for log event types. ex: ["active", "blocked", "canceled", "frozen", "pending"]
     - token_ids [list of strings, default None]: list of IssuingToken ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "token", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of issuingtoken.Log objects with updated attributes
@@ -65,11 +70,14 @@ def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=N
         types=types,
         token_ids=token_ids,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor = None, ids=None, user=None):
+def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor = None, ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged issuingtoken.Log
     Receive a list of up to 100 issuingtoken.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -81,6 +89,8 @@ def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor
     - types [list of strings, default None]: filter for log event types. ex: ["active", "blocked", "canceled", "frozen", "pending"]
     - token_ids [list of strings, default None]: list of IssuingToken ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "token", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of issuingtoken.Log objects with updated attributes
@@ -95,5 +105,7 @@ def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor
         token_ids=token_ids,
         cursor=cursor,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
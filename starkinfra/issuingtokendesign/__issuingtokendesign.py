@@ -38,12 +38,15 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, ids=None, user=None):
+def query(limit=None, ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingTokenDesigns
     Receive a generator of IssuingTokenDesign objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Max = 100. ex:
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingTokenDesigns objects with updated attributes
@@ -52,11 +55,14 @@ def query(limit=None, ids=None, user=None):
         resource=_resource,
         limit=limit,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingTokenDesign
     Receive a list of IssuingTokenDesign objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -64,6 +70,8 @@ def page(cursor=None, limit=None, ids=None, user=None):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. Max = 100. ex: 35
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingTokenDesign objects with updated attributes
@@ -74,6 +82,8 @@ def page(cursor=None, limit=None, ids=None, user=None):
         cursor=cursor,
         limit=limit,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
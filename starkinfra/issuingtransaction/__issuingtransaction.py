@@ -1,6 +1,7 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ..utils import rest
+from ..utils.lazy import LazyDatetime
 
 
 class IssuingTransaction(Resource):
@@ -16,6 +17,8 @@ class IssuingTransaction(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingTransaction. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, amount, balance, description, source, tags, created):
         Resource.__init__(self, id=id)
 
@@ -44,7 +47,7 @@ def get(id, user=None):
 
 
 def query(source=None, tags=None, external_ids=None, after=None, before=None,
-          ids=None, limit=None, user=None):
+          ids=None, limit=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingTransactions
     Receive a generator of IssuingTransaction objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -55,6 +58,9 @@ def query(source=None, tags=None, external_ids=None, after=None, before=None,
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
     - status [string, default None]: filter for status of retrieved objects. ex: "approved", "canceled", "denied", "confirmed" or "voided"
     - ids [list of strings, default None, default None]: purchase IDs
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "balance", "source"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingTransaction objects with updated attributes
@@ -68,12 +74,15 @@ def query(source=None, tags=None, external_ids=None, after=None, before=None,
         before=check_date(before),
         ids=ids,
         limit=limit,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(source=None, tags=None, external_ids=None, after=None, before=None,
-         ids=None, limit=None, cursor=None, user=None):
+         ids=None, limit=None, cursor=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingTransaction
     Receive a list of IssuingTransaction objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -85,6 +94,8 @@ def page(source=None, tags=None, external_ids=None, after=None, before=None,
     - ids [list of strings,default None]: purchase IDs
     - limit [integer, default 100]: maximum number of objects to be retrieved. Max = 100. ex: 35
     - cursor [string, default None]: cursor returned on the previous page function call
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "balance", "source"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingTransaction objects with updated attributes
@@ -100,5 +111,7 @@ def page(source=None, tags=None, external_ids=None, after=None, before=None,
         ids=ids,
         limit=limit,
         cursor=cursor,
+        raw=raw,
+        fields=fields,
         user=user,
     )
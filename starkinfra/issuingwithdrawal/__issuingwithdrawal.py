@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -21,6 +22,9 @@ class IssuingWithdrawal(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingWithdrawal. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, amount, external_id, description, tags=None, id=None, transaction_id=None,
                  issuing_transaction_id=None, updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -31,8 +35,8 @@ class IssuingWithdrawal(Resource):
         self.tags = tags
         self.transaction_id = transaction_id
         self.issuing_transaction_id = issuing_transaction_id
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingWithdrawal, "name": "IssuingWithdrawal"}
@@ -64,7 +68,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(external_ids=None, after=None, before=None, limit=None, tags=None, user=None):
+def query(external_ids=None, after=None, before=None, limit=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingWithdrawals
     Receive a generator of IssuingWithdrawal objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -73,6 +77,9 @@ def query(external_ids=None, after=None, before=None, limit=None, tags=None, use
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "external_id", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingWithdrawal objects with updated attributes
@@ -84,11 +91,14 @@ def query(external_ids=None, after=None, before=None, limit=None, tags=None, use
         before=check_date(before),
         tags=tags,
         limit=limit,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(external_ids=None, after=None, before=None, limit=None, tags=None, cursor=None, user=None):
+def page(external_ids=None, after=None, before=None, limit=None, tags=None, cursor=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingWithdrawals
     Receive a list of IssuingWithdrawal objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -98,6 +108,8 @@ def page(external_ids=None, after=None, before=None, limit=None, tags=None, curs
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "external_id", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingWithdrawal objects with updated attributes
@@ -111,5 +123,7 @@ def page(external_ids=None, after=None, before=None, limit=None, tags=None, curs
         tags=tags,
         limit=limit,
         cursor=cursor,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -23,11 +23,14 @@ class MerchantCountry(SubResource):
 _resource = {"class": MerchantCountry, "name": "MerchantCountry"}
 
 
-def query(search=None, user=None):
+def query(search=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve MerchantCountries
     Receive a generator of MerchantCountry objects previously created in the Stark Infra API
     ## Parameters (optional):
     - search [string, default None]: keyword to search for code, name, number or short_code
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["code", "name", "short_code"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of MerchantCountry objects with updated attributes
@@ -35,5 +38,8 @@ def query(search=None, user=None):
     return rest.get_stream(
         resource=_resource,
         search=search,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime
+from ..utils.lazy import LazyDatetime
 
 
 class PixBalance(Resource):
@@ -16,12 +17,14 @@ class PixBalance(Resource):
     - updated [datetime.datetime]: latest update datetime for the balance. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, id=None, amount=None, currency=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.amount = amount
         self.currency = currency
-        self.updated = check_datetime(updated)
+        self.updated = updated
 
 
 _resource = {"class": PixBalance, "name": "PixBalance"}
@@ -86,7 +86,7 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, flow=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, flow=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixChargebacks
     Receive a generator of PixChargeback objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -98,6 +98,9 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - bacen_id [string, default None]: unique transaction id returned from Central Bank. ex: "ccf9bd9c-e99d-999e-bab9-b999ca999f99"
     - flow [string, default None]: direction of the Pix Chargeback. Options: "in" for received chargebacks, "out" for chargebacks you requested
     - tags [list of strings, default None]: filter for tags of retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "reason", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixChargeback objects with updated attributes
@@ -113,11 +116,14 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         bacen_id=bacen_id,
         flow=flow,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, flow=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, flow=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve PixChargebacks
     Receive a list of up to 100 PixChargeback objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -131,6 +137,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - bacen_id [string, default None]: unique transaction id returned from Central Bank. ex: "ccf9bd9c-e99d-999e-bab9-b999ca999f99"
     - flow [string, default None]: direction of the Pix Chargeback. Options: "in" for received chargebacks, "out" for chargebacks you requested
     - tags [list of strings, default None]: filter for tags of retrieved objects. ex: ["travel", "food"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "reason", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - cursor to retrieve the next page of PixChargeback objects
@@ -147,6 +155,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         bacen_id=bacen_id,
         flow=flow,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,7 +1,7 @@
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__pixchargeback import _resource as _pixchargeback_resource
-from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.resource import Resource
 from ...utils import rest
 
 
@@ -16,13 +16,16 @@ class Log(Resource):
     - errors [list of strings]: list of errors linked to this PixChargeback event
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
+    chargeback = LazyEntity(_pixchargeback_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, chargeback, type, errors, created):
         Resource.__init__(self, id=id)
 
-        self.chargeback = from_api_json(_pixchargeback_resource, chargeback)
+        self.chargeback = chargeback
         self.type = type
         self.errors = errors
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "PixChargebackLog"}
@@ -41,7 +44,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, chargeback_ids=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, types=None, chargeback_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixChargeback.Logs
     Receive a generator of PixChargeback.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +54,9 @@ def query(ids=None, limit=None, after=None, before=None, types=None, chargeback_
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "failed", "delivering", "delivered", "closed", "canceled"]
     - chargeback_ids [list of strings, default None]: list of PixChargeback IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: Log ids to filter PixChargeback Logs. ex: ["5656565656565656"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "chargeback", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixChargeback.Log objects with updated attributes
@@ -63,11 +69,14 @@ def query(ids=None, limit=None, after=None, before=None, types=None, chargeback_
         before=check_date(before),
         types=types,
         chargeback_ids=chargeback_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, chargeback_ids=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, chargeback_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixChargeback.Logs
     Receive a list of up to 100 PixChargeback.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your chargebacks.
@@ -79,6 +88,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - before [datetime.date or string, default None]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "failed", "delivering", "delivered", "closed", "canceled"]
     - chargeback_ids [list of strings, default None]: list of PixChargeback IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "chargeback", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixChargeback.Log objects with updated attributes
@@ -93,5 +104,7 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         chargeback_ids=chargeback_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
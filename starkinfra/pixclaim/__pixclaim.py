@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class PixClaim(Resource):
@@ -32,12 +33,16 @@ class PixClaim(Resource):
     - updated [datetime.datetime]: update datetime for the PixClaim. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    account_created = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, account_created, account_number, account_type, branch_code, name, tax_id, key_id, tags=None, id=None,
                  bacen_id=None, status=None, type=None, key_type=None, flow=None, claimer_bank_code=None, claimed_bank_code=None,
                  created=None, updated=None):
         Resource.__init__(self, id=id)
 
-        self.account_created = check_datetime(account_created)
+        self.account_created = account_created
         self.account_number = account_number
         self.account_type = account_type
         self.branch_code = branch_code
@@ -52,8 +57,8 @@ class PixClaim(Resource):
         self.flow = flow
         self.claimer_bank_code = claimer_bank_code
         self.claimed_bank_code = claimed_bank_code
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixClaim, "name": "PixClaim"}
@@ -86,7 +91,7 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None, key_id=None, flow=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None, key_id=None, flow=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixClaims
     Receive a generator of PixClaim objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -101,6 +106,9 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - key_id [string, default None]: filter PixClaims linked to a specific PixKey id. ex: "+5511989898989"
     - flow [string, default None]: direction of the Pix Claim. Options: "in" if you received the PixClaim or "out" if you created the PixClaim.
     - tags [list of strings, default None]: list of strings to filter retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["key_id", "type", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixClaim objects with updated attributes
@@ -119,11 +127,14 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         key_id=key_id,
         flow=flow,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None, key_id=None, flow=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None, key_id=None, flow=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixClaims
     Receive a list of up to 100 PixClaim objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -140,6 +151,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - key_id [string, default None]: filter PixClaims linked to a specific PixKey id. Example: "+5511989898989"
     - flow [string, default None]: direction of the Pix Claim. Options: "in" if you received the PixClaim or "out" if you created the PixClaim.
     - tags [list of strings, default None]: list of strings to filter retrieved objects. ex: ["travel", "food"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["key_id", "type", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixClaim objects with updated attributes and cursor to retrieve the next page of PixClaim objects
@@ -158,6 +171,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         key_id=key_id,
         flow=flow,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,7 +1,7 @@
 from ...utils import rest
-from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__pixclaim import _resource as _pixclaim_resource
 
 
@@ -18,14 +18,17 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
     
+    claim = LazyEntity(_pixclaim_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, claim, type, errors, reason, created):
         Resource.__init__(self, id=id)
 
-        self.claim = from_api_json(_pixclaim_resource, claim)
+        self.claim = claim
         self.type = type
         self.errors = errors
         self.reason = reason
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "PixClaimLog"}
@@ -44,7 +47,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, claim_ids=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, types=None, claim_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixClaim.Logs
     Receive a generator of PixClaim.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -54,6 +57,9 @@ def query(ids=None, limit=None, after=None, before=None, types=None, claim_ids=N
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "failed", "delivering", "delivered", "confirming", "confirmed", "success", "canceling", "canceled"]
     - claim_ids [list of strings, default None]: list of PixClaim ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: Log ids to filter PixClaim Logs. ex: ["5656565656565656"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "claim", "reason"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixClaim.Log objects with updated attributes
@@ -66,11 +72,14 @@ def query(ids=None, limit=None, after=None, before=None, types=None, claim_ids=N
         before=check_date(before),
         types=types,
         claim_ids=claim_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, claim_ids=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, claim_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixClaim.Logs
     Receive a list of up to 100 PixClaim.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your claims.
@@ -82,6 +91,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "failed", "delivering", "delivered", "confirming", "confirmed", "success", "canceling", "canceled"]
     - claim_ids [list of strings, default None]: list of PixClaim IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: Log ids to filter PixClaim Logs. ex: ["5656565656565656"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "claim", "reason"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixClaim.Log objects with updated attributes
@@ -96,5 +107,7 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         claim_ids=claim_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
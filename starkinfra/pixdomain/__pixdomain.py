@@ -1,6 +1,6 @@
 from ..utils import rest
 from .__certificate import _resource as _certificate_resource
-from starkcore.utils.api import from_api_json
+from ..utils.api import from_api_json
 from starkcore.utils.subresource import SubResource
 
 
@@ -25,12 +25,15 @@ def _parse_certificates(certificates):
 _resource = {"class": PixDomain, "name": "PixDomain"}
 
 
-def query(user=None):
+def query(prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixDomains
     Receive a generator of PixDomain objects.
     ## Parameters (optional):
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "certificates"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixDomain objects with updated attributes
     """
-    return rest.get_stream(resource=_resource, user=user)
+    return rest.get_stream(resource=_resource, prefetch=prefetch, raw=raw, fields=fields, user=user)
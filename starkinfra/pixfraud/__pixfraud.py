@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class PixFraud(Resource):
@@ -25,6 +26,9 @@ class PixFraud(Resource):
     - updated [string]: latest update datetime for the PixFraud. ex: "2020-03-10 10:30:00.000000+00:00"
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self,  external_id, type, tax_id, key_id=None, tags=None, id=None,
                  bacen_id=None, status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
@@ -36,8 +40,8 @@ class PixFraud(Resource):
         self.tags = tags
         self.bacen_id = bacen_id
         self.status = status
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixFraud, "name": "PixFraud"}
@@ -69,7 +73,7 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, flow=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, flow=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixFrauds
     Receive a generator of PixFraud objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -81,6 +85,9 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - bacen_id [string, default None]: unique transaction id returned from Central Bank. ex: "ccf9bd9c-e99d-999e-bab9-b999ca999f99"
     - type [list of strings, default None]: filter for the type of retrieved PixFrauds. Options: "reversal", "reversalChargeback"
     - tags [list of strings, default None]: list of strings for tagging. ex: ["fraudulent"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "tax_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixFraud objects with updated attributes
@@ -96,12 +103,15 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         type=type,
         flow=flow,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, flow=None, tags=None,
-         user=None):
+         raw=False, fields=None, user=None):
     """# Retrieve paged PixFraud
     Receive a list of up to 100 PixFraud objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -115,6 +125,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - bacen_id [string, default None]: unique transaction id returned from Central Bank. ex: "ccf9bd9c-e99d-999e-bab9-b999ca999f99"
     - type [list of strings, default None]: filter for the type of retrieved PixFrauds. Options: "reversal", "reversalChargeback"
     - tags [list of strings, default None]: list of strings for tagging. ex: ["fraudulent"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "tax_id", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixFraud objects with updated attributes and cursor to retrieve the next page of PixFraud objects
@@ -131,6 +143,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         type=type,
         flow=flow,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
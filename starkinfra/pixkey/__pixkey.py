@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class PixKey(Resource):
@@ -30,24 +31,28 @@ class PixKey(Resource):
     - created [datetime.datetime]: creation datetime for the PixKey. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    account_created = LazyDatetime(check_datetime)
+    owned = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, account_created, account_number, account_type, branch_code, name, tax_id, id=None, tags=None,
                  owned=None, owner_type=None, status=None, bank_code=None, bank_name=None, type=None, created=None):
         Resource.__init__(self, id=id)
 
-        self.account_created = check_datetime(account_created)
+        self.account_created = account_created
         self.account_number = account_number
         self.account_type = account_type
         self.branch_code = branch_code
         self.name = name
         self.tax_id = tax_id
         self.tags = tags
-        self.owned = check_datetime(owned)
+        self.owned = owned
         self.owner_type = owner_type
         self.status = status
         self.bank_code = bank_code
         self.bank_name = bank_name
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": PixKey, "name": "PixKey"}
@@ -82,7 +87,7 @@ def get(id, payer_id, end_to_end_id=None, user=None):
     return rest.get_id(id=id, payer_id=payer_id, end_to_end_id=end_to_end_id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixKeys
     Receive a generator of PixKey objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -93,6 +98,9 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - type [string, default None]: filter for the type of retrieved PixKeys. Options: "cpf", "cnpj", "phone", "email" and "evp"
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "name", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixKey objects with updated attributes
@@ -106,12 +114,15 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         tags=tags,
         ids=ids,
         type=type,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None,
-         user=None):
+         raw=False, fields=None, user=None):
     """# Retrieve paged PixKeys
     Receive a generator of PixKey objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -123,6 +134,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - type [string, default None]: filter for the type of retrieved PixKeys. Options: "cpf", "cnpj", "phone", "email" and "evp"
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "name", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - cursor to retrieve the next page of PixKey objects
@@ -138,6 +151,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         tags=tags,
         ids=ids,
         type=type,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,7 +1,7 @@
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__pixkey import _resource as _pixkey_resource
-from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.resource import Resource
 from ...utils import rest
 
 
@@ -16,13 +16,16 @@ class Log(Resource):
     - errors [list of strings]: list of errors linked to this PixKey event
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
+    key = LazyEntity(_pixkey_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, key, type, errors, created):
         Resource.__init__(self, id=id)
 
-        self.key = from_api_json(_pixkey_resource, key)
+        self.key = key
         self.type = type
         self.errors = errors
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "PixKeyLog"}
@@ -41,7 +44,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, key_ids=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, types=None, key_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixKey.Logs
     Receive a generator of PixKey.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +54,9 @@ def query(ids=None, limit=None, after=None, before=None, types=None, key_ids=Non
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "registered", "updated", "failed", "canceling", "canceled"]
     - key_ids [list of strings, default None]: list of PixKey IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: Log ids to filter PixKey Logs. ex: ["5656565656565656"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "key", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixKey.Log objects with updated attributes
@@ -63,11 +69,14 @@ def query(ids=None, limit=None, after=None, before=None, types=None, key_ids=Non
         before=check_date(before),
         types=types,
         key_ids=key_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, key_ids=None, user=None):
+def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None, key_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixKey.Logs
     Receive a list of up to 100 PixKey.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your keys.
@@ -79,6 +88,8 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
     - before [datetime.date or string, default None]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "registered", "updated", "failed", "canceling", "canceled"]
     - key_ids [list of strings, default None]: list of PixKey IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "key", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixKey.Log objects with updated attributes
@@ -93,5 +104,7 @@ def page(cursor=None, ids=None, limit=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         key_ids=key_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,9 +1,10 @@
-from json import dumps
+from ..utils import codec
 from ..utils import rest
-from ..utils.parse import parse_and_verify
-from starkcore.utils.api import api_json
-from starkcore.utils.resource import Resource
+from ..utils.parse import parse_and_verify, parse_many_and_verify
+from ..utils.api import api_json
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class PixRequest(Resource):
@@ -49,6 +50,9 @@ class PixRequest(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixRequest. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, amount, external_id, sender_name, sender_tax_id, sender_branch_code,
                  sender_account_number, sender_account_type, receiver_name, receiver_tax_id, receiver_bank_code,
                  receiver_account_number, receiver_branch_code, receiver_account_type, end_to_end_id,
@@ -84,8 +88,8 @@ class PixRequest(Resource):
         self.status = status
         self.flow = flow
         self.sender_bank_code = sender_bank_code
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixRequest, "name": "PixRequest"}
@@ -118,7 +122,7 @@ def get(id, user=None):
 
 
 def query(limit=None, after=None, before=None, status=None, ids=None, end_to_end_ids=None,
-          external_ids=None, tags=None, user=None):
+          external_ids=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixRequests
     Receive a generator of PixRequest objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -130,6 +134,9 @@ def query(limit=None, after=None, before=None, status=None, ids=None, end_to_end
     - end_to_end_ids [list of strings, default None]: central bank's unique transaction IDs. ex: ["E79457883202101262140HHX553UPqeq", "E79457883202101262140HHX553UPxzx"]
     - external_ids [list of strings, default None]: url safe strings that must be unique among all your PixRequests. Duplicated external IDs will cause failures. By default, this parameter will block any PixRequests that repeats amount and receiver information on the same date. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixRequest objects with updated attributes
@@ -144,12 +151,15 @@ def query(limit=None, after=None, before=None, status=None, ids=None, end_to_end
         end_to_end_ids=end_to_end_ids,
         external_ids=external_ids,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None,
-         end_to_end_ids=None, external_ids=None, tags=None, user=None):
+         end_to_end_ids=None, external_ids=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixRequests
     Receive a list of up to 100 PixRequest objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -163,6 +173,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - end_to_end_ids [list of strings, default None]: central bank's unique transaction IDs. ex: ["E79457883202101262140HHX553UPqeq", "E79457883202101262140HHX553UPxzx"]
     - external_ids [list of strings, default None]: url safe strings that must be unique among all your PixRequests. Duplicated external IDs will cause failures. By default, this parameter will block any PixRequests that repeats amount and receiver information on the same date. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "status", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixRequest objects with updated attributes
@@ -179,6 +191,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         end_to_end_ids=end_to_end_ids,
         external_ids=external_ids,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -211,6 +225,37 @@ def parse(content, signature, user=None):
     return request
 
 
+def parse_many(items, workers=None, user=None):
+    """# Create multiple verified PixRequest objects from stored content strings
+    Use this method to reprocess backlogs of stored deliveries. Signatures are verified in a pool of processes,
+    so the work scales with the number of CPU cores, and the parsed objects are returned in the same order as the items.
+    If any digital signature does not check out with the StarkInfra public key, a
+    starkinfra.error.InvalidSignatureError will be raised.
+    Scripts using it must start from an if __name__ == "__main__" block, as required by Python process pools.
+    ## Parameters (required):
+    - items [list of tuples]: list of (content, signature) pairs, each with the response content received at user endpoint (not parsed) and the base-64 digital signature received at response header "Digital-Signature"
+    ## Parameters (optional):
+    - workers [integer, default None]: number of processes used to verify signatures. Use 1 to verify in the current process. Defaults to the number of CPU cores. ex: 4
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of parsed PixRequest objects
+    """
+    requests = parse_many_and_verify(
+        items=items,
+        workers=workers,
+        user=user,
+        resource=_resource,
+    )
+
+    for request in requests:
+        request.fee = request.fee or 0
+        request.tags = request.tags or []
+        request.external_id = request.external_id or ""
+        request.description = request.description or ""
+
+    return requests
+
+
 def response(status, reason=None):
     """# Helps you respond to a PixRequest authorization.
     Authorization requests will be posted at your registered
@@ -228,4 +273,4 @@ def response(status, reason=None):
             "reason": reason,
         }
     }
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
@@ -1,7 +1,7 @@
 from ...utils import rest
-from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__pixrequest import _resource as _pixrequest_resource
 
 
@@ -16,13 +16,16 @@ class Log(Resource):
     - errors [list of strings]: list of errors linked to this PixRequest event
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
+    request = LazyEntity(_pixrequest_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, request, type, errors, created):
         Resource.__init__(self, id=id)
 
-        self.request = from_api_json(_pixrequest_resource, request)
+        self.request = request
         self.type = type
         self.errors = errors
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "PixRequestLog"}
@@ -41,7 +44,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, request_ids=None, reconciliation_id=None, user=None):
+def query(limit=None, after=None, before=None, types=None, request_ids=None, reconciliation_id=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixRequest.Logs
     Receive a generator of PixRequest.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +54,9 @@ def query(limit=None, after=None, before=None, types=None, request_ids=None, rec
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - request_ids [list of strings, default None]: list of PixRequest ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - reconciliation_id [string, default None]: PixRequest reconciliation id to filter retrieved objects. ex: "b77f5236-7ab9-4487-9f95-66ee6eaf1781"
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "request", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixRequest.Log objects with updated attributes
@@ -63,11 +69,14 @@ def query(limit=None, after=None, before=None, types=None, request_ids=None, rec
         types=types,
         request_ids=request_ids,
         reconciliation_id=reconciliation_id,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, types=None, request_ids=None, reconciliation_id=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, types=None, request_ids=None, reconciliation_id=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixRequest.Logs
     Receive a list of up to 100 PixRequest.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -79,6 +88,8 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, request_i
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - request_ids [list of strings, default None]: list of PixRequest IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - reconciliation_id [string, default None]: PixRequest reconciliation id to filter retrieved objects. ex: "b77f5236-7ab9-4487-9f95-66ee6eaf1781"
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "request", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixRequest.Log objects with updated attributes
@@ -93,5 +104,7 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, request_i
         types=types,
         request_ids=request_ids,
         reconciliation_id=reconciliation_id,
+        raw=raw,
+        fields=fields,
         user=user,
     )
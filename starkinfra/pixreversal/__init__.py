@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__pixreversal import create, get, query, page, parse, response
+from .__pixreversal import create, get, query, page, parse, parse_many, response
@@ -1,9 +1,9 @@
-from json import dumps
-from starkcore.utils.api import api_json
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
-from ..utils import rest
-from ..utils.parse import parse_and_verify
+from ..utils.lazy import LazyDatetime
+from ..utils import rest, codec
+from ..utils.api import api_json
+from ..utils.parse import parse_and_verify, parse_many_and_verify
 
 
 class PixReversal(Resource):
@@ -30,6 +30,9 @@ class PixReversal(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixReversal. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, amount, external_id, end_to_end_id, reason, tags=None, id=None, return_id=None,
                  fee=None, status=None, flow=None, created=None, updated=None):
         Resource.__init__(self, id=id)
@@ -43,8 +46,8 @@ class PixReversal(Resource):
         self.fee = fee
         self.status = status
         self.flow = flow
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixReversal, "name": "PixReversal"}
@@ -77,7 +80,7 @@ def get(id, user=None):
 
 
 def query(limit=None, after=None, before=None, status=None, ids=None, return_ids=None,
-          external_ids=None, tags=None, user=None):
+          external_ids=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixReversals
     Receive a generator of PixReversal objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -89,6 +92,9 @@ def query(limit=None, after=None, before=None, status=None, ids=None, return_ids
     - return_ids [list of strings, default None]: central bank's unique reversal transaction IDs. ex: ["D20018183202202030109X3OoBHG74wo", "D20018183202202030109X3OoBHG72rd"].
     - external_ids [list of strings, default None]: url safe strings that must be unique among all your PixReversals. Duplicated external IDs will cause failures. By default, this parameter will block any PixReversal that repeats amount and receiver information on the same date. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "reason", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixReversal objects with updated attributes
@@ -103,12 +109,15 @@ def query(limit=None, after=None, before=None, status=None, ids=None, return_ids
         return_ids=return_ids,
         external_ids=external_ids,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None,
-         return_ids=None, external_ids=None, tags=None, user=None):
+         return_ids=None, external_ids=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixReversals
     Receive a list of up to 100 PixReversal objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your reversals.
@@ -122,6 +131,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - return_ids [list of strings, default None]: central bank's unique reversal transaction ID. ex: ["D20018183202202030109X3OoBHG74wo", "D20018183202202030109X3OoBHG72rd"].
     - external_ids [list of strings, default None]: url safe string that must be unique among all your PixReversals. Duplicated external IDs will cause failures. By default, this parameter will block any PixReversal that repeats amount and receiver information on the same date. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["amount", "reason", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of PixReversal objects with updated attributes
@@ -138,6 +149,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         return_ids=return_ids,
         external_ids=external_ids,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -170,6 +183,36 @@ def parse(content, signature, user=None):
     return request
 
 
+def parse_many(items, workers=None, user=None):
+    """# Create multiple verified PixReversal objects from stored content strings
+    Use this method to reprocess backlogs of stored deliveries. Signatures are verified in a pool of processes,
+    so the work scales with the number of CPU cores, and the parsed objects are returned in the same order as the items.
+    If any digital signature does not check out with the StarkInfra public key, a
+    starkinfra.error.InvalidSignatureError will be raised.
+    Scripts using it must start from an if __name__ == "__main__" block, as required by Python process pools.
+    ## Parameters (required):
+    - items [list of tuples]: list of (content, signature) pairs, each with the response content received at user endpoint (not parsed) and the base-64 digital signature received at response header "Digital-Signature"
+    ## Parameters (optional):
+    - workers [integer, default None]: number of processes used to verify signatures. Use 1 to verify in the current process. Defaults to the number of CPU cores. ex: 4
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of parsed PixReversal objects
+    """
+    reversals = parse_many_and_verify(
+        items=items,
+        workers=workers,
+        user=user,
+        resource=_resource,
+    )
+
+    for reversal in reversals:
+        reversal.fee = reversal.fee or 0
+        reversal.tags = reversal.tags or []
+        reversal.external_id = reversal.external_id or ""
+
+    return reversals
+
+
 def response(status, reason=None):
     """# Helps you respond to a PixReversal authorization
     ## Parameters (required):
@@ -185,4 +228,4 @@ def response(status, reason=None):
             "reason": reason,
         }
     }
-    return dumps(api_json(params))
+    return codec.dumps(api_json(params))
@@ -1,7 +1,7 @@
 from ...utils import rest
-from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ...utils.lazy import LazyDatetime, LazyEntity
 from ..__pixreversal import _resource as _pixreversal_resource
 
 
@@ -16,13 +16,16 @@ class Log(Resource):
     - errors [list of strings]: list of errors linked to this PixReversal event
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
+    reversal = LazyEntity(_pixreversal_resource)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, id, reversal, type, errors, created):
         Resource.__init__(self, id=id)
 
-        self.reversal = from_api_json(_pixreversal_resource, reversal)
+        self.reversal = reversal
         self.type = type
         self.errors = errors
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "PixReversalLog"}
@@ -41,7 +44,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, reversal_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, reversal_ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixReversal.Logs
     Receive a generator of PixReversal.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -50,6 +53,9 @@ def query(limit=None, after=None, before=None, types=None, reversal_ids=None, us
     - before [datetime.date or string, default None]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - reversal_ids [list of strings, default None]: list of PixReversal IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "reversal", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixReversal.Log objects with updated attributes
@@ -61,11 +67,14 @@ def query(limit=None, after=None, before=None, types=None, reversal_ids=None, us
         before=check_date(before),
         types=types,
         reversal_ids=reversal_ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, types=None, reversal_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, types=None, reversal_ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixReversal.Logs
     Receive a list of up to 100 PixReversal.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your reversals.
@@ -76,6 +85,8 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, reversal_
     - before [datetime.date or string, default None]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - reversal_ids [list of strings, default None]: list of PixReversal IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["type", "reversal", "created"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixReversal.Log objects with updated attributes
@@ -89,5 +100,7 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, reversal_
         before=check_date(before),
         types=types,
         reversal_ids=reversal_ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
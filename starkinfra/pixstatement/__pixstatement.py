@@ -1,6 +1,7 @@
 from ..utils import rest
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 
 
 class PixStatement(Resource):
@@ -24,16 +25,21 @@ class PixStatement(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixStatement. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    after = LazyDatetime(check_date)
+    before = LazyDatetime(check_date)
+    created = LazyDatetime(check_datetime)
+    updated = LazyDatetime(check_datetime)
+
     def __init__(self, after, before, type, id=None, status=None, transaction_count=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
-        self.after = check_date(after)
-        self.before = check_date(before)
+        self.after = after
+        self.before = before
         self.type = type
         self.status = status
         self.transaction_count = transaction_count
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixStatement, "name": "PixStatement"}
@@ -65,12 +71,15 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, ids=None, user=None):
+def query(limit=None, ids=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve PixStatements
     Receive a generator of PixStatement objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["after", "before", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixStatement objects with updated attributes
@@ -79,11 +88,14 @@ def query(limit=None, ids=None, user=None):
         resource=_resource,
         limit=limit,
         ids=ids,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixStatements
     Receive a list of up to 100 PixStatement objects previously created in the Stark Infra API
     Use this function instead of query if you want to manually page your statements.
@@ -91,6 +103,8 @@ def page(cursor=None, limit=None, ids=None, user=None):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. Max = 100. ex: 35
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["after", "before", "status"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixStatement objects with updated attributes
@@ -101,6 +115,8 @@ def page(cursor=None, limit=None, ids=None, user=None):
         cursor=cursor,
         limit=limit,
         ids=ids,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,5 +1,6 @@
-from starkcore.utils.resource import Resource
+from ..utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import LazyDatetime
 from ..utils import rest
 
 
@@ -27,6 +28,9 @@ class StaticBrcode(Resource):
     - created [datetime.datetime]: creation datetime for the StaticBrcode. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    updated = LazyDatetime(check_datetime)
+    created = LazyDatetime(check_datetime)
+
     def __init__(self, name, key_id, city, amount=None, cashier_bank_code=None, reconciliation_id=None, tags=None,
                  id=None, description=None, uuid=None, url=None, updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -41,8 +45,8 @@ class StaticBrcode(Resource):
         self.tags = tags
         self.uuid = uuid
         self.url = url
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": StaticBrcode, "name": "StaticBrcode"}
@@ -74,7 +78,7 @@ def get(uuid, user=None):
     return rest.get_id(resource=_resource, id=uuid, user=user)
 
 
-def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, uuids=None, tags=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve StaticBrcodes
     Receive a generator of StaticBrcode objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -83,6 +87,9 @@ def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None)
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "key_id", "uuid"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of StaticBrcode objects with updated attributes
@@ -94,11 +101,14 @@ def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None)
         before=check_date(before),
         uuids=uuids,
         tags=tags,
+        prefetch=prefetch,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None, raw=False, fields=None, user=None):
     """# Retrieve paged StaticBrcodes
     Receive a list of up to 100 StaticBrcode objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -109,6 +119,8 @@ def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["name", "key_id", "uuid"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of StaticBrcode objects with updated attributes
@@ -122,5 +134,7 @@ def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None
         before=check_date(before),
         uuids=uuids,
         tags=tags,
+        raw=raw,
+        fields=fields,
         user=user,
     )
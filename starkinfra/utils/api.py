@@ -0,0 +1,251 @@
+import starkinfra
+from datetime import datetime
+from starkcore.utils.case import camel_to_snake, snake_to_camel
+from starkcore.utils.subresource import SubResource
+from starkcore.utils.api import endpoint, last_name, last_name_plural, cast_values
+from . import compact, projection
+from .lazy import storages
+
+try:
+    from sys import intern
+except ImportError:
+    intern = intern
+
+
+_decoders = {}
+_serializers = {}
+_snake_keys = {}
+_camel_keys = {}
+_plain = (str, int, float, bool)
+_unicode = type(u"")
+_interned = {}  # Python 2 decodes JSON strings as unicode, which intern() does not accept
+
+
+def from_api_json(resource, json):
+    if starkinfra.compact:
+        return compact.from_api_json(resource, json)
+    return decoder(resource["class"], resource["name"])(json)
+
+
+def decoder(cls, name=None):
+    """# Get the decoder of a resource class
+    Builds, once per class and resource name, a function that creates class instances from API jsons.
+    The API key of each constructor parameter is resolved ahead of time, so no key is converted while decoding.
+    String values of the fields listed for the resource name in starkinfra.interned_fields are interned,
+    so repeated values share a single string object.
+    Nested entities are decoded by the class constructor, which also uses these decoders.
+    ## Parameters (required):
+    - cls [class]: SubResource or Resource class. ex: starkinfra.PixRequest
+    ## Parameters (optional):
+    - name [string, default None]: resource name used to look up starkinfra.interned_fields. ex: "PixRequest"
+    ## Return:
+    - decoder function receiving an API json and returning the class instance
+    """
+    decode = _decoders.get((cls, name))
+    if decode is None:
+        decode = _decoders[(cls, name)] = _build_decoder(cls, interned_fields(name))
+    return decode
+
+
+def interned_fields(name):
+    """# Get the interned fields of a resource
+    ## Parameters (required):
+    - name [string]: resource name. ex: "PixRequest"
+    ## Return:
+    - set of attribute names whose string values are interned while decoding
+    """
+    return frozenset(starkinfra.interned_fields.get(name) or ())
+
+
+def intern_string(value):
+    if type(value) is str:
+        return intern(value)
+    if type(value) is _unicode:
+        return _interned.setdefault(value, value)
+    return value
+
+
+def _build_decoder(cls, interned=frozenset()):
+    code = getattr(cls, "_original", cls).__init__.__code__
+    params = code.co_varnames[1:code.co_argcount]
+    keys = tuple((param, snake_to_camel(param)) for param in params if param not in interned)
+    interned_keys = tuple((param, snake_to_camel(param)) for param in params if param in interned)
+
+    if not interned_keys:
+        def decode(json):
+            get = json.get
+            return cls(**{param: get(key) for param, key in keys})
+
+        return decode
+
+    def decode(json):
+        get = json.get
+        kwargs = {param: get(key) for param, key in keys}
+        for param, key in interned_keys:
+            kwargs[param] = intern_string(get(key))
+        return cls(**kwargs)
+
+    return decode
+
+
+def api_json(entity):
+    """# Serialize an entity into an API json
+    Same output as starkcore's api_json: None values are removed, keys are converted to camelCase and
+    datetimes, dates, timedeltas and nested entities are cast to their API formats.
+    ## Parameters (required):
+    - entity [SubResource object or dictionary]: entity to be serialized. ex: PixRequest(...)
+    ## Return:
+    - dictionary ready to be sent to the API
+    """
+    if isinstance(entity, dict):
+        return _cast_dict(entity)
+    return serializer(type(entity))(entity)
+
+
+def api_jsons(entities):
+    """# Serialize a list of entities into API jsons
+    Looks the serializer up only when the class changes along the list, as create functions usually receive
+    lists of a single class.
+    ## Parameters (required):
+    - entities [list of SubResource objects or dictionaries]: entities to be serialized. ex: [PixRequest(...), PixRequest(...)]
+    ## Return:
+    - list of dictionaries ready to be sent to the API
+    """
+    jsons = []
+    cls, serialize = None, None
+    for entity in entities:
+        if type(entity) is not cls:
+            cls = type(entity)
+            serialize = _cast_dict if isinstance(entity, dict) else serializer(cls)
+        jsons.append(serialize(entity))
+    return jsons
+
+
+def serializer(cls):
+    """# Get the serializer of a resource class
+    Builds, once per class, a function that creates API jsons from class instances. Instead of listing every
+    attribute of each object with dir(), the serializer reads the instance attributes and the lazy attributes
+    of the class, converting their keys with a shared cache.
+    Compact objects, which have no instance dictionaries, are serialized from their slots.
+    ## Parameters (required):
+    - cls [class]: SubResource or Resource class. ex: starkinfra.PixRequest
+    ## Return:
+    - serializer function receiving a class instance and returning its API json
+    """
+    serialize = _serializers.get(cls)
+    if serialize is None:
+        serialize = _serializers[cls] = _build_serializer(cls)
+    return serialize
+
+
+def _build_serializer(cls):
+    if issubclass(cls, compact.CompactSubResource):
+        return _build_compact_serializer(cls)
+    lazy = tuple((name, _camel(name)) for name in storages(cls))
+
+    def serialize(entity):
+        json = {}
+        for name, value in vars(entity).items():
+            if value is None or name[0] == "_" or callable(value):
+                continue
+            json[_camel_keys.get(name) or _camel(name)] = value if type(value) in _plain else _cast(value)
+        for name, key in lazy:
+            value = getattr(entity, name)
+            if value is not None:
+                json[key] = value if type(value) in _plain else _cast(value)
+        return json
+
+    return serialize
+
+
+def _build_compact_serializer(cls):
+    lazy = storages(cls)
+    names = (set(cls.__slots__) - set(lazy.values())) | set(lazy)
+    keys = tuple((name, _camel(name)) for name in sorted(names) if name[0] != "_")
+
+    def serialize(entity):
+        json = {}
+        for name, key in keys:
+            value = getattr(entity, name, None)
+            if value is not None and not callable(value):
+                json[key] = value if type(value) in _plain else _cast(value)
+        return json
+
+    return serialize
+
+
+def cast_json_to_api_format(json):
+    """# Cast a dictionary into an API json
+    Same output as starkcore's cast_json_to_api_format, also serializing nested compact objects.
+    ## Parameters (required):
+    - json [dictionary]: payload to be cast. ex: {"is_delivered": True}
+    ## Return:
+    - dictionary ready to be sent to the API
+    """
+    return _cast_dict(json)
+
+
+def _cast(value):
+    kind = type(value)
+    if kind in _plain:
+        return value
+    if kind is list:
+        return [_cast(item) for item in value]
+    if kind is dict:
+        return _cast_dict(value)
+    if kind is datetime or not isinstance(value, (SubResource, compact.CompactSubResource)):
+        return cast_values(value)
+    return serializer(kind)(value)
+
+
+def _cast_dict(json):
+    return {_camel_keys.get(key) or _camel(key): _cast(value) for key, value in json.items() if value is not None}
+
+
+def _camel(key):
+    camel = snake_to_camel(key)
+    if len(_camel_keys) < 10000:
+        _camel_keys[key] = camel
+    return camel
+
+
+def entity_decoder(resource, raw=False, fields=None):
+    """# Get the decoder of listed entities
+    ## Parameters (required):
+    - resource [dictionary]: resource description with "class" and "name" keys, as used by rest functions.
+    ## Parameters (optional):
+    - raw [bool or string, default False]: if True, entities are kept as API jsons. Use "snake_case" to also convert their keys.
+    - fields [list of strings, default None]: attributes to be decoded. ex: ["amount", "status", "created"]
+    ## Return:
+    - decoder function receiving an API json and returning the entity
+    """
+    if raw:
+        keys = set(snake_to_camel(field) for field in fields) | {"id"} if fields else None
+        return lambda json: from_api_json_raw(json, raw, keys)
+    if fields:
+        return projection.decoder(resource, fields)
+    return lambda json: from_api_json(resource, json)
+
+
+def from_api_json_raw(json, raw, keys=None):
+    if keys is not None:
+        json = dict((key, value) for key, value in json.items() if key in keys)
+    if raw == "snake_case":
+        return _snake_case(json)
+    return json
+
+
+def _snake_case(json):
+    if isinstance(json, list):
+        return [_snake_case(value) for value in json]
+    if not isinstance(json, dict):
+        return json
+    snakes = {}
+    for key, value in json.items():
+        snake = _snake_keys.get(key)
+        if snake is None:
+            snake = camel_to_snake(key)
+            if len(_snake_keys) < 10000:
+                _snake_keys[key] = snake
+        snakes[snake] = _snake_case(value)
+    return snakes
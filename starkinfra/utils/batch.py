@@ -0,0 +1,116 @@
+from time import time
+from threading import Thread, Condition
+from starkcore.error import InputErrors, UnknownError
+
+
+class Batcher:
+    """# Batcher object
+    The Batcher collects entities submitted one by one, from any number of threads, and creates them together
+    with a single call to the resource create function. A batch is sent as soon as it holds max_size entities
+    or max_delay seconds after its first entity was submitted, whichever happens first.
+    Each submission returns a concurrent.futures.Future resolved with its own created object or error.
+    If the API rejects a batch with starkinfra.error.InputErrors, the batch is split in halves and retried,
+    so only the invalid entities fail.
+    Asyncio tasks may await submissions with asyncio.wrap_future(batcher.submit(entity)).
+    ## Parameters (required):
+    - create [function]: create function of the resource. ex: starkinfra.pixrequest.create
+    ## Parameters (optional):
+    - max_size [integer, default 100]: maximum number of entities per batch. Max = 100. ex: 50
+    - max_delay [float, default 0.05]: maximum number of seconds an entity waits for its batch to fill. ex: 0.01
+    - workers [integer, default 4]: maximum number of batches being created at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    - any other parameter accepted by the create function. ex: expand=["rules"]
+    """
+
+    def __init__(self, create, max_size=100, max_delay=0.05, workers=4, user=None, **options):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.create = create
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.user = user
+        self.options = options
+
+        self._pending = []
+        self._deadline = 0
+        self._closed = False
+        self._condition = Condition()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._thread = Thread(target=self._collect)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, entity):
+        """# Submit an entity for creation
+        ## Parameters (required):
+        - entity [object]: entity to be created. ex: PixRequest(...)
+        ## Return:
+        - concurrent.futures.Future resolved with the created object
+        """
+        from concurrent.futures import Future
+
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("cannot submit to a closed Batcher")
+            if not self._pending:
+                self._deadline = time() + self.max_delay
+            self._pending.append((entity, future))
+            self._condition.notify()
+        return future
+
+    def close(self):
+        """# Close the Batcher
+        Sends the entities still waiting for a batch and blocks until every submitted entity is resolved.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def _collect(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                while not self._closed and len(self._pending) < self.max_size:
+                    remaining = self._deadline - time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending[:self.max_size], self._pending[self.max_size:]
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch):
+        try:
+            created = self.create([entity for entity, future in batch], user=self.user, **self.options)
+        except InputErrors as error:
+            if len(batch) == 1:
+                batch[0][1].set_exception(error)
+                return
+            middle = len(batch) // 2
+            self._send(batch[:middle])
+            self._send(batch[middle:])
+            return
+        except Exception as error:
+            for entity, future in batch:
+                future.set_exception(error)
+            return
+        for (entity, future), result in zip(batch, created):
+            future.set_result(result)
+        if len(created) < len(batch):
+            error = UnknownError("{created} objects created for a batch of {sent} entities".format(
+                created=len(created),
+                sent=len(batch),
+            ))
+            for entity, future in batch[len(created):]:
+                future.set_exception(error)
@@ -0,0 +1,57 @@
+from starkcore.utils.subresource import SubResource
+
+
+class Chunk(SubResource):
+    """# Bulk Chunk object
+    A Chunk is one of the create requests sent by starkinfra.bulk.create.
+    ## Attributes (return-only):
+    - index [integer]: position of the chunk in the bulk, starting at 0. ex: 3
+    - entities [list of objects]: entities sent for creation in this chunk, in the original order.
+    - created [list of objects]: objects returned by the API for this chunk. None if the chunk failed.
+    - error [Exception]: error raised while creating this chunk, such as starkinfra.error.InputErrors. None if the chunk succeeded.
+    """
+
+    def __init__(self, index, entities, created=None, error=None):
+        self.index = index
+        self.entities = entities
+        self.created = created
+        self.error = error
+
+
+def create(create, entities, chunk_size=100, workers=4, user=None, **options):
+    """# Create entities in concurrent chunks
+    Splits a list of entities into chunks of up to chunk_size entities and sends them to the given create function,
+    keeping up to 'workers' requests in flight. A failed chunk does not interrupt the others.
+    ## Parameters (required):
+    - create [function]: create function of the resource. ex: starkinfra.pixrequest.create
+    - entities [list of objects]: entities to be created. ex: [PixRequest(...), PixRequest(...)]
+    ## Parameters (optional):
+    - chunk_size [integer, default 100]: maximum number of entities per request. Max = 100. ex: 50
+    - workers [integer, default 4]: maximum number of concurrent requests. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    - any other parameter accepted by the create function. ex: expand=["rules"]
+    ## Return:
+    - list of succeeded Chunk objects, in the original order
+    - list of failed Chunk objects, in the original order
+    """
+    if not 1 <= chunk_size <= 100:
+        raise ValueError("chunk_size must be an integer between 1 and 100, got {chunk_size}".format(chunk_size=chunk_size))
+
+    chunks = [
+        Chunk(index=index, entities=entities[start:start + chunk_size])
+        for index, start in enumerate(range(0, len(entities), chunk_size))
+    ]
+
+    def send(chunk):
+        try:
+            chunk.created = create(chunk.entities, user=user, **options)
+        except Exception as error:
+            chunk.error = error
+        return chunk
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        chunks = list(executor.map(send, chunks))
+
+    return [chunk for chunk in chunks if chunk.error is None], [chunk for chunk in chunks if chunk.error is not None]
@@ -0,0 +1,113 @@
+from re import compile
+from json import dumps as _dumps, loads as _loads
+
+
+class StandardBackend:
+    """# Standard library JSON backend
+    Encodes and decodes JSON with the json module, which is always available.
+    """
+
+    name = "json"
+
+    def dumps(self, data):
+        return _dumps(data)
+
+    def loads(self, content):
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return _loads(content, strict=False)
+
+
+class OrjsonBackend:
+    """# Native JSON backend
+    Encodes and decodes JSON with the orjson library, when it is installed.
+    Non-ASCII characters are escaped as the standard library does, but the output has no spaces after separators,
+    so it is not byte-for-byte equal to the standard library output. Requests are signed over the body actually sent.
+    Data orjson cannot handle, such as integers above 64 bits or non-string keys, falls back to the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._standard = StandardBackend()
+
+    def dumps(self, data):
+        try:
+            text = self._dumps(data).decode("utf-8")
+        except TypeError:
+            return self._standard.dumps(data)
+        if _non_ascii.search(text) is None:
+            return text
+        return _non_ascii.sub(_escape, text)
+
+    def loads(self, content):
+        try:
+            return self._loads(content)
+        except ValueError:
+            return self._standard.loads(content)
+
+
+_backends = {
+    StandardBackend.name: StandardBackend,
+    OrjsonBackend.name: OrjsonBackend,
+}
+_non_ascii = compile(r"[^\x00-\x7f]")
+backend = None
+
+
+def set_backend(name=None):
+    """# Select the JSON backend
+    Selects the library used to encode request bodies and response builder answers and to decode
+    API responses, webhooks and authorizations.
+    By default, the native "orjson" backend is used when the orjson package is installed,
+    falling back to the standard library "json" backend otherwise.
+    Signature verification always normalizes content with the standard library.
+    ## Parameters (optional):
+    - name [string or object, default None]: backend name, or any object with dumps(data) and loads(content) methods. Options: "orjson", "json" or None to pick the fastest one installed
+    ## Return:
+    - selected backend
+    """
+    global backend
+    if name is None:
+        try:
+            selected = OrjsonBackend()
+        except ImportError:
+            selected = StandardBackend()
+    elif hasattr(name, "dumps"):
+        selected = name
+    else:
+        selected = _backends[name]()
+    backend = selected
+    return backend
+
+
+def dumps(data):
+    """# Encode JSON
+    ## Parameters (required):
+    - data [dictionary or list]: data to be encoded.
+    ## Return:
+    - JSON string with non-ASCII characters escaped
+    """
+    return (backend or set_backend()).dumps(data)
+
+
+def loads(content):
+    """# Decode JSON
+    ## Parameters (required):
+    - content [string or bytes]: JSON content. Control characters are accepted inside strings.
+    ## Return:
+    - decoded data
+    """
+    return (backend or set_backend()).loads(content)
+
+
+def _escape(match):
+    code = ord(match.group())
+    if code > 0xffff:
+        code -= 0x10000
+        return "\\u{high:04x}\\u{low:04x}".format(high=0xd800 | (code >> 10), low=0xdc00 | (code & 0x3ff))
+    return "\\u{code:04x}".format(code=code)
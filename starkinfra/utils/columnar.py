@@ -0,0 +1,245 @@
+from datetime import datetime, date
+
+try:
+    _strings = (basestring,)
+except NameError:
+    _strings = (str,)
+
+
+class Dictionary:
+    """# Dictionary object
+    Dictionary-encoded column of strings, such as status or source. Each value is stored as an integer code
+    pointing to its position in the categories, so comparisons and group-bys run over integer arrays.
+    Codes are kept stable across all batches of the same stream, so later batches only append new categories.
+    ## Attributes:
+    - codes [numpy.ndarray of int32]: position of each value in categories, or -1 for None values
+    - categories [numpy.ndarray of strings]: distinct values in order of first appearance
+    """
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes)
+
+    def code(self, value):
+        """# Get the code of a category
+        ## Parameters (required):
+        - value [string]: category to be searched. ex: "approved"
+        ## Return:
+        - integer code of the category, or -1 if it is not present
+        """
+        for index, category in enumerate(self.categories):
+            if category == value:
+                return index
+        return -1
+
+    def decode(self):
+        """# Decode the column
+        ## Return:
+        - numpy.ndarray of objects with the original strings and None values
+        """
+        numpy = _numpy()
+        categories = numpy.append(self.categories.astype(object), None)
+        return categories[self.codes]
+
+    def __str__(self):
+        return "Dictionary(length={length}, categories={categories})".format(
+            length=len(self.codes),
+            categories=len(self.categories),
+        )
+
+
+def batches(entities, fields, size=10000, categorical=None):
+    """# Convert entities into column batches
+    Consumes any iterable of entities, such as the generator returned by a query function, and yields its
+    attributes as columns of up to size rows. Integers become int64 arrays, floats become float64 arrays,
+    datetimes become datetime64[us] arrays in UTC and dates become datetime64[D] arrays. Integer columns holding
+    None values are converted to float64 with NaN and None datetimes become NaT. Strings are dictionary-encoded
+    and any other value, such as lists and dictionaries, is kept in object arrays.
+    Each column type is defined by its first non-None value.
+    ## Parameters (required):
+    - entities [iterable of objects or dictionaries]: entities to be converted. ex: starkinfra.issuingtransaction.query(after="2023-01-01")
+    - fields [list of strings]: attributes to be converted. ex: ["amount", "balance", "source", "created"]
+    ## Parameters (optional):
+    - size [integer, default 10000]: maximum number of rows in each batch. ex: 50000
+    - categorical [list of strings, default None]: string fields to be dictionary-encoded. Other string fields are kept in unicode arrays. Defaults to all string fields except id. ex: ["status", "source"]
+    ## Return:
+    - generator of dictionaries of field names to numpy.ndarray or Dictionary objects
+    """
+    numpy = _numpy()
+    columns = [_Column(field, categorical) for field in fields]
+    rows = []
+    for entity in entities:
+        rows.append(entity)
+        if len(rows) >= size:
+            yield _batch(numpy, columns, rows)
+            rows = []
+    if rows:
+        yield _batch(numpy, columns, rows)
+
+
+def columns(entities, fields, categorical=None):
+    """# Convert entities into columns
+    Same as batches, but all entities are merged into a single array per field.
+    ## Parameters (required):
+    - entities [iterable of objects or dictionaries]: entities to be converted. ex: starkinfra.issuingtransaction.query(after="2023-01-01")
+    - fields [list of strings]: attributes to be converted. ex: ["amount", "balance", "source", "created"]
+    ## Parameters (optional):
+    - categorical [list of strings, default None]: string fields to be dictionary-encoded. Defaults to all string fields except id. ex: ["status", "source"]
+    ## Return:
+    - dictionary of field names to numpy.ndarray or Dictionary objects
+    """
+    return _concatenate(fields, batches(entities, fields, categorical=categorical))
+
+
+def save(file, entities, fields, categorical=None, compressed=False):
+    """# Save entities into a .npz file
+    Dictionary-encoded fields are stored as "<field>.codes" and "<field>.categories" arrays.
+    ## Parameters (required):
+    - file [string or file object]: path or file where the columns are written. ex: "transactions.npz"
+    - entities [iterable of objects or dictionaries]: entities to be saved. ex: starkinfra.issuingtransaction.query(after="2023-01-01")
+    - fields [list of strings]: attributes to be saved. ex: ["amount", "balance", "source", "created"]
+    ## Parameters (optional):
+    - categorical [list of strings, default None]: string fields to be dictionary-encoded. Defaults to all string fields except id. ex: ["status", "source"]
+    - compressed [bool, default False]: if True, the file is compressed with zip deflate.
+    ## Return:
+    - dictionary of field names to the saved numpy.ndarray or Dictionary objects
+    """
+    numpy = _numpy()
+    result = columns(entities, fields, categorical=categorical)
+    arrays = {}
+    for field, column in result.items():
+        if isinstance(column, Dictionary):
+            arrays[field + ".codes"] = column.codes
+            arrays[field + ".categories"] = column.categories
+        else:
+            arrays[field] = column
+    (numpy.savez_compressed if compressed else numpy.savez)(file, **arrays)
+    return result
+
+
+def load(file, allow_pickle=False):
+    """# Load columns from a .npz file
+    ## Parameters (required):
+    - file [string or file object]: path or file written by save. ex: "transactions.npz"
+    ## Parameters (optional):
+    - allow_pickle [bool, default False]: if True, object columns such as lists are loaded. Only use it on trusted files.
+    ## Return:
+    - dictionary of field names to numpy.ndarray or Dictionary objects
+    """
+    numpy = _numpy()
+    result = {}
+    with numpy.load(file, allow_pickle=allow_pickle) as arrays:
+        for name in arrays.files:
+            if name.endswith(".categories"):
+                continue
+            if name.endswith(".codes"):
+                field = name[:-len(".codes")]
+                result[field] = Dictionary(codes=arrays[name], categories=arrays[field + ".categories"])
+                continue
+            result[name] = arrays[name]
+    return result
+
+
+class _Column:
+
+    def __init__(self, field, categorical):
+        self.field = field
+        self.categorical = field != "id" if categorical is None else field in categorical
+        self.kind = None
+        self.categories = {}
+        self.values = []
+
+    def extract(self, rows):
+        field = self.field
+        return [row.get(field) if isinstance(row, dict) else getattr(row, field) for row in rows]
+
+    def array(self, numpy, rows):
+        values = self.extract(rows)
+        if self.kind is None:
+            self.kind = next((_kind(value) for value in values if value is not None), None)
+        if self.kind == "int":
+            if None in values:
+                return numpy.array([numpy.nan if value is None else value for value in values], dtype="float64")
+            return numpy.array(values, dtype="int64")
+        if self.kind == "float":
+            return numpy.array([numpy.nan if value is None else value for value in values], dtype="float64")
+        if self.kind == "bool" and None not in values:
+            return numpy.array(values, dtype="bool")
+        if self.kind == "datetime":
+            return numpy.array([_utc(value) for value in values], dtype="datetime64[us]")
+        if self.kind == "date":
+            return numpy.array(values, dtype="datetime64[D]")
+        if self.kind == "str" and self.categorical:
+            return self.encode(numpy, values)
+        if self.kind == "str" and None not in values:
+            return numpy.array(values, dtype="U")
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    def encode(self, numpy, values):
+        categories = self.categories
+        for value in values:
+            if value is not None and value not in categories:
+                categories[value] = len(categories)
+                self.values.append(value)
+        codes = numpy.array([-1 if value is None else categories[value] for value in values], dtype="int32")
+        return Dictionary(codes=codes, categories=numpy.array(self.values, dtype="U"))
+
+
+def _batch(numpy, columns, rows):
+    return {column.field: column.array(numpy, rows) for column in columns}
+
+
+def _concatenate(fields, batches):
+    numpy = _numpy()
+    batches = list(batches)
+    result = {}
+    for field in fields:
+        columns = [batch[field] for batch in batches]
+        if not columns:
+            result[field] = numpy.array([], dtype=object)
+        elif isinstance(columns[-1], Dictionary):
+            result[field] = Dictionary(
+                codes=numpy.concatenate([column.codes for column in columns]),
+                categories=columns[-1].categories,
+            )
+        else:
+            result[field] = numpy.concatenate(columns)
+    return result
+
+
+def _kind(value):
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, _strings):
+        return "str"
+    return "object"
+
+
+def _utc(value):
+    if value is None:
+        return None
+    offset = value.utcoffset()
+    if offset is None:
+        return value
+    return (value - offset).replace(tzinfo=None)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for columnar exports. Install it with: pip install starkinfra[columnar]")
+    return numpy
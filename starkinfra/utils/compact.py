@@ -0,0 +1,175 @@
+from sys import version_info
+from inspect import getmro
+from starkcore.utils.resource import Resource
+from starkcore.utils.subresource import SubResource
+from .lazy import storages
+
+
+# Python 2 checks the class of self in calls such as Resource.__init__(self), which rejects slot-based objects
+_unbound_methods = version_info < (3,)
+
+
+class CompactSubResource(object):
+    """# CompactSubResource object
+    Base of the slot-based versions of SubResource classes built by compact_class().
+    Compact objects hold no per-instance __dict__, keeping the same attributes, str and repr of the original class.
+    """
+
+    __slots__ = ()
+    __str__ = getattr(SubResource.__str__, "__func__", SubResource.__str__)
+    __repr__ = getattr(SubResource.__repr__, "__func__", SubResource.__repr__)
+
+    def __reduce__(self):
+        return _rebuild, (self._original, {slot: getattr(self, slot) for slot in self.__slots__})
+
+
+class CompactResource(CompactSubResource):
+    """# CompactResource object
+    Base of the slot-based versions of Resource classes built by compact_class().
+    """
+
+    __slots__ = ()
+    __repr__ = getattr(Resource.__repr__, "__func__", Resource.__repr__)
+
+
+_classes = {}
+
+
+def compact_class(cls):
+    """# Get the compact version of a resource class
+    Builds, once per class, a slot-based class with the same name, constructor, attributes, str and repr of the
+    original one, so each instance uses a fraction of the memory of a regular object.
+    Compact objects are not instances of the original class.
+    ## Parameters (required):
+    - cls [class]: SubResource or Resource class. ex: starkinfra.PixRequest
+    ## Return:
+    - compact class
+    """
+    compact = _classes.get(cls)
+    if compact is None:
+        compact = _classes[cls] = _build(cls)
+    return compact
+
+
+def compact(entity):
+    """# Convert an object to its compact version
+    Nested SubResource objects and lists of them are converted as well.
+    ## Parameters (required):
+    - entity [SubResource object]: object to be converted. ex: PixRequest(...)
+    ## Return:
+    - compact object
+    """
+    if isinstance(entity, list):
+        return [compact(item) for item in entity]
+    if isinstance(entity, CompactSubResource):
+        for slot in entity.__slots__:
+            value = getattr(entity, slot)
+            if isinstance(value, (SubResource, list)):
+                setattr(entity, slot, compact(value))
+        return entity
+    if not isinstance(entity, SubResource):
+        return entity
+    return _rebuild(entity.__class__, {key: compact(value) for key, value in vars(entity).items()})
+
+
+def from_api_json(resource, json):
+    """# Decode an API json into a compact object
+    ## Parameters (required):
+    - resource [dictionary]: resource description with "class" and "name" keys, as used by rest functions.
+    - json [dictionary]: entity json returned by the API.
+    ## Return:
+    - compact object
+    """
+    from .api import decoder
+
+    return compact(decoder(compact_class(resource["class"]), resource["name"])(json))
+
+
+def _build(cls):
+    namespace = {}
+    for base in reversed(getmro(cls)):
+        if base in (object, SubResource, Resource):
+            continue
+        namespace.update(vars(base))
+    for name in ["__dict__", "__weakref__", "__module__", "__qualname__"]:
+        namespace.pop(name, None)
+
+    slots = _attributes(cls.__init__)
+    if issubclass(cls, Resource):
+        slots.add("id")
+    lazy = storages(cls)
+    slots = (slots - set(lazy)) | set(lazy.values())
+    for slot in slots:
+        namespace.pop(slot, None)
+
+    namespace["__slots__"] = tuple(sorted(slots))
+    namespace["__module__"] = cls.__module__
+    if _unbound_methods:
+        namespace["__init__"] = _initializer(cls)
+    namespace["_original"] = cls
+    base = CompactResource if issubclass(cls, Resource) else CompactSubResource
+    return type(cls.__name__, (base,), namespace)
+
+
+def _initializer(cls):
+    init = cls.__init__
+
+    def __init__(self, *args, **kwargs):
+        entity = blank(cls)
+        init(entity, *args, **kwargs)
+        for name, value in vars(entity).items():
+            object.__setattr__(self, name, value)
+
+    return __init__
+
+
+def blank(cls):
+    """# Create an instance without calling its constructor
+    ## Parameters (required):
+    - cls [class]: SubResource or Resource class, including Python 2 old-style classes. ex: starkinfra.PixRequest
+    ## Return:
+    - uninitialized instance of the class
+    """
+    if isinstance(cls, type):
+        return cls.__new__(cls)
+    from types import InstanceType
+
+    return InstanceType(cls)
+
+
+def _attributes(function):
+    code = getattr(function, "__func__", function).__code__
+    try:
+        from dis import get_instructions
+    except ImportError:
+        return _stored_attributes(code)
+
+    return {
+        instruction.argval for instruction in get_instructions(code)
+        if instruction.opname == "STORE_ATTR"
+    }
+
+
+def _stored_attributes(code):
+    from dis import opmap, HAVE_ARGUMENT
+
+    attributes = set()
+    bytecode = bytearray(code.co_code)
+    index = 0
+    while index < len(bytecode):
+        operation = bytecode[index]
+        if operation < HAVE_ARGUMENT:
+            index += 1
+            continue
+        if operation == opmap["STORE_ATTR"]:
+            attributes.add(code.co_names[bytecode[index + 1] | bytecode[index + 2] << 8])
+        index += 3
+    return attributes
+
+
+def _rebuild(cls, state):
+    compact = compact_class(cls)
+    entity = compact.__new__(compact)
+    for slot, value in state.items():
+        setattr(entity, slot, value)
+    return entity
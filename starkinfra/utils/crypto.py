@@ -0,0 +1,145 @@
+from base64 import b64encode, b64decode
+from ellipticcurve import Ecdsa, PrivateKey, PublicKey, Signature
+
+
+class EllipticCurveBackend:
+    """# Pure-Python ECDSA backend
+    Signs and verifies messages with the starkbank-ecdsa library, which is always available.
+    """
+
+    name = "ellipticcurve"
+
+    def private_key(self, pem):
+        return PrivateKey.fromPem(pem)
+
+    def public_key(self, pem):
+        return PublicKey.fromPem(pem)
+
+    def sign(self, message, private_key):
+        return Ecdsa.sign(message=message, privateKey=private_key).toBase64()
+
+    def signature(self, base64):
+        return Signature.fromBase64(base64)
+
+    def verify(self, message, signature, public_key):
+        return Ecdsa.verify(message=message, signature=signature, publicKey=public_key)
+
+
+class CryptographyBackend:
+    """# Native ECDSA backend
+    Signs and verifies messages with OpenSSL through the cryptography library, when it is installed.
+    """
+
+    name = "cryptography"
+
+    def __init__(self):
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, utils
+
+        self._invalid_signature = InvalidSignature
+        self._serialization = serialization
+        self._derive_private_key = ec.derive_private_key
+        self._curves = {"secp256k1": ec.SECP256K1, "prime256v1": ec.SECP256R1}
+        self._decode_signature = utils.decode_dss_signature
+        self._algorithm = ec.ECDSA(hashes.SHA256())
+
+    def private_key(self, pem):
+        # starkbank-ecdsa encodes the secret without leading zeros, which OpenSSL rejects when loading the pem,
+        # so the key is rebuilt from its secret
+        private_key = PrivateKey.fromPem(pem)
+        return self._derive_private_key(private_key.secret, self._curves[private_key.curve.name]())
+
+    def public_key(self, pem):
+        return self._serialization.load_pem_public_key(pem.encode("utf-8"))
+
+    def sign(self, message, private_key):
+        return b64encode(private_key.sign(message.encode("utf-8"), self._algorithm)).decode("utf-8")
+
+    def signature(self, base64):
+        der = b64decode(base64, validate=True)
+        self._decode_signature(der)
+        return der
+
+    def verify(self, message, signature, public_key):
+        try:
+            public_key.verify(signature, message.encode("utf-8"), self._algorithm)
+        except self._invalid_signature:
+            return False
+        return True
+
+
+_backends = {
+    EllipticCurveBackend.name: EllipticCurveBackend,
+    CryptographyBackend.name: CryptographyBackend,
+}
+_private_keys = {}
+_public_keys = {}
+backend = None
+
+
+def set_backend(name=None):
+    """# Select the ECDSA backend
+    Selects the library used to sign requests and verify Stark Infra signatures.
+    By default, the native "cryptography" backend is used when the cryptography package is installed,
+    falling back to the pure-Python "ellipticcurve" backend otherwise.
+    ## Parameters (optional):
+    - name [string, default None]: backend name. Options: "cryptography", "ellipticcurve" or None to pick the fastest one installed
+    ## Return:
+    - selected backend
+    """
+    global backend
+    if name is None:
+        try:
+            selected = CryptographyBackend()
+        except ImportError:
+            selected = EllipticCurveBackend()
+    else:
+        selected = _backends[name]()
+    backend = selected
+    _private_keys.clear()
+    _public_keys.clear()
+    return backend
+
+
+def sign(message, pem):
+    """# Sign a message with a private key
+    ## Parameters (required):
+    - message [string]: message to be signed.
+    - pem [string]: private key in pem format.
+    ## Return:
+    - base-64 DER signature
+    """
+    private_key = _private_keys.get(pem)
+    if private_key is None:
+        private_key = _private_keys[pem] = _backend().private_key(pem)
+    return _backend().sign(message, private_key)
+
+
+def signature(base64):
+    """# Parse a signature
+    ## Parameters (required):
+    - base64 [string]: base-64 DER signature.
+    ## Return:
+    - signature object accepted by verify()
+    """
+    return _backend().signature(base64)
+
+
+def verify(message, signature, pem):
+    """# Verify a message signature with a public key
+    ## Parameters (required):
+    - message [string]: signed message.
+    - signature [object]: signature parsed by signature().
+    - pem [string]: public key in pem format.
+    ## Return:
+    - True if the signature matches the message and the public key
+    """
+    public_key = _public_keys.get(pem)
+    if public_key is None:
+        public_key = _public_keys[pem] = _backend().public_key(pem)
+    return _backend().verify(message, signature, public_key)
+
+
+def _backend():
+    return backend or set_backend()
@@ -0,0 +1,53 @@
+from bisect import bisect_left
+from threading import Lock
+
+
+class Histogram:
+    """# Histogram object
+    Counts latency observations in cumulative-friendly buckets, so they can be exported to any metrics system.
+    ## Parameters (optional):
+    - bounds [list of floats, default None]: upper bounds in seconds of each bucket. An extra bucket holds larger observations. ex: [0.1, 0.5, 1]
+    ## Attributes:
+    - bounds [list of floats]: upper bounds in seconds of each bucket
+    - counts [list of integers]: number of observations in each bucket, plus a last one for observations above the largest bound
+    - count [integer]: total number of observations
+    - sum [float]: sum of all observed values in seconds
+    """
+
+    default_bounds = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 1.5, 2, 5]
+
+    def __init__(self, bounds=None):
+        self.bounds = sorted(bounds or self.default_bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self.counts[bisect_left(self.bounds, seconds)] += 1
+            self.count += 1
+            self.sum += seconds
+
+    def quantile(self, q):
+        """# Estimate a quantile
+        ## Parameters (required):
+        - q [float]: quantile between 0 and 1. ex: 0.99
+        ## Return:
+        - upper bound in seconds of the bucket holding the quantile, or None if it is above the largest bound
+        """
+        with self._lock:
+            target = q * self.count
+            seen = 0
+            for bound, count in zip(self.bounds, self.counts):
+                seen += count
+                if count and seen >= target:
+                    return bound
+        return None
+
+    def __str__(self):
+        return "Histogram(count={count}, sum={sum:.6f}, buckets={buckets})".format(
+            count=self.count,
+            sum=self.sum,
+            buckets=dict(zip(self.bounds + ["+Inf"], self.counts)),
+        )
@@ -0,0 +1,167 @@
+from time import time
+from threading import Lock
+from collections import OrderedDict
+
+
+class MemoryStore:
+    """# MemoryStore object
+    Keeps the ids of the most recently processed entities, such as Events, in memory, so repeated deliveries can be skipped.
+    When the store is full, the least recently used ids are dropped.
+    Any object with the same seen(id), mark(id) and flush() methods can be used as an idempotency store.
+    ## Parameters (optional):
+    - size [integer, default 100000]: maximum number of ids kept. ex: 1000000
+    """
+
+    def __init__(self, size=100000):
+        self.size = size
+
+        self._lock = Lock()
+        self._ids = OrderedDict()
+
+    def seen(self, id):
+        """# Check if an id was processed
+        ## Parameters (required):
+        - id [string]: entity id. ex: "5656565656565656"
+        ## Return:
+        - True if the id was marked as processed
+        """
+        with self._lock:
+            if id not in self._ids:
+                return False
+            self._ids[id] = self._ids.pop(id)
+            return True
+
+    def mark(self, id):
+        """# Mark an id as processed
+        ## Parameters (required):
+        - id [string]: entity id. ex: "5656565656565656"
+        """
+        with self._lock:
+            self._ids.pop(id, None)
+            self._ids[id] = True
+            while len(self._ids) > self.size:
+                self._ids.popitem(last=False)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SqliteStore:
+    """# SqliteStore object
+    Keeps the ids of processed entities, such as Events, in a SQLite database, so repeated deliveries are skipped
+    even after restarts. Recently used ids are also kept in a MemoryStore tier, so most checks never reach the database.
+    Marked ids are written in batches of commit_size ids, or once commit_delay seconds have passed since the first
+    pending one, so marking usually costs no database round trip. Ids still pending when the process crashes are
+    not stored, so their entities may be processed again.
+    ## Parameters (required):
+    - path [string]: path of the SQLite database file, created if needed. ex: "events.sqlite3"
+    ## Parameters (optional):
+    - size [integer, default 100000]: maximum number of ids kept in the memory tier. ex: 1000000
+    - commit_size [integer, default 100]: number of pending ids that triggers a commit. ex: 500
+    - commit_delay [float, default 1]: maximum number of seconds ids stay pending before the next mark commits them. ex: 0.5
+    - table [string, default "processed"]: name of the table holding the ids. ex: "events"
+    """
+
+    def __init__(self, path, size=100000, commit_size=100, commit_delay=1, table="processed"):
+        import sqlite3
+
+        self.path = path
+        self.commit_size = commit_size
+        self.commit_delay = commit_delay
+        self.table = table
+
+        self._lock = Lock()
+        self._memory = MemoryStore(size=size)
+        self._pending = []
+        self._pending_ids = set()
+        self._deadline = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "create table if not exists {table} (id text primary key, marked real not null)".format(table=table)
+        )
+        self._connection.commit()
+
+    def seen(self, id):
+        """# Check if an id was processed
+        ## Parameters (required):
+        - id [string]: entity id. ex: "5656565656565656"
+        ## Return:
+        - True if the id was marked as processed
+        """
+        if self._memory.seen(id):
+            return True
+        with self._lock:
+            if id in self._pending_ids:
+                return True
+            row = self._connection.execute(
+                "select 1 from {table} where id = ?".format(table=self.table), (id,)
+            ).fetchone()
+        if row is None:
+            return False
+        self._memory.mark(id)
+        return True
+
+    def mark(self, id):
+        """# Mark an id as processed
+        ## Parameters (required):
+        - id [string]: entity id. ex: "5656565656565656"
+        """
+        self._memory.mark(id)
+        with self._lock:
+            self._pending.append((id, time()))
+            self._pending_ids.add(id)
+            if self._deadline is None:
+                self._deadline = time() + self.commit_delay
+            if len(self._pending) >= self.commit_size or time() >= self._deadline:
+                self._commit()
+
+    def flush(self):
+        """# Commit pending ids
+        Writes every pending id to the database.
+        """
+        with self._lock:
+            self._commit()
+
+    def prune(self, age):
+        """# Drop old ids
+        Deletes from the database the ids marked more than age seconds ago, such as ids of Events that
+        can no longer be delivered again.
+        ## Parameters (required):
+        - age [float]: age in seconds of the oldest ids kept. ex: 604800
+        ## Return:
+        - number of deleted ids
+        """
+        with self._lock:
+            self._commit()
+            cursor = self._connection.execute(
+                "delete from {table} where marked < ?".format(table=self.table), (time() - age,)
+            )
+            self._connection.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """# Close the store
+        Commits pending ids and closes the database connection.
+        """
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def _commit(self):
+        if self._pending:
+            self._connection.executemany(
+                "insert or ignore into {table} (id, marked) values (?, ?)".format(table=self.table), self._pending
+            )
+            self._connection.commit()
+        self._pending = []
+        self._pending_ids = set()
+        self._deadline = None
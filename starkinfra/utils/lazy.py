@@ -0,0 +1,103 @@
+from inspect import getmro
+
+try:
+    _strings = (basestring,)
+except NameError:
+    _strings = (str,)
+
+
+class Lazy(object):
+    """# Lazy attribute descriptor
+    Keeps the value assigned to an attribute as received and only parses it on first access, caching the result.
+    Values that are already parsed are stored as they are. The raw value is kept in the same attribute name prefixed by "_".
+    ## Parameters (required):
+    - parse [function]: function receiving the raw value and returning the parsed one.
+    ## Parameters (optional):
+    - requires [list of strings, default []]: other attributes read while parsing, which projections keep along with this one. ex: ["subscription"]
+    """
+
+    types = ()
+
+    def __init__(self, parse, requires=()):
+        self.parse = parse
+        self.requires = tuple(requires)
+        self.storage = None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        storage = self._storage(type(instance))
+        value = getattr(instance, storage)
+        if isinstance(value, self.types):
+            value = self._parse(value, instance)
+            setattr(instance, storage, value)
+        return value
+
+    def __set__(self, instance, value):
+        if not isinstance(value, self.types):
+            value = self._parse(value, instance)
+        setattr(instance, self._storage(type(instance)), value)
+
+    def _parse(self, value, instance):
+        return self.parse(value)
+
+    def _storage(self, owner):
+        if self.storage is None:
+            for cls in getmro(owner):
+                for name, value in vars(cls).items():
+                    if value is self:
+                        self.storage = "_" + name
+        return self.storage
+
+
+class LazyDatetime(Lazy):
+    """# Lazy datetime descriptor
+    Keeps datetime strings received from the API and only parses them on first access.
+    ## Parameters (required):
+    - parse [function]: check function used on the raw value. ex: check_datetime
+    """
+
+    types = _strings
+
+
+class LazyEntity(Lazy):
+    """# Lazy entity descriptor
+    Keeps nested entity jsons received from the API and only decodes them on first access.
+    Values that are not dictionaries, such as objects created by the user, are stored as they are.
+    ## Parameters (required):
+    - resource [dictionary or function]: resource description of the nested entity, or function receiving the parent object and returning it. If it returns None, the json is kept.
+    ## Parameters (optional):
+    - requires [list of strings, default []]: attributes of the parent object read by the resource function. ex: ["subscription"]
+    """
+
+    types = (dict,)
+
+    def __init__(self, resource, requires=()):
+        Lazy.__init__(self, parse=None, requires=requires)
+        self.resource = resource
+
+    def _parse(self, value, instance):
+        if not isinstance(value, dict):
+            return value
+        resource = self.resource(instance) if callable(self.resource) else self.resource
+        if resource is None:
+            return value
+        from . import api, compact
+        if isinstance(instance, compact.CompactSubResource):
+            return compact.from_api_json(resource, value)
+        return api.from_api_json(resource, value)
+
+
+def storages(cls):
+    """# List lazy attributes of a class
+    ## Parameters (required):
+    - cls [class]: class holding Lazy descriptors.
+    ## Return:
+    - dictionary of attribute names to the names where their raw values are stored
+    """
+    return {
+        name: value._storage(cls)
+        for base in getmro(cls)
+        for name, value in vars(base).items()
+        if isinstance(value, Lazy)
+    }
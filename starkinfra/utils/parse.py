@@ -1,6 +1,118 @@
+import starkinfra
+from json import loads, dumps
+from starkcore.error import InvalidSignatureError
+from .api import from_api_json
 from .relay import set_relay
-from starkcore.utils import parse
+from . import crypto, publickey, codec, parsecache
 
 
-parse_and_verify = set_relay(parse.parse_and_verify)
-verify = set_relay(parse.verify)
+def _parse_and_verify(content, signature, sdk_version, api_version, host, resource, user, language, timeout, key=None):
+    cached = None
+    verified = None
+    if starkinfra.parse_cache_size:
+        cached = parsecache._key(host, user, resource, key, content, signature)
+        verified = parsecache._get(cached)
+
+    if verified is None:
+        verified = _verify(content, signature, sdk_version, api_version, host, user, language, timeout)
+        if cached is not None:
+            parsecache._set(cached, verified)
+
+    json = codec.loads(verified)
+    if key:
+        json = json[key]
+    return from_api_json(resource=resource, json=json)
+
+
+def _parse_many_and_verify(items, sdk_version, api_version, host, resource, user, language, timeout, key=None, workers=None):
+    items = [tuple(item) for item in items]
+    public_key = publickey._get(
+        sdk_version=sdk_version,
+        host=host,
+        api_version=api_version,
+        user=user,
+        language=language,
+        timeout=timeout,
+    )
+    checks = [(content, signature, public_key) for content, signature in items]
+
+    if workers == 1 or len(items) < 2:
+        valid = [_is_delivery_valid(check) for check in checks]
+    else:
+        from os import cpu_count
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            valid = list(executor.map(_is_delivery_valid, checks, chunksize=max(len(checks) // (workers * 4), 1)))
+
+    entities = []
+    for (content, signature), is_valid in zip(items, valid):
+        if not is_valid:
+            entities.append(_parse_and_verify(content, signature, sdk_version, api_version, host, resource, user, language, timeout, key=key))
+            continue
+        json = codec.loads(content)
+        if key:
+            json = json[key]
+        entities.append(from_api_json(resource=resource, json=json))
+    return entities
+
+
+def _is_delivery_valid(check):
+    content, signature, public_key = check
+    try:
+        signature = crypto.signature(signature)
+    except:
+        return False
+    return _is_signature_valid(content=content, signature=signature, public_key=public_key)
+
+
+def _verify(content, signature, sdk_version, api_version, host, user, language, timeout):
+    try:
+        signature = crypto.signature(signature)
+    except:
+        raise InvalidSignatureError("The provided signature is not valid")
+
+    public_key = publickey._get(
+        sdk_version=sdk_version,
+        host=host,
+        api_version=api_version,
+        user=user,
+        language=language,
+        timeout=timeout,
+    )
+    if _is_signature_valid(content=content, signature=signature, public_key=public_key):
+        return content
+
+    public_key = publickey._refresh(
+        sdk_version=sdk_version,
+        host=host,
+        api_version=api_version,
+        user=user,
+        language=language,
+        timeout=timeout,
+        rejected=public_key,
+    )
+    if _is_signature_valid(content=content, signature=signature, public_key=public_key):
+        return content
+
+    raise InvalidSignatureError("The provided signature and content do not match the public key")
+
+
+def _is_signature_valid(content, signature, public_key):
+    if crypto.verify(message=content, signature=signature, pem=public_key):
+        return True
+
+    try:
+        normalized = dumps(loads(content), sort_keys=True)
+    except:
+        return False
+
+    if crypto.verify(message=normalized, signature=signature, pem=public_key):
+        return True
+    return False
+
+
+parse_and_verify = set_relay(_parse_and_verify)
+parse_many_and_verify = set_relay(_parse_many_and_verify)
+verify = set_relay(_verify)
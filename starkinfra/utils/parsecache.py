@@ -0,0 +1,66 @@
+from time import time
+from hashlib import sha256
+from threading import Lock
+from collections import OrderedDict
+import starkinfra
+
+
+_lock = Lock()
+_entries = OrderedDict()
+_counts = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+
+def stats():
+    """# Get the verified-delivery cache metrics
+    Deliveries retried by Stark Infra carry the same content and signature, so parse functions can skip
+    the signature verification of contents already verified when starkinfra.parse_cache_size is above 0.
+    A new object is decoded on every delivery, so changes made to a parsed object never reach the next ones.
+    ## Return:
+    - dictionary with the number of "hits", "misses", "evictions" (least recently used entries dropped to respect the size),
+      "expirations" (entries dropped after starkinfra.parse_cache_ttl seconds), the current "size" and the "capacity"
+    """
+    with _lock:
+        return dict(_counts, size=len(_entries), capacity=starkinfra.parse_cache_size)
+
+
+def clear():
+    """# Clear the verified-delivery cache
+    Drops every cached content and resets the metrics.
+    """
+    with _lock:
+        _entries.clear()
+        for name in _counts:
+            _counts[name] = 0
+
+
+def _key(host, user, resource, key, content, signature):
+    digest = sha256(u"{content}\n{signature}".format(content=content, signature=signature).encode("utf-8")).digest()
+    return host, user.environment if user else None, resource["name"], key, digest
+
+
+def _get(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            _counts["misses"] += 1
+            return None
+        content, expiration = entry
+        if expiration is not None and expiration < time():
+            del _entries[key]
+            _counts["expirations"] += 1
+            _counts["misses"] += 1
+            return None
+        _entries[key] = _entries.pop(key)
+        _counts["hits"] += 1
+        return content
+
+
+def _set(key, content):
+    size = starkinfra.parse_cache_size
+    ttl = starkinfra.parse_cache_ttl
+    with _lock:
+        _entries.pop(key, None)
+        _entries[key] = (content, time() + ttl if ttl is not None else None)
+        while len(_entries) > size:
+            _entries.popitem(last=False)
+            _counts["evictions"] += 1
@@ -0,0 +1,70 @@
+from threading import Thread, Event
+
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
+
+
+_end = object()
+
+
+def prefetch(iterator, depth):
+    """# Consume an iterator in the background
+    Iterates over the given iterator in a daemon thread, keeping up to 'depth' items ready in a bounded buffer
+    while the caller is still consuming the previous ones. Exceptions raised by the iterator are re-raised to the caller.
+    The background thread stops as soon as the returned generator is exhausted or closed.
+    ## Parameters (required):
+    - iterator [iterator]: iterator to be consumed in the background, such as the pages of a query.
+    - depth [integer]: maximum number of items fetched ahead of the caller. ex: 2
+    ## Return:
+    - generator of the iterator items, in the same order
+    """
+    buffer, stop = Queue(maxsize=depth), Event()
+
+    thread = Thread(target=feed, args=(iterator, buffer, stop))
+    thread.daemon = True
+    thread.start()
+
+    return drain(buffer, stop)
+
+
+def feed(iterator, buffer, stop):
+    """# Move the items of an iterator into a bounded buffer
+    Blocks while the buffer is full and gives up as soon as 'stop' is set.
+    The end of the iterator, or the exception it raised, is signaled to drain().
+    """
+    try:
+        for item in iterator:
+            if not _put(buffer, (item, None), stop):
+                return
+    except Exception as exception:
+        _put(buffer, (_end, exception), stop)
+        return
+    _put(buffer, (_end, None), stop)
+
+
+def drain(buffer, stop):
+    """# Yield the items put in a buffer by feed()
+    Sets 'stop' when exhausted or closed, releasing the feeding side.
+    """
+    try:
+        while True:
+            item, exception = buffer.get()
+            if item is _end:
+                if exception is not None:
+                    raise exception
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _put(buffer, item, stop):
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
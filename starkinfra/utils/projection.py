@@ -0,0 +1,222 @@
+from starkcore.utils.case import snake_to_camel
+from starkcore.utils.resource import Resource
+from .compact import CompactSubResource, CompactResource, _attributes, _unbound_methods, blank
+from .lazy import storages
+
+
+class _Projection(object):
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if name not in self._allowed:
+            raise self._missing(name)
+        object.__setattr__(self, name, value)
+
+    def __getattr__(self, name):
+        raise self._missing(name)
+
+    def _missing(self, name):
+        if name in self._attributes:
+            return AttributeError(
+                "{classname} attribute '{name}' was not retrieved. Add it to the fields parameter to access it.".format(
+                    classname=self.__class__.__name__,
+                    name=name,
+                )
+            )
+        return AttributeError("'{classname}' object has no attribute '{name}'".format(
+            classname=self.__class__.__name__,
+            name=name,
+        ))
+
+    def __reduce__(self):
+        return _rebuild, (self._original, self._fields, {slot: getattr(self, slot) for slot in self.__slots__})
+
+
+class ProjectionSubResource(_Projection, CompactSubResource):
+    """# ProjectionSubResource object
+    Base of the projected versions of SubResource classes built by projection_class().
+    Projected objects only hold the requested attributes and raise AttributeError when other attributes of the original class are accessed.
+    """
+
+    __slots__ = ()
+
+
+class ProjectionResource(_Projection, CompactResource):
+    """# ProjectionResource object
+    Base of the projected versions of Resource classes built by projection_class().
+    """
+
+    __slots__ = ()
+
+
+_classes = {}
+_decoders = {}
+
+
+def projection_class(cls, fields):
+    """# Get the projected version of a resource class
+    Builds, once per class and fields, a slot-based class with the same name, str and repr of the original one,
+    holding only the requested attributes.
+    Attributes that lazy attributes depend on, such as the subscription of an Event log, are kept as well.
+    ## Parameters (required):
+    - cls [class]: SubResource or Resource class. ex: starkinfra.PixRequest
+    - fields [list of strings]: attributes to be kept. The id attribute of Resource classes is always kept. ex: ["amount", "created"]
+    ## Return:
+    - projected class
+    """
+    fields = set(fields)
+    if issubclass(cls, Resource):
+        fields.add("id")
+    for name in storages(cls):
+        if name in fields:
+            fields.update(getattr(cls, name).requires)
+    fields = tuple(sorted(fields))
+    projection = _classes.get((cls, fields))
+    if projection is None:
+        projection = _classes[(cls, fields)] = _build(cls, fields)
+    return projection
+
+
+def decoder(resource, fields):
+    """# Get the projected decoder of a resource
+    Only constructor parameters feeding the requested attributes are read from the API json,
+    so other attributes are neither decoded nor stored.
+    ## Parameters (required):
+    - resource [dictionary]: resource description with "class" and "name" keys, as used by rest functions.
+    - fields [list of strings]: attributes to be decoded. ex: ["amount", "status", "created"]
+    ## Return:
+    - decoder function receiving an API json and returning the projected object
+    """
+    projection = projection_class(resource["class"], fields)
+    decode = _decoders.get((projection, resource["name"]))
+    if decode is None:
+        from .api import interned_fields
+
+        decode = _decoders[(projection, resource["name"])] = _build_decoder(projection, interned_fields(resource["name"]))
+    return decode
+
+
+def _build(cls, fields):
+    attributes = _attributes(cls.__init__)
+    if issubclass(cls, Resource):
+        attributes.add("id")
+    unknown = sorted(set(fields) - attributes)
+    if unknown:
+        raise ValueError("{classname} has no attributes {unknown}. Available attributes: {attributes}".format(
+            classname=cls.__name__,
+            unknown=", ".join(unknown),
+            attributes=", ".join(sorted(attributes)),
+        ))
+
+    lazy = {name: storage for name, storage in storages(cls).items() if name in fields}
+    slots = (set(fields) - set(lazy)) | set(lazy.values())
+    namespace = {name: getattr(cls, name) for name in lazy}
+    namespace.update({
+        "__slots__": tuple(sorted(slots)),
+        "__module__": cls.__module__,
+        "__init__": _initializer(cls),
+        "_original": cls,
+        "_fields": fields,
+        "_allowed": frozenset(slots) | frozenset(lazy),
+        "_attributes": frozenset(attributes),
+    })
+    base = ProjectionResource if issubclass(cls, Resource) else ProjectionSubResource
+    return type(cls.__name__, (base,), namespace)
+
+
+def _initializer(cls):
+    init = getattr(cls.__init__, "__func__", cls.__init__)
+
+    def __init__(self, *args, **kwargs):
+        probe = _probe(cls)
+        init(probe, *args, **kwargs)
+        for name, value in vars(probe).items():
+            if name in self._allowed:
+                object.__setattr__(self, name, value)
+
+    return __init__
+
+
+def _build_decoder(projection, interned):
+    from .api import intern_string
+
+    cls = projection._original
+    code = cls.__init__.__code__
+    params = code.co_varnames[1:code.co_argcount]
+    sources = _sources(cls, params)
+
+    if all(field in sources for field in projection._fields):
+        keys = tuple(
+            (field, snake_to_camel(sources[field]), sources[field] in interned)
+            for field in projection._fields
+        )
+        new = projection.__new__
+        set_attribute = object.__setattr__
+
+        def decode(json):
+            entity = new(projection)
+            get = json.get
+            for field, key, intern in keys:
+                value = get(key)
+                set_attribute(entity, field, intern_string(value) if intern else value)
+            return entity
+
+        return decode
+
+    keys = tuple(
+        (param, snake_to_camel(param), param in interned) for param in params
+        if param in projection._fields or param not in projection._attributes
+    )
+    defaults = dict((param, None) for param in params)
+
+    def decode(json):
+        get = json.get
+        kwargs = dict(defaults)
+        for param, key, intern in keys:
+            value = get(key)
+            kwargs[param] = intern_string(value) if intern else value
+        return projection(**kwargs)
+
+    return decode
+
+
+def _sources(cls, params):
+    sources = {}
+    for param in params:
+        marker = _Marker()
+        probe = _probe(cls)
+        kwargs = dict((name, None) for name in params)
+        kwargs[param] = marker
+        try:
+            getattr(cls.__init__, "__func__", cls.__init__)(probe, **kwargs)
+        except Exception:
+            continue
+        for attribute, value in vars(probe).items():
+            if value is marker:
+                sources[attribute] = param
+    if issubclass(cls, Resource) and "id" in params:
+        sources["id"] = "id"
+    return sources
+
+
+class _Probe(object):
+    pass
+
+
+def _probe(cls):
+    if _unbound_methods:
+        return blank(cls)
+    return _Probe()
+
+
+class _Marker(object):
+    pass
+
+
+def _rebuild(cls, fields, state):
+    projection = projection_class(cls, fields)
+    entity = projection.__new__(projection)
+    for slot, value in state.items():
+        object.__setattr__(entity, slot, value)
+    return entity
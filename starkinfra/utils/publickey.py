@@ -0,0 +1,112 @@
+from time import time
+from threading import Thread, Lock, Event
+import starkinfra
+from .relay import set_relay
+from .rest import _get_raw
+
+
+_cooldown = 10
+
+
+class _Entry:
+
+    def __init__(self, pem, fetched):
+        self.pem = pem
+        self.fetched = fetched
+
+
+_lock = Lock()
+_entries = {}
+_fetching = {}
+
+
+def preload(user=None):
+    """# Preload the Stark Infra public key
+    Fetches the public key used to verify Stark Infra signatures and stores it in the SDK cache,
+    so the first webhook or authorization received does not wait on a key fetch.
+    The cached key is refreshed in the background once 80% of starkinfra.public_key_ttl seconds have passed.
+    ## Parameters (optional):
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - public key in pem format
+    """
+    return _relayed_refresh(user=user)
+
+
+def clear():
+    """# Clear the Stark Infra public key cache
+    Drops every cached public key, so the next verification fetches it again.
+    """
+    with _lock:
+        _entries.clear()
+
+
+def _get(sdk_version, host, api_version, user, language, timeout):
+    key = _key(host, user)
+    entry = _entries.get(key)
+    if entry is None:
+        return _refresh(sdk_version, host, api_version, user, language, timeout)
+
+    age = time() - entry.fetched
+    ttl = starkinfra.public_key_ttl
+    if ttl is not None and age > ttl:
+        return _refresh(sdk_version, host, api_version, user, language, timeout)
+    if ttl is not None and age > ttl * 0.8 and key not in _fetching:
+        thread = Thread(
+            target=_refresh,
+            args=(sdk_version, host, api_version, user, language, timeout),
+            kwargs={"silent": True},
+        )
+        thread.daemon = True
+        thread.start()
+    return entry.pem
+
+
+def _refresh(sdk_version, host, api_version, user, language, timeout, rejected=None, silent=False):
+    key = _key(host, user)
+    with _lock:
+        entry = _entries.get(key)
+        if rejected is not None and entry is not None:
+            if entry.pem != rejected or time() - entry.fetched < _cooldown:
+                return entry.pem
+        event = _fetching.get(key)
+        leader = event is None
+        if leader:
+            event = _fetching[key] = Event()
+
+    if not leader:
+        event.wait(timeout)
+        entry = _entries.get(key)
+        if entry is None:
+            return _refresh(sdk_version, host, api_version, user, language, timeout, silent=silent)
+        return entry.pem
+
+    try:
+        pem = _get_raw(
+            sdk_version=sdk_version,
+            host=host,
+            api_version=api_version,
+            path="public-key",
+            user=user,
+            language=language,
+            timeout=timeout,
+            limit=1,
+        )["publicKeys"][0]["content"]
+        with _lock:
+            _entries[key] = _Entry(pem=pem, fetched=time())
+        return pem
+    except Exception:
+        if not silent:
+            raise
+    finally:
+        with _lock:
+            _fetching.pop(key, None)
+        event.set()
+
+
+def _key(host, user):
+    environment = user.environment if user else None
+    return host, environment
+
+
+_relayed_refresh = set_relay(_refresh)
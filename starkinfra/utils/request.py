@@ -0,0 +1,111 @@
+from time import time
+from sys import version_info as python_version
+from starkcore.environment import Environment
+from starkcore.error import InternalServerError, InputErrors, UnknownError
+from starkcore.utils.host import StarkHost
+from starkcore.utils.url import urlencode
+from starkcore.utils.checks import check_user, check_language
+from starkcore.user.__publicuser import PublicUser
+from . import session, crypto, codec
+
+
+class Response:
+
+    def __init__(self, status, content):
+        self.status = status
+        self.content = content
+
+    def json(self):
+        return codec.loads(self.content)
+
+
+def fetch(host, sdk_version, user, method, path, payload=None, query=None,
+          api_version="v2", language="en-US", timeout=15):
+    user = check_user(user)
+    url, body, headers = prepare(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+    )
+
+    try:
+        with session.lease(user) as http:
+            request = http.request(
+                method=method,
+                url=url,
+                data=body,
+                headers=headers,
+                timeout=timeout,
+            )
+    except Exception as exception:
+        raise UnknownError("{}: {}".format(exception.__class__.__name__, str(exception)))
+
+    return respond(status=request.status_code, content=request.content)
+
+
+def prepare(host, sdk_version, user, path, payload=None, query=None, api_version="v2", language="en-US"):
+    language = check_language(language)
+
+    service = {
+        StarkHost.infra: "starkinfra",
+        StarkHost.bank: "starkbank",
+        StarkHost.sign: "starksign",
+    }[host]
+
+    url = {
+        Environment.production:  "https://api.{service}.com/",
+        Environment.sandbox:     "https://sandbox.api.{service}.com/",
+    }[user.environment].format(service=service) + api_version
+
+    url = "{base_url}/{path}{query}".format(base_url=url, path=path, query=urlencode(query))
+
+    agent = "Python-{major}.{minor}.{micro}-SDK-{host}-{sdk_version}".format(
+        major=python_version.major,
+        minor=python_version.minor,
+        micro=python_version.micro,
+        host=host,
+        sdk_version=sdk_version,
+    )
+
+    body = codec.dumps(payload) if payload else ""
+    headers = {
+        "User-Agent": agent,
+        "Accept-Language": language,
+        "Content-Type": "application/json",
+    }
+    headers.update(_authentication_headers(user=user, body=body))
+
+    return url, body, headers
+
+
+def respond(status, content):
+    response = Response(status=status, content=content)
+
+    if response.status == 500:
+        raise InternalServerError()
+    if response.status == 400:
+        raise InputErrors(response.json()["errors"])
+    if response.status != 200:
+        raise UnknownError(response.content)
+
+    return response
+
+
+def _authentication_headers(user, body):
+    if isinstance(user, PublicUser):
+        return {}
+
+    access_time = str(time())
+    message = "{access_id}:{access_time}:{body}".format(access_id=user.access_id(), access_time=access_time, body=body)
+    signature = crypto.sign(message=message, pem=user.pem)
+
+    return {
+        "Access-Id": user.access_id(),
+        "Access-Time": access_time,
+        "Access-Signature": signature,
+    }
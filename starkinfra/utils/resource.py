@@ -0,0 +1,8 @@
+from starkcore.utils.resource import Resource as _Resource
+
+
+class Resource(_Resource, object):
+    """# Resource object
+    New-style version of starkcore's Resource, which is an old-style class on Python 2.
+    Resources holding Lazy attributes derive from it, as old-style classes ignore attribute descriptors.
+    """
@@ -1,15 +1,239 @@
 from .relay import set_relay
-from starkcore.utils import rest
-
-
-get_page = set_relay(rest.get_page)
-get_stream = set_relay(rest.get_stream)
-get_id = set_relay(rest.get_id)
-get_content = set_relay(rest.get_content)
-get_sub_resource = set_relay(rest.get_sub_resource)
-get_sub_resources = set_relay(rest.get_sub_resources)
-post_multi = set_relay(rest.post_multi)
-post_single = set_relay(rest.post_single)
-delete_id = set_relay(rest.delete_id)
-patch_id = set_relay(rest.patch_id)
-get_raw = set_relay(rest.get_raw)
+from .request import fetch
+from . import prefetcher
+from .api import endpoint, last_name, last_name_plural, api_json, api_jsons, from_api_json, entity_decoder, cast_json_to_api_format
+
+
+def _get_page(sdk_version, host, api_version, user, resource, language, timeout, raw=False, fields=None, **query):
+    decode = entity_decoder(resource, raw=raw, fields=fields)
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=endpoint(resource),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+    entities = [decode(entity) for entity in json[last_name_plural(resource)]]
+    cursor = json.get("cursor")
+    return entities, cursor
+
+
+def _get_stream(sdk_version, host, api_version, user, resource, language, timeout, limit=None, prefetch=None, raw=False, fields=None, **query):
+    pages = _get_pages(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        limit=limit,
+        raw=raw,
+        fields=fields,
+        **query
+    )
+    if prefetch:
+        pages = prefetcher.prefetch(pages, depth=prefetch)
+
+    for entities in pages:
+        for entity in entities:
+            yield entity
+
+
+def _get_pages(sdk_version, host, api_version, user, resource, language, timeout, limit=None, raw=False, fields=None, **query):
+    limit_query = {"limit": min(limit, 100) if limit else limit}
+    limit_query.update(query)
+
+    while True:
+        entities, cursor = _get_page(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            raw=raw,
+            fields=fields,
+            **limit_query
+        )
+        yield entities
+
+        if limit:
+            limit -= 100
+            limit_query["limit"] = min(limit, 100)
+
+        limit_query["cursor"] = cursor
+        if not cursor or (limit is not None and limit <= 0):
+            break
+
+
+def _get_id(sdk_version, host, api_version, user, resource, id, language, timeout, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+def _get_content(sdk_version, host, api_version, user, resource, id, sub_resource_name, language, timeout, **query):
+    return fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource_name}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource_name=sub_resource_name,
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).content
+
+
+def _get_sub_resource(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout, **query):
+    entity = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()[last_name(sub_resource)]
+    return from_api_json(sub_resource, entity)
+
+
+def _get_sub_resources(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout, **query):
+    entities = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()[last_name_plural(sub_resource)]
+    return [from_api_json(sub_resource, entity) for entity in entities]
+
+
+def _post_multi(sdk_version, host, api_version, user, resource, entities, language, timeout, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload={last_name_plural(resource): api_jsons(entities)},
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+    entities = json[last_name_plural(resource)]
+    return [from_api_json(resource, entity) for entity in entities]
+
+
+def _post_single(sdk_version, host, api_version, user, resource, entity, language, timeout, **query):
+    payload = api_json(entity)
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+    entity_json = json[last_name(resource)]
+    return from_api_json(resource, entity_json)
+
+
+def _delete_id(sdk_version, host, api_version, user, resource, id, language, timeout, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="DELETE",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+def _patch_id(sdk_version, host, api_version, user, resource, id, payload, language, timeout, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PATCH",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        payload=cast_json_to_api_format(payload),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+def _get_raw(sdk_version, host, api_version, path, user, language, timeout, **query):
+    return fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=path,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+    ).json()
+
+
+get_page = set_relay(_get_page)
+get_stream = set_relay(_get_stream)
+get_id = set_relay(_get_id)
+get_content = set_relay(_get_content)
+get_sub_resource = set_relay(_get_sub_resource)
+get_sub_resources = set_relay(_get_sub_resources)
+post_multi = set_relay(_post_multi)
+post_single = set_relay(_post_single)
+delete_id = set_relay(_delete_id)
+patch_id = set_relay(_patch_id)
+get_raw = set_relay(_get_raw)
@@ -0,0 +1,93 @@
+from os import getpid
+from time import time
+from threading import Lock
+from contextlib import contextmanager
+import starkinfra
+
+
+class _Entry:
+
+    def __init__(self, session, last_used):
+        self.session = session
+        self.last_used = last_used
+        self.leases = 0
+
+
+_lock = Lock()
+_entries = {}
+_pid = getpid()
+
+
+@contextmanager
+def lease(user):
+    """# Lease the pooled HTTP session of a user
+    Yields the keep-alive requests.Session linked to the user (Project/Organization).
+    Sessions are created on first use and reused by every request made on behalf of the same user,
+    so TCP and TLS handshakes are only paid once per pooled connection.
+    Sessions left idle for more than starkinfra.pool_idle_timeout seconds are closed.
+    ## Parameters (required):
+    - user [Organization/Project object]: Organization or Project object the session belongs to.
+    """
+    entry = _acquire(_key(user))
+    try:
+        yield entry.session
+    finally:
+        with _lock:
+            entry.leases -= 1
+            entry.last_used = time()
+
+
+def clear():
+    """# Close all pooled HTTP sessions
+    Closes every idle keep-alive connection currently held by the SDK.
+    Sessions being used by in-flight requests are dropped from the pool and closed by the garbage collector.
+    """
+    with _lock:
+        entries = list(_entries.values())
+        _entries.clear()
+    for entry in entries:
+        if not entry.leases:
+            entry.session.close()
+
+
+def _key(user):
+    access_id = user.access_id() if hasattr(user, "access_id") else None
+    return user.environment, access_id
+
+
+def _acquire(key):
+    global _pid
+    now = time()
+    with _lock:
+        if _pid != getpid():
+            # sockets inherited from a parent process must not be shared with it
+            _entries.clear()
+            _pid = getpid()
+        _evict(now)
+        entry = _entries.get(key)
+        if entry is None:
+            entry = _entries[key] = _Entry(session=_create(), last_used=now)
+        entry.leases += 1
+        entry.last_used = now
+        return entry
+
+
+def _evict(now):
+    idle_timeout = starkinfra.pool_idle_timeout
+    if idle_timeout is None:
+        return
+    for key, entry in list(_entries.items()):
+        if not entry.leases and now - entry.last_used > idle_timeout:
+            del _entries[key]
+            entry.session.close()
+
+
+def _create():
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=starkinfra.pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from threading import Event
+from collections import deque
+from starkcore.utils.checks import check_date
+from .prefetcher import Queue, feed, drain
+
+
+def query(page, after, before, workers=4, prefetch=2, limit=None, user=None, **filters):
+    """# Retrieve entities in parallel date shards
+    Splits the [after, before] date range into windows and retrieves them concurrently with the given page function.
+    Windows whose first page shows they hold more than one page of results are split again, down to single days,
+    so dense periods are spread over more workers. Results are yielded in the same order a regular query
+    would return them (most recent first), without duplicates.
+    ## Parameters (required):
+    - page [function]: page function of the resource to be retrieved. ex: starkinfra.pixrequest.log.page
+    - after [datetime.date or string]: date filter for objects created after a specified date. ex: datetime.date(2020, 3, 10)
+    - before [datetime.date or string]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
+    ## Parameters (optional):
+    - workers [integer, default 4]: maximum number of concurrent requests. ex: 8
+    - prefetch [integer, default 2]: number of pages each window may fetch ahead of the caller. ex: 2
+    - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    - any other filter accepted by the page function, including raw. ex: types=["success"]
+    ## Return:
+    - generator of the resource objects with updated attributes
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    after, before = check_date(after), check_date(before)
+
+    def fetch(window, cursor=None):
+        return page(cursor=cursor, limit=100, after=window[0], before=window[1], user=user, **filters)
+
+    def pages(window, entities, cursor):
+        yield entities
+        while cursor:
+            entities, cursor = fetch(window, cursor=cursor)
+            yield entities
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    streams, stops = deque(), []
+    leaves = _leaves(executor, fetch, _split(after, before, count=workers))
+
+    def start():
+        for window, entities, cursor in leaves:
+            buffer, stop = Queue(maxsize=prefetch), Event()
+            executor.submit(feed, pages(window, entities, cursor), buffer, stop)
+            streams.append(drain(buffer, stop))
+            stops.append(stop)
+            return True
+        return False
+
+    try:
+        count, previous = 0, set()
+        while len(streams) < workers and start():
+            pass
+        while streams:
+            current = set()
+            for entities in streams.popleft():
+                for entity in entities:
+                    id = entity["id"] if isinstance(entity, dict) else entity.id
+                    if id in previous or id in current:
+                        continue
+                    current.add(id)
+                    yield entity
+                    count += 1
+                    if limit and count >= limit:
+                        return
+            previous = current
+            start()
+    finally:
+        for stop in stops:
+            stop.set()
+        executor.shutdown(wait=False)
+
+
+def _leaves(executor, fetch, windows):
+    futures = [executor.submit(fetch, window) for window in windows]
+    for window, future in zip(windows, futures):
+        entities, cursor = future.result()
+        if cursor and window[0] < window[1]:
+            for leaf in _leaves(executor, fetch, _split(*window, count=2)):
+                yield leaf
+            continue
+        yield window, entities, cursor
+
+
+def _split(after, before, count):
+    days = (before - after).days + 1
+    count = max(1, min(count, days))
+    windows = []
+    for index in range(count):
+        end = before - timedelta(days=days * index // count)
+        start = before - timedelta(days=days * (index + 1) // count - 1)
+        windows.append((start, end))
+    return windows
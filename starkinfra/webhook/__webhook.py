@@ -50,25 +50,30 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, user=None):
+def query(limit=None, prefetch=None, raw=False, fields=None, user=None):
     """# Retrieve Webhook subscriptions
     Receive a generator of Webhook subscription objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - prefetch [integer, default None]: number of pages to fetch in the background while the current one is consumed. ex: 2
+    - raw [bool or string, default False]: if True, yields the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The yielded objects only hold these attributes and raise AttributeError when others are accessed. ex: ["url", "subscriptions"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Webhook objects with updated attributes
     """
-    return rest.get_stream(resource=_resource, limit=limit, user=user)
+    return rest.get_stream(resource=_resource, limit=limit, prefetch=prefetch, raw=raw, fields=fields, user=user)
 
 
-def page(cursor=None, limit=None, user=None):
+def page(cursor=None, limit=None, raw=False, fields=None, user=None):
     """# Retrieve paged Webhooks subscriptions
     Receive a list of up to 100 Webhook subscription objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
     ## Parameters (optional):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. It must be an integer between 1 and 100. ex: 50
+    - raw [bool or string, default False]: if True, returns the decoded JSON dictionaries returned by the API instead of objects, skipping object construction. Use "snake_case" to also convert their keys to snake_case. ex: True
+    - fields [list of strings, default None]: attributes to be decoded. The returned objects only hold these attributes and raise AttributeError when others are accessed. ex: ["url", "subscriptions"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of Webhook objects with updated attributes
@@ -78,6 +83,8 @@ def page(cursor=None, limit=None, user=None):
         resource=_resource,
         cursor=cursor,
         limit=limit,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -0,0 +1,41 @@
+import starkinfra
+from time import perf_counter
+from starkinfra.utils import codec
+from tests.utils.signature import offlineUser, sign, trustPublicKey
+from tests.utils.resourceJson import fullIssuingPurchase, fullPixRequest
+
+
+purchase = codec.StandardBackend().dumps(fullIssuingPurchase)
+page = {"requests": [fullPixRequest] * 100, "cursor": None}
+
+
+def rate(function, seconds=2):
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        function()
+        count += 1
+    return count / (perf_counter() - start)
+
+
+def benchmark(name):
+    codec.set_backend(name)
+    content = codec.dumps(page).encode("utf-8")
+    signature = sign(purchase)
+    print("{:<10}{:>15.0f}{:>15.0f}{:>15.0f}{:>15.0f}".format(
+        name,
+        rate(lambda: codec.loads(content)),
+        rate(lambda: codec.dumps(page)),
+        rate(lambda: starkinfra.issuingpurchase.response(status="approved", amount=1000, tags=["benchmark"])),
+        rate(lambda: starkinfra.issuingpurchase.parse(content=purchase, signature=signature, user=offlineUser)),
+    ))
+
+
+if __name__ == '__main__':
+    trustPublicKey()
+    print("{:<10}{:>15}{:>15}{:>15}{:>15}".format("backend", "page loads/s", "page dumps/s", "response/s", "parse/s"))
+    for name in ["json", "orjson"]:
+        try:
+            benchmark(name)
+        except ImportError:
+            print("{:<10}{:>15}".format(name, "not installed"))
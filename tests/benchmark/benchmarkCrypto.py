@@ -0,0 +1,37 @@
+from time import perf_counter
+from starkinfra.utils import crypto
+from tests.utils.signature import privateKeyPem, publicKeyPem
+
+
+message = '{"event": {"id": "5656565656565656", "log": {"type": "created", "purchase": {"amount": 10000}}}}'
+
+
+def rate(function, seconds=2):
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        function()
+        count += 1
+    return count / (perf_counter() - start)
+
+
+def benchmark(name):
+    backend = crypto.set_backend(name)
+    signature = backend.signature(crypto.sign(message=message, pem=privateKeyPem))
+    signatures = rate(lambda: crypto.sign(message=message, pem=privateKeyPem))
+    verifications = rate(lambda: crypto.verify(message=message, signature=signature, pem=publicKeyPem))
+    print("{name:<15}{signatures:>15.0f}{verifications:>20.0f}".format(
+        name=name,
+        signatures=signatures,
+        verifications=verifications,
+    ))
+
+
+if __name__ == '__main__':
+    print("{:<15}{:>15}{:>20}".format("backend", "signatures/s", "verifications/s"))
+    for name in ["ellipticcurve", "cryptography"]:
+        try:
+            benchmark(name)
+        except ImportError:
+            print("{:<15}{:>35}".format(name, "not installed"))
+    crypto.set_backend()
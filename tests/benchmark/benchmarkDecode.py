@@ -0,0 +1,40 @@
+from json import dumps, loads
+from time import perf_counter
+from starkcore.utils import api
+from starkinfra.utils.api import from_api_json, from_api_json_raw, entity_decoder
+from starkinfra.pixrequest.log.__log import _resource as _pixrequest_log_resource
+from starkinfra.issuingtransaction.__issuingtransaction import _resource as _issuingtransaction_resource
+from tests.utils.resourceJson import fullPixRequestLog
+
+
+issuingTransaction = {
+    "id": "5656565656565656", "amount": -1000, "balance": 100000, "description": "Stark Burgers", "source": "issuing-purchase/5656565656565656",
+    "tags": ["reconciliation"], "created": "2023-01-01T12:00:00.000000+00:00",
+}
+
+
+def rate(decode, content, seconds=2):
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        for entity in loads(content)["entities"]:
+            decode(entity)
+        count += 100
+    return count / (perf_counter() - start)
+
+
+if __name__ == '__main__':
+    print("{:<20}{:>15}{:>15}{:>15}{:>15}{:>15}".format("resource", "generic/s", "compiled/s", "raw/s", "snake_case/s", "projected/s"))
+    for name, resource, json, fields in [
+        ("PixRequest Log", _pixrequest_log_resource, fullPixRequestLog, ["type", "created"]),
+        ("IssuingTransaction", _issuingtransaction_resource, issuingTransaction, ["amount", "created"]),
+    ]:
+        content = dumps({"entities": [json] * 100})
+        print("{:<20}{:>15.0f}{:>15.0f}{:>15.0f}{:>15.0f}{:>15.0f}".format(
+            name,
+            rate(lambda entity: api.from_api_json(resource, entity), content),
+            rate(lambda entity: from_api_json(resource, entity), content),
+            rate(lambda entity: from_api_json_raw(entity, True), content),
+            rate(lambda entity: from_api_json_raw(entity, "snake_case"), content),
+            rate(entity_decoder(resource, fields=fields), content),
+        ))
@@ -0,0 +1,37 @@
+import starkinfra
+from time import sleep, perf_counter
+from starkinfra.utils import rest
+from tests.utils.fakeFetch import FakeEventApi
+from tests.utils.signature import offlineUser
+
+
+class SlowApi(FakeEventApi):
+
+    def __call__(self, *args, **kwargs):
+        sleep(0.005)
+        return FakeEventApi.__call__(self, *args, **kwargs)
+
+
+def serial(count):
+    rest.fetch = SlowApi(count=count, page_size=100)
+    for event in list(starkinfra.event.query(is_delivered=False, user=offlineUser)):
+        starkinfra.event.update(event.id, is_delivered=True, user=offlineUser)
+
+
+def drained(count, acknowledgers):
+    rest.fetch = SlowApi(count=count, page_size=100)
+    starkinfra.event.drain(lambda event: None, acknowledgers=acknowledgers, user=offlineUser)
+
+
+def rate(function, count):
+    start = perf_counter()
+    function()
+    return count / (perf_counter() - start)
+
+
+if __name__ == '__main__':
+    count = 2000
+    print("{:<20}{:>15}".format("mode", "events/s"))
+    print("{:<20}{:>15.0f}".format("serial", rate(lambda: serial(count), count)))
+    for acknowledgers in [8, 32]:
+        print("{:<20}{:>15.0f}".format("drain x{}".format(acknowledgers), rate(lambda: drained(count, acknowledgers), count)))
@@ -0,0 +1,33 @@
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+from starkinfra.utils.idempotency import MemoryStore, SqliteStore
+
+
+def microseconds(function, ids):
+    start = perf_counter()
+    for id in ids:
+        function(id)
+    return (perf_counter() - start) / len(ids) * 1e6
+
+
+if __name__ == '__main__':
+    directory = mkdtemp()
+    ids = [str(5000000000000000 + index) for index in range(50000)]
+    stores = [
+        ("memory", MemoryStore()),
+        ("sqlite commit=1", SqliteStore(path.join(directory, "single.sqlite3"), commit_size=1)),
+        ("sqlite commit=100", SqliteStore(path.join(directory, "batched.sqlite3"), commit_size=100)),
+        ("sqlite cold", SqliteStore(path.join(directory, "batched.sqlite3"), size=1)),
+    ]
+    print("{:<20}{:>12}{:>12}{:>12}".format("store", "mark us", "seen us", "miss us"))
+    for name, store in stores:
+        count = 2000 if name == "sqlite commit=1" else len(ids)
+        mark = microseconds(store.mark, ids[:count]) if name != "sqlite cold" else 0
+        store.flush()
+        seen = microseconds(store.seen, ids[:count])
+        miss = microseconds(store.seen, [id + "x" for id in ids[:count]])
+        print("{:<20}{:>12.2f}{:>12.2f}{:>12.2f}".format(name, mark, seen, miss))
+        store.close()
+    rmtree(directory)
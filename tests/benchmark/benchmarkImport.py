@@ -0,0 +1,24 @@
+import sys
+from time import perf_counter
+from subprocess import check_call
+
+
+def measure(statement, runs=10):
+    timings = []
+    for _ in range(runs):
+        start = perf_counter()
+        check_call([sys.executable, "-c", statement])
+        timings.append(perf_counter() - start)
+    return sorted(timings)[runs // 2]
+
+
+if __name__ == '__main__':
+    baseline = measure("pass")
+    cases = [
+        ("import starkinfra", "import starkinfra"),
+        ("first resource", "import starkinfra; starkinfra.PixRequest"),
+        ("all resources", "import starkinfra; [getattr(starkinfra, name) for name in starkinfra.__all__]"),
+    ]
+    print("{:<20}{:>15}".format("case", "median ms"))
+    for name, statement in cases:
+        print("{:<20}{:>15.1f}".format(name, (measure(statement) - baseline) * 1000))
@@ -0,0 +1,66 @@
+import tracemalloc
+from json import dumps, loads
+from starkinfra.utils import api
+import starkinfra
+from starkinfra.utils.api import from_api_json
+from starkinfra.pixrequest.__pixrequest import _resource as _pixrequest_resource
+from starkinfra.pixrequest.log.__log import _resource as _pixrequest_log_resource
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _issuingpurchase_resource
+from tests.utils.resourceJson import fullPixRequest, fullIssuingPurchase, fullPixRequestLog
+
+
+def touch(entity):
+    for name in ["created", "updated"]:
+        getattr(entity, name, None)
+    request = getattr(entity, "request", None)
+    if request is not None:
+        touch(request)
+
+
+def measure(resource, json, count):
+    content = dumps([json] * 100)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = []
+    for _ in range(count // 100):
+        entities.extend(from_api_json(resource, entity) for entity in loads(content))
+    for entity in entities:
+        touch(entity)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del entities
+    return size / count
+
+
+def measureLoaded(resource, json, count, interned):
+    starkinfra.interned_fields = interned
+    api._decoders.clear()
+    return measure(resource, json, count)
+
+
+if __name__ == '__main__':
+    count = 20000
+    print("{:<20}{:>15}{:>15}{:>10}".format("resource", "regular B/obj", "compact B/obj", "saving"))
+    for name, resource, json in [
+        ("PixRequest", _pixrequest_resource, fullPixRequest),
+        ("IssuingPurchase", _issuingpurchase_resource, fullIssuingPurchase),
+        ("PixRequest Log", _pixrequest_log_resource, fullPixRequestLog),
+    ]:
+        starkinfra.compact = False
+        regular = measure(resource, json, count)
+        starkinfra.compact = True
+        compact = measure(resource, json, count)
+        print("{:<20}{:>15.0f}{:>15.0f}{:>9.0f}%".format(name, regular, compact, 100 * (1 - compact / regular)))
+    starkinfra.compact = False
+
+    interned = starkinfra.interned_fields
+    print("\n{:<20}{:>15}{:>15}{:>10}".format("loaded resource", "plain B/obj", "interned B/obj", "saving"))
+    for name, resource, json in [
+        ("PixRequest", _pixrequest_resource, fullPixRequest),
+        ("IssuingPurchase", _issuingpurchase_resource, fullIssuingPurchase),
+        ("PixRequest Log", _pixrequest_log_resource, fullPixRequestLog),
+    ]:
+        plain = measureLoaded(resource, json, count, interned={})
+        internedSize = measureLoaded(resource, json, count, interned=interned)
+        print("{:<20}{:>15.0f}{:>15.0f}{:>9.0f}%".format(name, plain, internedSize, 100 * (1 - internedSize / plain)))
+    starkinfra.interned_fields = interned
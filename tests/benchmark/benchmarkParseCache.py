@@ -0,0 +1,28 @@
+import starkinfra
+from time import perf_counter
+from starkinfra.utils import codec, parsecache
+from tests.utils.signature import offlineUser, sign, trustPublicKey
+from tests.utils.resourceJson import fullIssuingPurchase
+
+
+content = codec.StandardBackend().dumps(fullIssuingPurchase)
+signature = sign(content)
+
+
+def rate(function, seconds=2):
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        function()
+        count += 1
+    return count / (perf_counter() - start)
+
+
+if __name__ == '__main__':
+    trustPublicKey()
+    print("{:<15}{:>15}".format("cache", "redelivery/s"))
+    for size in [0, 1000]:
+        starkinfra.parse_cache_size = size
+        parsecache.clear()
+        print("{:<15}{:>15.0f}".format(str(size), rate(lambda: starkinfra.issuingpurchase.parse(content=content, signature=signature, user=offlineUser))))
+    print(parsecache.stats())
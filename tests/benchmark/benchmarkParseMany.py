@@ -0,0 +1,15 @@
+import starkinfra
+from os import cpu_count
+from time import perf_counter
+from tests.utils.event import generateEventJson
+from tests.utils.signature import offlineUser, signed, trustPublicKey
+
+
+if __name__ == '__main__':
+    trustPublicKey()
+    items = [signed({"event": generateEventJson(id, entity=id)}) for id in range(2000)]
+    print("{:<10}{:>15}".format("workers", "events/s"))
+    for workers in sorted(set([1, 2, 4, cpu_count() or 1])):
+        start = perf_counter()
+        starkinfra.event.parse_many(items, workers=workers, user=offlineUser)
+        print("{:<10}{:>15.0f}".format(workers, len(items) / (perf_counter() - start)))
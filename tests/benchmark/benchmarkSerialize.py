@@ -0,0 +1,45 @@
+import starkinfra
+from time import perf_counter
+from starkcore.utils import api
+from starkinfra.utils import rest
+from starkinfra.utils.api import api_jsons
+from starkinfra.utils.request import Response, prepare
+from tests.utils.resourceObject import pixRequest, creditNote
+
+
+user = starkinfra.Project(environment="sandbox", id="5656565656565656", private_key=starkinfra.key.create()[0])
+
+
+def fetch(host, sdk_version, user, method, path, payload=None, query=None, api_version="v2", language="en-US", timeout=15):
+    prepare(host=host, sdk_version=sdk_version, user=user, path=path, payload=payload, query=query, api_version=api_version, language=language)
+    return Response(status=200, content=b'{"requests": []}')
+
+
+def rate(function, seconds=2):
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        function()
+        count += 1
+    return count / (perf_counter() - start)
+
+
+def generic(entities):
+    return [api.api_json(entity) for entity in entities]
+
+
+if __name__ == '__main__':
+    print("{:<25}{:>15}{:>15}".format("batch of 100", "generic/s", "cached/s"))
+    for name, entities in [
+        ("PixRequest api_json", [pixRequest() for _ in range(100)]),
+        ("CreditNote api_json", [creditNote() for _ in range(100)]),
+    ]:
+        print("{:<25}{:>15.1f}{:>15.1f}".format(name, rate(lambda: generic(entities)), rate(lambda: api_jsons(entities))))
+
+    requests = [pixRequest() for _ in range(100)]
+    rest.fetch = fetch
+    rest.api_jsons = generic
+    genericRate = rate(lambda: starkinfra.pixrequest.create(requests, user=user))
+    rest.api_jsons = api_jsons
+    cachedRate = rate(lambda: starkinfra.pixrequest.create(requests, user=user))
+    print("{:<25}{:>15.1f}{:>15.1f}".format("pixrequest.create", genericRate, cachedRate))
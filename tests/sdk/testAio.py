@@ -0,0 +1,113 @@
+import sys
+import asyncio
+import starkinfra
+import starkinfra.aio
+from unittest import TestCase, main
+from tests.utils.fakeFetch import FakeFetch
+from tests.utils.signature import offlineUser
+from tests.utils.user import exampleProject
+from tests.utils.pixRequest import generateExamplePixRequestJson
+
+
+starkinfra.user = exampleProject
+
+
+def run(coroutine):
+    async def closing():
+        try:
+            return await coroutine
+        finally:
+            await starkinfra.aio.close()
+
+    return asyncio.run(closing())
+
+
+class FakeAsyncFetch(FakeFetch):
+
+    async def __call__(self, **kwargs):
+        await asyncio.sleep(0)
+        return FakeFetch.__call__(self, **kwargs)
+
+
+class TestAioOffline(TestCase):
+
+    def setUp(self):
+        self.rest = sys.modules["starkinfra.aio.__rest"]
+        self.fetch = self.rest.fetch
+        self.rest.fetch = FakeAsyncFetch([
+            {"requests": [{"id": "1", "amount": 100}, {"id": "2", "amount": 200}]},
+            {"requests": [{"id": "3", "amount": 300}]},
+        ])
+
+    def tearDown(self):
+        self.rest.fetch = self.fetch
+
+    def test_query(self):
+        async def query():
+            return [request async for request in starkinfra.aio.pixrequest.query(user=offlineUser)]
+
+        requests = run(query())
+        self.assertEqual([request.id for request in requests], ["1", "2", "3"])
+        self.assertEqual(len(self.rest.fetch.queries), 2)
+
+    def test_page(self):
+        requests, cursor = run(starkinfra.aio.pixrequest.page(limit=2, user=offlineUser))
+        self.assertEqual([request.amount for request in requests], [100, 200])
+        self.assertEqual(cursor, "1")
+        self.assertEqual(self.rest.fetch.queries[0]["limit"], 2)
+
+    def test_sync_functions(self):
+        self.assertIs(starkinfra.aio.pixrequest.parse, starkinfra.pixrequest.parse)
+        self.assertIsNot(starkinfra.aio.pixrequest.page, starkinfra.pixrequest.page)
+
+
+class TestAioPixRequestPost(TestCase):
+
+    def test_success(self):
+        pix_requests = run(starkinfra.aio.pixrequest.create(generateExamplePixRequestJson(n=5)))
+        self.assertEqual(len(pix_requests), 5)
+
+
+class TestAioPixRequestQuery(TestCase):
+
+    def test_success(self):
+        async def query():
+            return [request async for request in starkinfra.aio.pixrequest.query(limit=150)]
+
+        pix_requests = run(query())
+        self.assertEqual(len(pix_requests), 150)
+        self.assertEqual(len(set(request.id for request in pix_requests)), 150)
+
+
+class TestAioPixRequestGet(TestCase):
+
+    def test_concurrent(self):
+        async def get():
+            pix_requests, cursor = await starkinfra.aio.pixrequest.page(limit=10)
+            gets = [starkinfra.aio.pixrequest.get(request.id) for request in pix_requests]
+            return pix_requests, await asyncio.gather(*gets)
+
+        pix_requests, gotten = run(get())
+        self.assertEqual([request.id for request in pix_requests], [request.id for request in gotten])
+
+
+class TestAioPixBalanceGet(TestCase):
+
+    def test_success(self):
+        balance = run(starkinfra.aio.pixbalance.get())
+        self.assertIsNotNone(balance.amount)
+
+
+class TestAioIssuingCardLog(TestCase):
+
+    def test_success(self):
+        async def query():
+            return [log async for log in starkinfra.aio.issuingcard.log.query(limit=5)]
+
+        logs = run(query())
+        for log in logs:
+            self.assertIsNotNone(log.card.id)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import starkinfra
+from time import sleep
+from threading import Thread
+from unittest import TestCase, main
+from starkcore.error import InputErrors, UnknownError
+from tests.utils.fakeCreate import FakeCreate
+
+
+class TestBatcher(TestCase):
+
+    def test_batching(self):
+        create = FakeCreate()
+        futures = []
+        with starkinfra.batch.Batcher(create, max_size=100, max_delay=0.2) as batcher:
+            def submit(start):
+                for entity in range(start, start + 50):
+                    futures.append((entity, batcher.submit(entity)))
+
+            threads = [Thread(target=submit, args=(start,)) for start in range(0, 200, 50)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(len(call) for call in create.calls), [100, 100])
+        for entity, future in futures:
+            self.assertEqual(future.result(), "created-{}".format(entity))
+
+    def test_delay(self):
+        create = FakeCreate()
+        batcher = starkinfra.batch.Batcher(create, max_delay=0.01)
+        future = batcher.submit(1)
+        self.assertEqual(future.result(timeout=1), "created-1")
+        sleep(0.05)
+        self.assertEqual(batcher.submit(2).result(timeout=1), "created-2")
+        batcher.close()
+        self.assertEqual(create.calls, [[1], [2]])
+
+    def test_input_errors(self):
+        create = FakeCreate(invalid=[3, 6])
+        with starkinfra.batch.Batcher(create, max_delay=0.05) as batcher:
+            futures = [batcher.submit(entity) for entity in range(8)]
+        for entity, future in enumerate(futures):
+            if entity in [3, 6]:
+                self.assertIsInstance(future.exception(), InputErrors)
+                continue
+            self.assertEqual(future.result(), "created-{}".format(entity))
+
+    def test_unknown_error(self):
+        create = FakeCreate(error=UnknownError("connection reset"))
+        with starkinfra.batch.Batcher(create, max_delay=0.05) as batcher:
+            futures = [batcher.submit(entity) for entity in range(5)]
+        self.assertEqual(len(create.calls), 1)
+        for future in futures:
+            self.assertIsInstance(future.exception(), UnknownError)
+
+    def test_missing_results(self):
+        create = lambda entities, user=None: ["created-{}".format(entity) for entity in entities[:3]]
+        with starkinfra.batch.Batcher(create, max_delay=0.05) as batcher:
+            futures = [batcher.submit(entity) for entity in range(5)]
+        self.assertEqual([future.result() for future in futures[:3]], ["created-0", "created-1", "created-2"])
+        for future in futures[3:]:
+            self.assertIsInstance(future.exception(timeout=1), UnknownError)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import starkinfra
+from unittest import TestCase, main
+from starkcore.error import InputErrors
+from tests.utils.fakeCreate import FakeCreate
+
+
+class TestBulkCreate(TestCase):
+
+    def test_success(self):
+        create = FakeCreate(delay=0.02)
+        succeeded, failed = starkinfra.bulk.create(create, list(range(250)), workers=3)
+        self.assertEqual(sorted(len(call) for call in create.calls), [50, 100, 100])
+        self.assertLessEqual(create.concurrency, 3)
+        self.assertEqual(failed, [])
+        self.assertEqual([chunk.index for chunk in succeeded], [0, 1, 2])
+        created = [entity for chunk in succeeded for entity in chunk.created]
+        self.assertEqual(created, ["created-{}".format(entity) for entity in range(250)])
+
+    def test_partial_failure(self):
+        create = FakeCreate(invalid=[120], delay=0.02)
+        succeeded, failed = starkinfra.bulk.create(create, list(range(250)), chunk_size=50)
+        self.assertEqual([chunk.index for chunk in succeeded], [0, 1, 3, 4])
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].index, 2)
+        self.assertEqual(failed[0].entities, list(range(100, 150)))
+        self.assertIsNone(failed[0].created)
+        self.assertIsInstance(failed[0].error, InputErrors)
+
+    def test_chunk_size(self):
+        create = FakeCreate()
+        for chunk_size in [0, -1, 101]:
+            with self.assertRaises(ValueError):
+                starkinfra.bulk.create(create, list(range(10)), chunk_size=chunk_size)
+        self.assertEqual(create.calls, [])
+
+
+if __name__ == '__main__':
+    main()
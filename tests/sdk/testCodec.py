@@ -0,0 +1,89 @@
+# coding: utf-8
+import starkinfra
+from json import loads
+from unittest import TestCase, main, skipUnless
+from starkinfra.utils import codec
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+payloads = [
+    {"requests": [{"amount": 1000, "name": "Jamie Lannister", "tags": ["a", "b"], "fee": 0.5, "flag": True, "none": None}]},
+    {"city": u"São Paulo", "emoji": u"pix \U0001f680", "quote": u"\"/\\", "control": u"line\nbreak\ttab\x01"},
+    {"big": 2 ** 70, "negative": -2 ** 63, "float": 1e-7, "nested": [[], {}, [{"a": [1, 2.5]}]]},
+    [1, "two", {"three": 3}],
+]
+
+
+class TestCodec(TestCase):
+
+    def tearDown(self):
+        codec.set_backend()
+
+    def check(self, name):
+        codec.set_backend(name)
+        for payload in payloads:
+            text = codec.dumps(payload)
+            self.assertEqual(loads(text), payload)
+            self.assertTrue(all(ord(character) < 128 for character in text))
+            self.assertEqual(codec.loads(text), payload)
+            self.assertEqual(codec.loads(text.encode("utf-8")), payload)
+
+    def test_standard(self):
+        self.check("json")
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_orjson(self):
+        self.check("orjson")
+        self.assertEqual(codec.backend.name, "orjson")
+        self.assertEqual(codec.loads(u'{"text": "a\nb"}'), {"text": "a\nb"})
+        self.assertEqual(codec.dumps({1: "integer key"}), '{"1": "integer key"}')
+
+    def test_custom(self):
+        calls = []
+
+        class Backend:
+
+            def dumps(self, data):
+                calls.append(data)
+                return "{}"
+
+            def loads(self, content):
+                return {}
+
+        codec.set_backend(Backend())
+        self.assertEqual(starkinfra.issuingpurchase.response(status="denied", reason="other"), "{}")
+        self.assertEqual(calls, [{"authorization": {"status": "denied", "reason": "other"}}])
+
+    def test_responses(self):
+        for name in ["json", "orjson"] if orjson else ["json"]:
+            codec.set_backend(name)
+            self.assertEqual(
+                loads(starkinfra.issuingpurchase.response(status="approved", amount=1000, tags=[u"café"])),
+                {"authorization": {"status": "approved", "amount": 1000, "tags": [u"café"]}},
+            )
+            self.assertEqual(
+                loads(starkinfra.pixrequest.response(status="denied", reason="invalidAccountNumber")),
+                {"authorization": {"status": "denied", "reason": "invalidAccountNumber"}},
+            )
+            self.assertEqual(
+                loads(starkinfra.issuingtoken.response_authorization(status="approved", activation_methods=[{"type": "app", "value": "com.bank"}])),
+                {"authorization": {"status": "approved", "reason": "", "activationMethods": [{"type": "app", "value": "com.bank"}]}},
+            )
+            self.assertEqual(
+                loads(starkinfra.dynamicbrcode.response_due(
+                    version=1, created="2023-01-01T12:00:00+00:00", due="2023-01-10T12:00:00+00:00", key_id="+5511989898989",
+                    status="paid", reconciliation_id="b77f5236-7ab9-4487-9f95-66ee6eaf1781", nominal_amount=100,
+                    sender_name=u"João da Silva", sender_tax_id="012.345.678-90", expiration=86400,
+                    receiver_name="Stark Bank", receiver_tax_id="20.018.183/0001-80", receiver_street_line="Av. Paulista, 200",
+                    receiver_city=u"São Paulo", receiver_state_code="SP", receiver_zip_code="01310-000",
+                ))["senderName"],
+                u"João da Silva",
+            )
+
+
+if __name__ == '__main__':
+    main()
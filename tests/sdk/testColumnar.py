@@ -0,0 +1,69 @@
+import starkinfra
+from io import BytesIO
+from unittest import TestCase, main, skipUnless
+from starkinfra.utils import rest
+from tests.utils.fakeFetch import FakeFetch
+from tests.utils.signature import offlineUser
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@skipUnless(numpy, "numpy is not installed")
+class TestColumnar(TestCase):
+
+    def setUp(self):
+        self.fetch = rest.fetch
+        rest.fetch = FakeFetch([
+            {"transactions": [
+                {"id": "1", "amount": -1000, "balance": 9000, "source": "issuing-purchase/1", "created": "2023-01-01T12:00:00.000000+00:00"},
+                {"id": "2", "amount": 500, "balance": 9500, "source": "issuing-invoice/2", "created": "2023-01-02T12:00:00.000000+00:00"},
+            ]},
+            {"transactions": [
+                {"id": "3", "amount": -200, "balance": 9300, "source": "issuing-purchase/1", "created": "2023-01-03T12:00:00.000000+00:00"},
+            ]},
+        ])
+
+    def tearDown(self):
+        rest.fetch = self.fetch
+
+    def query(self):
+        return starkinfra.issuingtransaction.query(fields=["amount", "balance", "source", "created"], user=offlineUser)
+
+    def test_batches(self):
+        batches = list(starkinfra.columnar.batches(self.query(), ["id", "amount", "source", "created"], size=2))
+        self.assertEqual([len(batch["amount"]) for batch in batches], [2, 1])
+        self.assertEqual(batches[0]["amount"].dtype, numpy.int64)
+        self.assertEqual(batches[0]["id"].tolist(), ["1", "2"])
+        self.assertEqual(batches[1]["source"].codes.tolist(), [0])
+        self.assertEqual(batches[1]["created"][0], numpy.datetime64("2023-01-03T12:00:00"))
+
+    def test_columns(self):
+        columns = starkinfra.columnar.columns(self.query(), ["amount", "source"])
+        source = columns["source"]
+        self.assertEqual(source.categories.tolist(), ["issuing-purchase/1", "issuing-invoice/2"])
+        self.assertEqual(columns["amount"][source.codes == source.code("issuing-purchase/1")].sum(), -1200)
+        self.assertEqual(source.decode().tolist(), ["issuing-purchase/1", "issuing-invoice/2", "issuing-purchase/1"])
+
+    def test_missing(self):
+        columns = starkinfra.columnar.columns(
+            [{"amount": 1, "status": "paid"}, {"amount": None, "status": None}],
+            ["amount", "status"],
+        )
+        self.assertTrue(numpy.isnan(columns["amount"][1]))
+        self.assertEqual(columns["status"].codes.tolist(), [0, -1])
+
+    def test_save(self):
+        file = BytesIO()
+        starkinfra.columnar.save(file, self.query(), ["amount", "balance", "source", "created"])
+        file.seek(0)
+        columns = starkinfra.columnar.load(file)
+        self.assertEqual(sorted(columns), ["amount", "balance", "created", "source"])
+        self.assertEqual(columns["balance"].tolist(), [9000, 9500, 9300])
+        self.assertEqual(columns["source"].codes.tolist(), [0, 1, 0])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import pickle
+import starkinfra
+from datetime import datetime
+from unittest import TestCase, main
+from starkcore.utils.api import from_api_json
+from starkinfra.utils import api, compact
+from starkinfra.pixrequest.__pixrequest import _resource as _pixrequest_resource
+from starkinfra.pixrequest.log.__log import _resource as _pixrequest_log_resource
+from starkinfra.issuingcard.__issuingcard import _resource as _issuingcard_resource
+from tests.utils.resourceJson import pixRequest, pixRequestLog, issuingCard
+
+
+class TestCompact(TestCase):
+
+    def tearDown(self):
+        starkinfra.compact = False
+
+    def test_attributes(self):
+        regular = from_api_json(_pixrequest_resource, pixRequest)
+        entity = compact.from_api_json(_pixrequest_resource, pixRequest)
+        self.assertFalse(hasattr(entity, "__dict__"))
+        self.assertEqual(repr(entity), repr(regular))
+        self.assertEqual(str(entity), str(regular))
+        self.assertEqual(entity.created, regular.created)
+        self.assertEqual(type(entity).__name__, "PixRequest")
+
+    def test_nested(self):
+        log = compact.from_api_json(_pixrequest_log_resource, pixRequestLog)
+        self.assertFalse(hasattr(log, "__dict__"))
+        self.assertFalse(hasattr(log.request, "__dict__"))
+        self.assertEqual(log.request.amount, 1000)
+        card = compact.from_api_json(_issuingcard_resource, issuingCard)
+        self.assertFalse(hasattr(card.rules[0], "__dict__"))
+        self.assertEqual(card.rules[0].amount, 1000)
+
+    def test_pickle(self):
+        log = compact.from_api_json(_pixrequest_log_resource, pixRequestLog)
+        loaded = pickle.loads(pickle.dumps(log))
+        self.assertIs(type(loaded), type(log))
+        self.assertEqual(str(loaded), str(log))
+
+    def test_initializer(self):
+        original = _pixrequest_log_resource["class"]
+        cls = compact.compact_class(original)
+        log = cls.__new__(cls)
+        compact._initializer(original)(log, id="1", request=pixRequest, type="created", errors=[], created="2023-01-01T12:00:00.000000+00:00")
+        self.assertFalse(hasattr(log, "__dict__"))
+        self.assertEqual(log.request.amount, 1000)
+        self.assertFalse(hasattr(log.request, "__dict__"))
+        self.assertEqual(log.created, datetime(2023, 1, 1, 12))
+
+    def test_mode(self):
+        starkinfra.compact = True
+        entity = api.from_api_json(_pixrequest_resource, pixRequest)
+        self.assertIs(type(entity), compact.compact_class(starkinfra.PixRequest))
+
+
+if __name__ == '__main__':
+    main()
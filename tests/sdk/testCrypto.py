@@ -0,0 +1,67 @@
+from unittest import TestCase, main, skipUnless
+from ellipticcurve import PrivateKey
+from starkcore.error import InvalidSignatureError
+from starkinfra.utils import crypto, parse, publickey
+from tests.utils.signature import offlineUser, privateKeyPem, publicKeyPem, trustPublicKey
+
+try:
+    import cryptography
+except ImportError:
+    cryptography = None
+
+
+content = '{"event": {"id": "5656565656565656", "subscription": "pix-request.in"}}'
+
+
+class TestCryptoBackends(TestCase):
+
+    def tearDown(self):
+        crypto.set_backend()
+
+    @skipUnless(cryptography, "cryptography is not installed")
+    def test_interoperability(self):
+        for signer in ["ellipticcurve", "cryptography"]:
+            crypto.set_backend(signer)
+            signature = crypto.sign(message=content, pem=privateKeyPem)
+            for verifier in ["ellipticcurve", "cryptography"]:
+                crypto.set_backend(verifier)
+                self.assertTrue(crypto.verify(content, crypto.signature(signature), publicKeyPem))
+                self.assertFalse(crypto.verify(content + " ", crypto.signature(signature), publicKeyPem))
+
+    @skipUnless(cryptography, "cryptography is not installed")
+    def test_short_secret(self):
+        privateKey = PrivateKey(secret=12345)
+        for signer in ["ellipticcurve", "cryptography"]:
+            crypto.set_backend(signer)
+            signature = crypto.sign(message=content, pem=privateKey.toPem())
+            crypto.set_backend("ellipticcurve")
+            self.assertTrue(crypto.verify(content, crypto.signature(signature), privateKey.publicKey().toPem()))
+
+    @skipUnless(cryptography, "cryptography is not installed")
+    def test_default(self):
+        self.assertEqual(crypto.set_backend().name, "cryptography")
+
+    @skipUnless(cryptography is None, "cryptography is installed")
+    def test_fallback(self):
+        self.assertEqual(crypto.set_backend().name, "ellipticcurve")
+
+
+class TestParseVerify(TestCase):
+
+    def setUp(self):
+        trustPublicKey()
+
+    def tearDown(self):
+        publickey.clear()
+
+    def test_success(self):
+        signature = crypto.sign(message=content, pem=privateKeyPem)
+        self.assertEqual(parse.verify(content=content, signature=signature, user=offlineUser), content)
+
+    def test_malformed_signature(self):
+        with self.assertRaises(InvalidSignatureError):
+            parse.verify(content=content, signature="not a signature", user=offlineUser)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+from json import dumps, loads
+from unittest import TestCase, main
+from starkcore.utils import api
+from starkinfra.utils import projection
+from starkinfra.utils.api import from_api_json, decoder
+from starkinfra.pixrequest.__pixrequest import _resource as _pixrequest_resource
+from starkinfra.pixrequest.log.__log import _resource as _pixrequest_log_resource
+from starkinfra.issuingcard.__issuingcard import _resource as _issuingcard_resource
+from tests.utils.resourceJson import pixRequest, pixRequestLog, issuingCard
+
+
+class TestDecoder(TestCase):
+
+    def test_equivalence(self):
+        for resource, json in [
+            (_pixrequest_resource, pixRequest),
+            (_pixrequest_log_resource, pixRequestLog),
+            (_issuingcard_resource, issuingCard),
+        ]:
+            self.assertEqual(str(from_api_json(resource, json)), str(api.from_api_json(resource, json)))
+
+    def test_nested(self):
+        log = from_api_json(_pixrequest_log_resource, pixRequestLog)
+        self.assertIs(type(log.request), _pixrequest_resource["class"])
+        self.assertEqual(log.request.external_id, "my-external-id")
+        card = from_api_json(_issuingcard_resource, issuingCard)
+        self.assertEqual(card.rules[0].amount, 1000)
+
+    def test_unknown_keys(self):
+        entity = from_api_json(_pixrequest_resource, dict(pixRequest, newField="value"))
+        self.assertFalse(hasattr(entity, "new_field"))
+        self.assertIsNone(entity.receiver_name)
+
+    def test_cache(self):
+        self.assertIs(decoder(_pixrequest_resource["class"]), decoder(_pixrequest_resource["class"]))
+
+    def test_interned(self):
+        first, second = [from_api_json(_pixrequest_log_resource, loads(dumps(pixRequestLog))) for _ in range(2)]
+        self.assertIs(first.type, second.type)
+        self.assertIs(first.request.status, second.request.status)
+        self.assertIsNot(first.request.sender_name, second.request.sender_name)
+        self.assertEqual(first.request.sender_name, second.request.sender_name)
+
+    def test_interned_projection(self):
+        decode = projection.decoder(_pixrequest_resource, ["status", "sender_name"])
+        first, second = [decode(loads(dumps(pixRequest))) for _ in range(2)]
+        self.assertIs(first.status, second.status)
+        self.assertIsNot(first.sender_name, second.sender_name)
+
+
+if __name__ == '__main__':
+    main()
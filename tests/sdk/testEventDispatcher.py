@@ -0,0 +1,80 @@
+import starkinfra
+from time import sleep
+from random import random
+from threading import Lock
+from unittest import TestCase, main
+from starkinfra.event.__dispatcher import _entity_key
+from tests.utils.event import generateEvent as event
+
+
+class TestEventDispatcher(TestCase):
+
+    def test_entity_order(self):
+        handled = {}
+        lock = Lock()
+        running = {"now": 0, "max": 0}
+
+        def handle(event):
+            with lock:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            sleep(random() * 0.01)
+            with lock:
+                running["now"] -= 1
+                handled.setdefault(event.log.request.id, []).append(int(event.id))
+
+        with starkinfra.event.Dispatcher(workers=4) as dispatcher:
+            dispatcher.on("pix-request", handle)
+            for id in range(40):
+                dispatcher.dispatch(event(id, entity=id % 4))
+
+        self.assertEqual(handled, {str(entity): list(range(entity, 40, 4)) for entity in range(4)})
+        self.assertGreater(running["max"], 1)
+
+    def test_subscriptions(self):
+        dispatcher = starkinfra.event.Dispatcher()
+
+        @dispatcher.on("pix-request")
+        def family(event):
+            return "family"
+
+        dispatcher.on("pix-request.out", lambda event: "exact")
+        self.assertEqual(dispatcher.dispatch(event(1, entity=1)).result(), "family")
+        self.assertEqual(dispatcher.dispatch(event(2, entity=1, subscription="pix-request.out")).result(), "exact")
+        self.assertIsNone(dispatcher.dispatch(event(3, entity=1, subscription="issuing-invoice")).result())
+        with self.assertRaises(ValueError):
+            dispatcher.on("pix-requests", family)
+        dispatcher.close()
+        with self.assertRaises(RuntimeError):
+            dispatcher.dispatch(event(4, entity=1))
+
+    def test_error(self):
+        def handle(event):
+            if event.id == "1":
+                raise ValueError("failed")
+            return event.id
+
+        with starkinfra.event.Dispatcher() as dispatcher:
+            dispatcher.on("issuing-invoice", handle)
+            failed = dispatcher.dispatch(event(1, entity=1, subscription="issuing-invoice"))
+            succeeded = dispatcher.dispatch(event(2, entity=1, subscription="issuing-invoice"))
+        self.assertIsInstance(failed.exception(), ValueError)
+        self.assertEqual(succeeded.result(), "2")
+
+    def test_missing_entity(self):
+        self.assertEqual(_entity_key(event(1, entity=None)), ("event", "1"))
+
+        class Log(object):
+            pass
+
+        unknown = event(2, entity=1)
+        unknown.log = Log()
+        self.assertEqual(_entity_key(unknown), ("event", "2"))
+
+        with starkinfra.event.Dispatcher() as dispatcher:
+            dispatcher.on("pix-request", lambda event: event.id)
+            self.assertEqual(dispatcher.dispatch(event(3, entity=None)).result(), "3")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import starkinfra
+from unittest import TestCase, main
+from starkinfra.utils import rest
+from starkinfra.utils.idempotency import MemoryStore
+from starkcore.error import InternalServerError
+from tests.utils.fakeFetch import FakeEventApi
+from tests.utils.signature import offlineUser
+
+
+class TestEventDrain(TestCase):
+
+    def setUp(self):
+        self.fetch = rest.fetch
+
+    def tearDown(self):
+        rest.fetch = self.fetch
+
+    def test_drain(self):
+        rest.fetch = api = FakeEventApi(count=100, page_size=100)
+        handled = []
+        result = starkinfra.event.drain(lambda event: handled.append(event.id), workers=4, acknowledgers=4, user=offlineUser)
+        self.assertEqual(sorted(handled, key=int), [str(id) for id in range(100)])
+        self.assertEqual((result.handled, result.skipped, result.acknowledged, result.failed), (100, 0, 100, {}))
+        self.assertEqual(api.undelivered, [])
+
+    def test_failures(self):
+        rest.fetch = api = FakeEventApi(count=20, page_size=20, failing=["3"])
+        store = MemoryStore()
+
+        def handle(event):
+            if event.id == "5":
+                raise ValueError(event.id)
+
+        result = starkinfra.event.drain(handle, store=store, user=offlineUser)
+        self.assertEqual((result.handled, result.acknowledged), (19, 18))
+        self.assertEqual(sorted(result.failed), ["3", "5"])
+        self.assertIsInstance(result.failed["3"], InternalServerError)
+        self.assertIsInstance(result.failed["5"], ValueError)
+        self.assertEqual(sorted(api.undelivered), ["3", "5"])
+        self.assertTrue(store.seen("3"))
+        self.assertFalse(store.seen("5"))
+
+        api.failing = set()
+        handled = []
+        result = starkinfra.event.drain(lambda event: handled.append(event.id), store=store, user=offlineUser)
+        self.assertEqual(handled, ["5"])
+        self.assertEqual((result.handled, result.skipped, result.acknowledged), (1, 1, 2))
+        self.assertEqual(api.undelivered, [])
+
+    def test_store_failure(self):
+        rest.fetch = api = FakeEventApi(count=20, page_size=20)
+
+        class LockedStore(MemoryStore):
+
+            def mark(self, id):
+                raise RuntimeError("database is locked")
+
+        result = starkinfra.event.drain(lambda event: None, workers=1, acknowledgers=1, store=LockedStore(), user=offlineUser)
+        self.assertEqual((result.handled, result.acknowledged), (0, 0))
+        self.assertEqual(len(result.failed), 20)
+        self.assertEqual(len(api.undelivered), 20)
+
+    def test_rate(self):
+        rest.fetch = api = FakeEventApi(count=21, page_size=21)
+        starkinfra.event.drain(lambda event: None, acknowledgers=8, rate=200, user=offlineUser)
+        times = sorted(patched for id, patched in api.patched)
+        self.assertGreaterEqual(times[-1] - times[0], 0.09)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import starkinfra
+from os import path
+from time import sleep
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Event as Signal
+from unittest import TestCase, main
+from starkinfra.utils.idempotency import MemoryStore, SqliteStore
+from tests.utils.event import generateEvent as event
+
+
+class TestMemoryStore(TestCase):
+
+    def test_lru(self):
+        store = MemoryStore(size=2)
+        store.mark("1")
+        store.mark("2")
+        self.assertTrue(store.seen("1"))
+        store.mark("3")
+        self.assertTrue(store.seen("1"))
+        self.assertFalse(store.seen("2"))
+        self.assertTrue(store.seen("3"))
+
+
+class TestSqliteStore(TestCase):
+
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = path.join(self.directory, "events.sqlite3")
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_batched_commit(self):
+        store = SqliteStore(self.path, commit_size=3, commit_delay=60)
+        store.mark("1")
+        store.mark("2")
+        with SqliteStore(self.path) as other:
+            self.assertFalse(other.seen("1"))
+        self.assertTrue(store.seen("1"))
+        store.mark("3")
+        with SqliteStore(self.path) as other:
+            self.assertTrue(other.seen("1"))
+            self.assertTrue(other.seen("3"))
+        store.mark("4")
+        store.close()
+        with SqliteStore(self.path) as other:
+            self.assertTrue(other.seen("4"))
+            self.assertFalse(other.seen("5"))
+
+    def test_commit_delay(self):
+        store = SqliteStore(self.path, commit_size=100, commit_delay=0.01)
+        store.mark("1")
+        sleep(0.02)
+        store.mark("2")
+        with SqliteStore(self.path) as other:
+            self.assertTrue(other.seen("1"))
+            self.assertTrue(other.seen("2"))
+        store.close()
+
+    def test_pending_outside_memory(self):
+        with SqliteStore(self.path, size=1, commit_size=100, commit_delay=60) as store:
+            store.mark("1")
+            store.mark("2")
+            self.assertTrue(store.seen("1"))
+
+    def test_prune(self):
+        with SqliteStore(self.path) as store:
+            store.mark("1")
+            self.assertEqual(store.prune(age=60), 0)
+            sleep(0.02)
+            self.assertEqual(store.prune(age=0.01), 1)
+        with SqliteStore(self.path) as store:
+            self.assertFalse(store.seen("1"))
+
+
+class TestDispatcherStore(TestCase):
+
+    def test_skip(self):
+        handled = []
+        release = Signal()
+
+        def handle(event):
+            release.wait()
+            handled.append(event.id)
+            return event.id
+
+        store = MemoryStore()
+        store.mark("1")
+        with starkinfra.event.Dispatcher(workers=2, store=store) as dispatcher:
+            dispatcher.on("pix-request", handle)
+            self.assertIsNone(dispatcher.dispatch(event(1, entity=1)).result())
+            first = dispatcher.dispatch(event(2, entity=2))
+            self.assertIs(dispatcher.dispatch(event(2, entity=2)), first)
+            release.set()
+            self.assertEqual(first.result(), "2")
+            self.assertIsNone(dispatcher.dispatch(event(2, entity=2)).result())
+        self.assertEqual(handled, ["2"])
+        self.assertEqual(dispatcher.skipped, 2)
+
+    def test_failure_not_marked(self):
+        store = MemoryStore()
+
+        def handle(event):
+            raise ValueError(event.id)
+
+        with starkinfra.event.Dispatcher(store=store) as dispatcher:
+            dispatcher.on("pix-request", handle)
+            with self.assertRaises(ValueError):
+                dispatcher.dispatch(event(1, entity=1)).result()
+        self.assertFalse(store.seen("1"))
+
+
+if __name__ == '__main__':
+    main()
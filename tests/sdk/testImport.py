@@ -0,0 +1,46 @@
+import sys
+import starkinfra
+from subprocess import check_output
+from unittest import TestCase, main
+
+
+class TestLazyImport(TestCase):
+
+    def test_cold_import(self):
+        modules = check_output([
+            sys.executable, "-c",
+            "import sys, starkinfra; print(' '.join(sys.modules))",
+        ]).decode("utf-8").split()
+        loaded = [name for name in modules if name.startswith("starkinfra.")]
+        self.assertEqual(loaded, [])
+        self.assertNotIn("requests", modules)
+        self.assertNotIn("cryptography", modules)
+
+    def test_without_futures(self):
+        check_output([
+            sys.executable, "-c",
+            "import sys; sys.modules['concurrent.futures'] = None; import starkinfra; "
+            "starkinfra.shard, starkinfra.bulk, starkinfra.batch, starkinfra.event.parse, starkinfra.event.Dispatcher",
+        ])
+
+    def test_resolution(self):
+        for name in starkinfra._modules:
+            self.assertEqual(getattr(starkinfra, name).__name__, "starkinfra" + starkinfra._modules[name])
+        for name in starkinfra._classes:
+            self.assertIs(getattr(starkinfra, name), getattr(sys.modules["starkinfra" + starkinfra._classes[name]], name))
+        self.assertEqual(starkinfra.PixRequest.__name__, "PixRequest")
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from starkinfra import *", namespace)
+        for name in ["PixRequest", "pixrequest", "Project", "IssuingPurchase", "endtoendid", "version"]:
+            self.assertIn(name, namespace)
+        self.assertIn("IssuingCard", dir(starkinfra))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            starkinfra.pixrequests
+
+
+if __name__ == '__main__':
+    main()
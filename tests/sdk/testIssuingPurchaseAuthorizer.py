@@ -0,0 +1,88 @@
+import starkinfra
+import asyncio
+from json import loads
+from time import time, sleep
+from unittest import TestCase, main
+from starkinfra.utils import publickey
+from tests.utils.signature import offlineUser, sign, trustPublicKey
+
+
+content = '{"id": "5656565656565656", "amount": 1000, "cardId": "6262626262626262", "holderName": "Tony Stark"}'
+
+
+def call(app, content, signature):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": content.encode("utf-8"), "more_body": False}
+
+    async def send(message):
+        messages.append(dict(message, time=time()))
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [(b"digital-signature", signature.encode("latin-1"))],
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"], messages[1]["body"].decode("utf-8"), messages[1]["time"]
+
+
+class TestIssuingPurchaseAuthorizer(TestCase):
+
+    def setUp(self):
+        trustPublicKey()
+        self.signature = sign(content)
+
+    def tearDown(self):
+        publickey.clear()
+
+    def test_approval(self):
+        app = starkinfra.issuingpurchase.authorizer(
+            lambda purchase: {"status": "approved", "amount": purchase.amount},
+            user=offlineUser,
+        )
+        status, body, sent = call(app, content, self.signature)
+        self.assertEqual(status, 200)
+        self.assertEqual(loads(body), {"authorization": {"status": "approved", "amount": 1000}})
+        self.assertEqual(app.latency["total"].count, 1)
+        self.assertEqual(app.latency["decision"].count, 1)
+
+    def test_async_decision(self):
+        async def decide(purchase):
+            return starkinfra.issuingpurchase.response(status="denied", reason="other")
+
+        app = starkinfra.issuingpurchase.authorizer(decide, user=offlineUser)
+        status, body, sent = call(app, content, self.signature)
+        self.assertEqual(loads(body), {"authorization": {"status": "denied", "reason": "other"}})
+
+    def test_deadline(self):
+        def decide(purchase):
+            sleep(0.5)
+            return {"status": "approved"}
+
+        app = starkinfra.issuingpurchase.authorizer(decide, deadline=0.1, user=offlineUser)
+        start = time()
+        status, body, sent = call(app, content, self.signature)
+        self.assertLess(sent - start, 0.5)
+        self.assertEqual(status, 200)
+        self.assertEqual(loads(body), {"authorization": {"status": "denied", "reason": "confirmationDeadline"}})
+        self.assertEqual(app.fallbacks["timeout"], 1)
+
+    def test_error(self):
+        fallback = starkinfra.issuingpurchase.response(status="approved")
+        app = starkinfra.issuingpurchase.authorizer(lambda purchase: 1 / 0, fallback=fallback, user=offlineUser)
+        status, body, sent = call(app, content, self.signature)
+        self.assertEqual(body, fallback)
+        self.assertEqual(app.fallbacks["error"], 1)
+
+    def test_invalid_signature(self):
+        app = starkinfra.issuingpurchase.authorizer(lambda purchase: {"status": "approved"}, user=offlineUser)
+        signature = sign(content + " ")
+        status, body, sent = call(app, content, signature)
+        self.assertEqual(status, 401)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import starkinfra
+from unittest import TestCase, main
+from datetime import datetime, date
+from starkcore.utils.api import api_json
+from starkinfra.utils.api import from_api_json
+from starkinfra.utils.lazy import Lazy
+from starkinfra.event.__event import _resource as _event_resource
+from starkinfra.pixrequest.__pixrequest import _resource as _pixrequest_resource
+from starkinfra.pixrequest.log.__log import _resource as _pixrequest_log_resource
+from tests.utils.resourceJson import pixRequest, pixRequestLog
+
+
+class TestLazyDatetime(TestCase):
+
+    def test_types(self):
+        request = from_api_json(_pixrequest_resource, pixRequest)
+        self.assertIs(type(request.created), datetime)
+        statement = starkinfra.PixStatement(after="2023-01-01", before="2023-01-31", type="interchange")
+        self.assertIs(type(statement.after), date)
+
+    def test_new_style(self):
+        for name in starkinfra._classes:
+            cls = getattr(starkinfra, name)
+            if any(isinstance(value, Lazy) for value in vars(cls).values()):
+                self.assertIsInstance(cls, type, name)
+
+    def test_parse_on_access(self):
+        request = from_api_json(_pixrequest_resource, pixRequest)
+        self.assertEqual(request._created, "2023-01-01T12:00:00.000000+00:00")
+        created = request.created
+        self.assertIsInstance(created, datetime)
+        self.assertIs(request._created, created)
+        self.assertIs(request.created, created)
+        self.assertIsNone(request.updated)
+
+    def test_parsed_values(self):
+        statement = starkinfra.PixStatement(after=datetime(2023, 1, 1, 12), before="2023-01-31", type="interchange")
+        self.assertEqual(statement.after, date(2023, 1, 1))
+        self.assertEqual(statement.before, date(2023, 1, 31))
+        self.assertEqual(api_json(statement)["after"], "2023-01-01")
+
+    def test_compact(self):
+        starkinfra.compact = True
+        try:
+            request = from_api_json(_pixrequest_resource, pixRequest)
+        finally:
+            starkinfra.compact = False
+        self.assertFalse(hasattr(request, "__dict__"))
+        self.assertEqual(request.created, datetime(2023, 1, 1, 12))
+
+
+class TestLazyEntity(TestCase):
+
+    def test_types(self):
+        log = from_api_json(_pixrequest_log_resource, pixRequestLog)
+        self.assertIs(type(log.request), starkinfra.PixRequest)
+        self.assertIs(type(log.request.created), datetime)
+        event = from_api_json(_event_resource, {"id": "1", "subscription": "pix-request.in", "log": pixRequestLog})
+        self.assertIs(type(event.log), _pixrequest_log_resource["class"])
+
+    def test_new_style(self):
+        for name in starkinfra._modules:
+            cls = getattr(getattr(starkinfra, name), "Log", None)
+            if cls is not None:
+                self.assertIsInstance(cls, type, name)
+        self.assertIsInstance(starkinfra.Event, type)
+
+    def test_log(self):
+        log = from_api_json(_pixrequest_log_resource, pixRequestLog)
+        self.assertIsInstance(log._request, dict)
+        request = log.request
+        self.assertIsInstance(request, starkinfra.PixRequest)
+        self.assertIs(log.request, request)
+        self.assertEqual(request.external_id, "my-external-id")
+
+    def test_event(self):
+        event = from_api_json(_event_resource, {
+            "id": "1", "subscription": "pix-request.in", "isDelivered": False, "workspaceId": "2",
+            "created": "2023-01-01T12:00:00.000000+00:00", "log": pixRequestLog,
+        })
+        self.assertIsInstance(event._log, dict)
+        self.assertEqual(event.log.request.amount, 1000)
+        self.assertIs(type(event.log), _pixrequest_log_resource["class"])
+
+    def test_unknown_subscription(self):
+        event = from_api_json(_event_resource, {"id": "1", "subscription": "new-service", "log": {"id": "2"}})
+        self.assertEqual(event.log, {"id": "2"})
+
+    def test_object(self):
+        request = from_api_json(_pixrequest_resource, pixRequest)
+        log = _pixrequest_log_resource["class"](id="1", request=request, type="created", errors=[], created=None)
+        self.assertIs(log.request, request)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import starkinfra
+from unittest import TestCase, main
+from starkcore.error import InvalidSignatureError
+from starkinfra.utils import crypto, publickey, parsecache
+from tests.utils.signature import offlineUser, publicKeyPem, sign, trustPublicKey
+
+
+content = '{"id": "5656565656565656", "amount": 1000, "cardId": "6262626262626262", "holderName": "Tony Stark"}'
+
+
+class TestParseCache(TestCase):
+
+    def setUp(self):
+        trustPublicKey()
+        self.signature = sign(content)
+        self.verify = crypto.verify
+        self.verifications = 0
+
+        def verify(*args, **kwargs):
+            self.verifications += 1
+            return self.verify(*args, **kwargs)
+
+        crypto.verify = verify
+        starkinfra.parse_cache_size = 10
+
+    def tearDown(self):
+        crypto.verify = self.verify
+        starkinfra.parse_cache_size = 0
+        starkinfra.parse_cache_ttl = 600
+        publickey.clear()
+        parsecache.clear()
+
+    def parse(self, content=content, signature=None):
+        return starkinfra.issuingpurchase.parse(content=content, signature=signature or self.signature, user=offlineUser)
+
+    def test_redelivery(self):
+        purchase = self.parse()
+        purchase.amount = 999
+        retried = self.parse()
+        self.assertIsNot(retried, purchase)
+        self.assertEqual(retried.amount, 1000)
+        self.assertEqual(self.verifications, 1)
+        stats = parsecache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"], stats["capacity"]), (1, 1, 1, 10))
+
+    def test_disabled(self):
+        starkinfra.parse_cache_size = 0
+        self.assertIsNot(self.parse(), self.parse())
+        self.assertEqual(self.verifications, 2)
+        self.assertEqual(parsecache.stats()["size"], 0)
+
+    def test_expiration(self):
+        starkinfra.parse_cache_ttl = -1
+        self.parse()
+        self.parse()
+        self.assertEqual(self.verifications, 2)
+        self.assertEqual(parsecache.stats()["expirations"], 1)
+
+    def test_eviction(self):
+        starkinfra.parse_cache_size = 1
+        other = content.replace("1000", "2000")
+        self.parse()
+        self.parse(content=other, signature=sign(other))
+        self.parse()
+        self.assertEqual(self.verifications, 3)
+        self.assertEqual(parsecache.stats()["evictions"], 2)
+
+    def test_invalid_signature(self):
+        signature = sign("other")
+        refresh, publickey._refresh = publickey._refresh, lambda *args, **kwargs: publicKeyPem
+        try:
+            for _ in range(2):
+                with self.assertRaises(InvalidSignatureError):
+                    self.parse(signature=signature)
+        finally:
+            publickey._refresh = refresh
+        self.assertEqual(parsecache.stats()["size"], 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import starkinfra
+from unittest import TestCase, main
+from starkcore.error import InvalidSignatureError
+from starkinfra.utils import publickey
+from tests.utils.event import generateEventJson
+from tests.utils.signature import offlineUser, publicKeyPem, signed, trustPublicKey
+
+
+def event(id):
+    return signed({"event": generateEventJson(id, entity=id)})
+
+
+class TestParseMany(TestCase):
+
+    def setUp(self):
+        trustPublicKey()
+
+    def tearDown(self):
+        publickey.clear()
+
+    def test_order(self):
+        items = [event(id) for id in range(1, 21)]
+        events = starkinfra.event.parse_many(items, workers=2, user=offlineUser)
+        self.assertEqual([event.id for event in events], [str(id) for id in range(1, 21)])
+        self.assertEqual(events[4].log.request.amount, 5)
+
+    def test_current_process(self):
+        events = starkinfra.event.parse_many([event(1), event(2)], workers=1, user=offlineUser)
+        self.assertEqual([event.id for event in events], ["1", "2"])
+
+    def test_defaults(self):
+        requests = starkinfra.pixrequest.parse_many([signed({"id": "1", "amount": 100})], user=offlineUser)
+        self.assertEqual((requests[0].fee, requests[0].tags, requests[0].external_id), (0, [], ""))
+
+    def test_invalid_signature(self):
+        content, signature = event(2)
+        refresh, publickey._refresh = publickey._refresh, lambda *args, **kwargs: publicKeyPem
+        try:
+            with self.assertRaises(InvalidSignatureError):
+                starkinfra.event.parse_many([event(1), (content, event(3)[1])], workers=2, user=offlineUser)
+        finally:
+            publickey._refresh = refresh
+
+
+if __name__ == '__main__':
+    main()
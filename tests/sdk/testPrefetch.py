@@ -0,0 +1,49 @@
+from time import sleep
+from threading import current_thread
+from unittest import TestCase, main
+from starkinfra.utils.prefetcher import prefetch
+
+
+class TestPrefetch(TestCase):
+
+    def test_order(self):
+        self.assertEqual(list(prefetch(iter(range(50)), depth=2)), list(range(50)))
+
+    def test_background(self):
+        threads = []
+
+        def pages():
+            for page in range(3):
+                threads.append(current_thread())
+                yield page
+
+        list(prefetch(pages(), depth=2))
+        self.assertNotIn(current_thread(), threads)
+
+    def test_bounded(self):
+        fetched = []
+
+        def pages():
+            for page in range(10):
+                fetched.append(page)
+                yield page
+
+        iterator = prefetch(pages(), depth=2)
+        next(iterator)
+        sleep(0.2)
+        self.assertLessEqual(len(fetched), 4)
+        iterator.close()
+
+    def test_exception(self):
+        def pages():
+            yield 1
+            raise ValueError("page failed")
+
+        iterator = prefetch(pages(), depth=2)
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(ValueError):
+            next(iterator)
+
+
+if __name__ == '__main__':
+    main()
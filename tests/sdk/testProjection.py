@@ -0,0 +1,102 @@
+import sys
+import json
+import starkinfra
+from re import search
+from pickle import dumps, loads
+from datetime import datetime
+from unittest import TestCase, main
+from starkinfra.utils import rest
+from starkinfra.utils.projection import projection_class
+from tests.utils.event import generateEventJson
+from tests.utils.fakeFetch import FakeFetch
+from tests.utils.signature import offlineUser
+
+
+class TestProjection(TestCase):
+
+    def setUp(self):
+        self.fetch = rest.fetch
+        rest.fetch = FakeFetch([
+            {"requests": [{"id": "1", "amount": 100, "status": "success", "created": "2023-01-01T12:00:00.000000+00:00"}]},
+            {"requests": [{"id": "2", "amount": 200, "status": "failed", "created": "2023-01-02T12:00:00.000000+00:00"}]},
+        ])
+
+    def tearDown(self):
+        rest.fetch = self.fetch
+
+    def test_query(self):
+        requests = list(starkinfra.pixrequest.query(fields=["amount", "created"], user=offlineUser))
+        self.assertEqual([request.id for request in requests], ["1", "2"])
+        self.assertEqual([request.amount for request in requests], [100, 200])
+        self.assertEqual(requests[0].created.replace(tzinfo=None), datetime(2023, 1, 1, 12))
+        self.assertEqual(type(requests[0]).__name__, "PixRequest")
+        self.assertEqual(repr(requests[0]), "PixRequest[1]")
+        self.assertNotIn("fields", rest.fetch.queries[0])
+
+    def test_not_retrieved(self):
+        request = next(starkinfra.pixrequest.query(fields=["amount"], user=offlineUser))
+        with self.assertRaises(AttributeError) as context:
+            request.status
+        self.assertIn("fields parameter", str(context.exception))
+        self.assertFalse(hasattr(request, "__dict__"))
+        with self.assertRaises(AttributeError):
+            request.status = "failed"
+        request.amount = 300
+        self.assertEqual(request.amount, 300)
+
+    def test_constructor(self):
+        cls = projection_class(starkinfra.Event, ["subscription"])
+        event = cls(log=None, created=None, is_delivered=False, subscription="pix-request.in", workspace_id=None, id="1")
+        self.assertEqual((event.id, event.subscription), ("1", "pix-request.in"))
+        with self.assertRaises(AttributeError):
+            event.is_delivered
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            starkinfra.pixrequest.page(fields=["amount", "color"], user=offlineUser)
+        self.assertEqual(rest.fetch.queries, [])
+
+    def test_raw(self):
+        requests, cursor = starkinfra.pixrequest.page(fields=["status"], raw=True, user=offlineUser)
+        self.assertEqual(requests, [{"id": "1", "status": "success"}])
+
+    def test_log(self):
+        rest.fetch = FakeFetch([
+            {"logs": [{"id": "1", "type": "success", "errors": [], "created": "2023-01-01T12:00:00.000000+00:00",
+                       "request": {"id": "11", "amount": 100, "endToEndId": "E1"}}]},
+        ])
+        log = next(starkinfra.pixrequest.log.query(fields=["type", "request"], user=offlineUser))
+        self.assertEqual(log.type, "success")
+        self.assertEqual(log.request.end_to_end_id, "E1")
+        with self.assertRaises(AttributeError):
+            log.created
+
+    def test_event_log(self):
+        rest.fetch = FakeFetch([{"events": [generateEventJson(1, entity=11)]}])
+        event = next(starkinfra.event.query(fields=["log"], user=offlineUser))
+        self.assertEqual(event.log.request.amount, 11)
+        self.assertEqual(event.subscription, "pix-request.in")
+        with self.assertRaises(AttributeError):
+            event.created
+
+    def test_docstring_examples(self):
+        for name in starkinfra._modules:
+            getattr(starkinfra, name)
+        for module in list(sys.modules.values()):
+            resource = getattr(module, "_resource", None)
+            if resource is None or not module.__name__.startswith("starkinfra."):
+                continue
+            for function in [getattr(module, "query", None), getattr(module, "page", None)]:
+                match = search(r"- fields \[.*ex: (\[.*\])", getattr(function, "__doc__", None) or "")
+                if match:
+                    projection_class(resource["class"], json.loads(match.group(1)))
+
+    def test_pickle(self):
+        request = next(starkinfra.pixrequest.query(fields=["amount"], user=offlineUser))
+        copy = loads(dumps(request))
+        self.assertEqual((copy.id, copy.amount), ("1", 100))
+        self.assertIs(type(copy), projection_class(starkinfra.PixRequest, ["amount"]))
+
+
+if __name__ == '__main__':
+    main()
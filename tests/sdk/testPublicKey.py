@@ -0,0 +1,93 @@
+import starkinfra
+from time import sleep, time
+from threading import Thread, Lock
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from starkcore.error import InvalidSignatureError
+from starkcore.utils.host import StarkHost
+from starkinfra.utils import crypto, parse, publickey
+from tests.utils.signature import offlineUser
+
+
+content = '{"event": {"id": "5656565656565656", "subscription": "pix-request.in"}}'
+
+
+class FakeGetRaw:
+
+    def __init__(self, pems):
+        self.pems = pems
+        self.calls = 0
+        self.lock = Lock()
+
+    def __call__(self, **kwargs):
+        with self.lock:
+            self.calls += 1
+            pem = self.pems[min(self.calls, len(self.pems)) - 1]
+        sleep(0.05)
+        return {"publicKeys": [{"content": pem}]}
+
+
+class TestPublicKey(TestCase):
+
+    def setUp(self):
+        self.originalGetRaw = publickey._get_raw
+        self.originalTtl = starkinfra.public_key_ttl
+        self.oldKey = PrivateKey()
+        self.newKey = PrivateKey()
+
+    def tearDown(self):
+        publickey._get_raw = self.originalGetRaw
+        starkinfra.public_key_ttl = self.originalTtl
+        publickey.clear()
+
+    def test_preload(self):
+        publickey._get_raw = FakeGetRaw([self.oldKey.publicKey().toPem()])
+        self.assertEqual(publickey.preload(user=offlineUser), self.oldKey.publicKey().toPem())
+        signature = crypto.sign(message=content, pem=self.oldKey.toPem())
+        for _ in range(10):
+            parse.verify(content=content, signature=signature, user=offlineUser)
+        self.assertEqual(publickey._get_raw.calls, 1)
+
+    def test_background_refresh(self):
+        publickey._get_raw = FakeGetRaw([self.oldKey.publicKey().toPem(), self.newKey.publicKey().toPem()])
+        publickey.preload(user=offlineUser)
+        starkinfra.public_key_ttl = 1
+        publickey._entries[publickey._key(StarkHost.infra, offlineUser)].fetched = time() - 0.9
+        signature = crypto.sign(message=content, pem=self.oldKey.toPem())
+        self.assertEqual(parse.verify(content=content, signature=signature, user=offlineUser), content)
+        sleep(0.2)
+        self.assertEqual(publickey._get_raw.calls, 2)
+        signature = crypto.sign(message=content, pem=self.newKey.toPem())
+        self.assertEqual(parse.verify(content=content, signature=signature, user=offlineUser), content)
+        self.assertEqual(publickey._get_raw.calls, 2)
+
+    def test_single_refresh_on_rotation(self):
+        publickey._get_raw = FakeGetRaw([self.oldKey.publicKey().toPem(), self.newKey.publicKey().toPem()])
+        publickey.preload(user=offlineUser)
+        publickey._entries[publickey._key(StarkHost.infra, offlineUser)].fetched = time() - 60
+        signature = crypto.sign(message=content, pem=self.newKey.toPem())
+        results = []
+
+        def verify():
+            results.append(parse.verify(content=content, signature=signature, user=offlineUser))
+
+        threads = [Thread(target=verify) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [content] * 20)
+        self.assertEqual(publickey._get_raw.calls, 2)
+
+    def test_invalid_signature(self):
+        publickey._get_raw = FakeGetRaw([self.oldKey.publicKey().toPem()])
+        publickey.preload(user=offlineUser)
+        signature = crypto.sign(message=content, pem=self.newKey.toPem())
+        for _ in range(5):
+            with self.assertRaises(InvalidSignatureError):
+                parse.verify(content=content, signature=signature, user=offlineUser)
+        self.assertEqual(publickey._get_raw.calls, 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import starkinfra
+from unittest import TestCase, main
+from starkinfra.utils import rest
+from tests.utils.fakeFetch import FakeFetch
+from tests.utils.signature import offlineUser
+
+
+class TestRaw(TestCase):
+
+    def setUp(self):
+        self.fetch = rest.fetch
+        rest.fetch = FakeFetch([
+            {"logs": [{"id": "1", "type": "success", "request": {"id": "11", "endToEndId": "E1"}}]},
+            {"logs": [{"id": "2", "type": "failed", "request": {"id": "12", "endToEndId": "E2"}}]},
+        ])
+
+    def tearDown(self):
+        rest.fetch = self.fetch
+
+    def test_query(self):
+        logs = list(starkinfra.pixrequest.log.query(raw=True, user=offlineUser))
+        self.assertEqual([log["request"]["endToEndId"] for log in logs], ["E1", "E2"])
+        self.assertNotIn("raw", rest.fetch.queries[0])
+
+    def test_snake_case(self):
+        logs = list(starkinfra.pixrequest.log.query(raw="snake_case", user=offlineUser))
+        self.assertEqual(logs[0], {"id": "1", "type": "success", "request": {"id": "11", "end_to_end_id": "E1"}})
+
+    def test_page(self):
+        logs, cursor = starkinfra.pixrequest.log.page(raw=True, user=offlineUser)
+        self.assertEqual(logs, [{"id": "1", "type": "success", "request": {"id": "11", "endToEndId": "E1"}}])
+        self.assertEqual(cursor, "1")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import starkinfra
+from datetime import date
+from unittest import TestCase, main
+from starkcore.utils import api
+from starkinfra.utils import rest
+from starkinfra.utils.api import api_json, api_jsons, serializer, cast_json_to_api_format
+from starkinfra.utils.compact import compact
+from tests.utils.fakeFetch import FakeFetch
+from tests.utils.signature import offlineUser
+from tests.utils.resourceObject import pixRequest, creditNote, issuingCard
+
+
+class TestSerializer(TestCase):
+
+    def test_equivalence(self):
+        for entity in [pixRequest(), creditNote(), issuingCard()]:
+            self.assertEqual(api_json(entity), api.api_json(entity))
+
+    def test_dictionary(self):
+        entity = {"amount": 1000, "external_id": "1234", "scheduled": date(2023, 1, 1), "tags": None}
+        self.assertEqual(api_json(entity), api.api_json(entity))
+        self.assertEqual(api_json(entity), {"amount": 1000, "externalId": "1234", "scheduled": "2023-01-01"})
+
+    def test_batch(self):
+        entities = [pixRequest(), creditNote(), {"amount": 1}, pixRequest()]
+        self.assertEqual(api_jsons(entities), [api.api_json(entity) for entity in entities])
+
+    def test_compact(self):
+        entity = compact(pixRequest())
+        self.assertEqual(api_json(entity), api.api_json(pixRequest()))
+
+    def test_nested_compact(self):
+        for entity in [creditNote(), issuingCard()]:
+            self.assertEqual(api_json(compact(entity)), api.api_json(entity))
+        rules = compact(issuingCard()).rules
+        self.assertEqual(cast_json_to_api_format({"rules": rules}), {"rules": api.api_json(issuingCard())["rules"]})
+
+    def test_cache(self):
+        self.assertIs(serializer(starkinfra.PixRequest), serializer(starkinfra.PixRequest))
+
+    def test_create(self):
+        fetch = rest.fetch
+        rest.fetch = FakeFetch([{"requests": []}])
+        try:
+            starkinfra.pixrequest.create([pixRequest(), pixRequest()], user=offlineUser)
+        finally:
+            fetch, rest.fetch = rest.fetch, fetch
+        self.assertEqual(fetch.payloads[0], {"requests": [api.api_json(pixRequest())] * 2})
+
+
+if __name__ == '__main__':
+    main()
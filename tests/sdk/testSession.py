@@ -0,0 +1,46 @@
+import starkinfra
+from time import sleep
+from unittest import TestCase, main
+from starkinfra.utils import session
+
+
+privateKey, _ = starkinfra.key.create()
+project = starkinfra.Project(environment="sandbox", id="5656565656565656", private_key=privateKey)
+organization = starkinfra.Organization(environment="sandbox", id="4545454545454545", private_key=privateKey)
+
+
+class TestSessionLease(TestCase):
+
+    def tearDown(self):
+        session.clear()
+
+    def test_reuse(self):
+        with session.lease(project) as first:
+            pass
+        with session.lease(project) as second:
+            pass
+        self.assertIs(first, second)
+
+    def test_per_user(self):
+        with session.lease(project) as first:
+            pass
+        with session.lease(organization) as second:
+            pass
+        self.assertIsNot(first, second)
+
+    def test_idle_eviction(self):
+        idle_timeout = starkinfra.pool_idle_timeout
+        starkinfra.pool_idle_timeout = 0.01
+        try:
+            with session.lease(project) as first:
+                sleep(0.05)
+            sleep(0.05)
+            with session.lease(project) as second:
+                pass
+        finally:
+            starkinfra.pool_idle_timeout = idle_timeout
+        self.assertIsNot(first, second)
+
+
+if __name__ == '__main__':
+    main()
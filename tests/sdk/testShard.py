@@ -0,0 +1,81 @@
+import starkinfra
+from threading import Lock
+from unittest import TestCase, main
+from datetime import date, timedelta
+from starkinfra.utils.shard import _split
+
+
+class Entity:
+
+    def __init__(self, id, created):
+        self.id = id
+        self.created = created
+
+
+class FakePage:
+
+    def __init__(self, per_day):
+        self.per_day = per_day
+        self.calls = []
+        self.lock = Lock()
+
+    def __call__(self, cursor=None, limit=None, after=None, before=None, user=None, raw=False, **filters):
+        with self.lock:
+            self.calls.append((after, before, cursor))
+        entities = []
+        day = before
+        while day >= after:
+            entities.extend(Entity(id="{}-{}".format(day, i), created=day) for i in range(self.per_day(day)))
+            day -= timedelta(days=1)
+        if raw:
+            entities = [vars(entity) for entity in entities]
+        offset = int(cursor or 0)
+        cursor = str(offset + limit) if offset + limit < len(entities) else None
+        return entities[offset:offset + limit], cursor
+
+
+class TestShardSplit(TestCase):
+
+    def test_cover(self):
+        after, before = date(2023, 1, 1), date(2023, 1, 10)
+        windows = _split(after, before, count=3)
+        self.assertEqual(windows[0][1], before)
+        self.assertEqual(windows[-1][0], after)
+        for newer, older in zip(windows, windows[1:]):
+            self.assertEqual(newer[0] - timedelta(days=1), older[1])
+
+    def test_more_shards_than_days(self):
+        self.assertEqual(len(_split(date(2023, 1, 1), date(2023, 1, 2), count=8)), 2)
+
+
+class TestShardQuery(TestCase):
+
+    def test_order(self):
+        page = FakePage(per_day=lambda day: 30 if day.day % 5 else 250)
+        after, before = date(2023, 1, 1), date(2023, 1, 31)
+        entities = list(starkinfra.shard.query(page, after=after, before=before, workers=4))
+        expected = list(starkinfra.shard.query(page, after=after, before=before, workers=1))
+        self.assertEqual(len(entities), sum(30 if day % 5 else 250 for day in range(1, 32)))
+        self.assertEqual(len(set(entity.id for entity in entities)), len(entities))
+        self.assertEqual([entity.id for entity in entities], [entity.id for entity in expected])
+        self.assertEqual(sorted(entities, key=lambda entity: entity.created, reverse=True), entities)
+
+    def test_refine(self):
+        page = FakePage(per_day=lambda day: 150 if day == date(2023, 1, 20) else 1)
+        list(starkinfra.shard.query(page, after=date(2023, 1, 1), before=date(2023, 1, 31), workers=2))
+        self.assertIn((date(2023, 1, 20), date(2023, 1, 20), None), page.calls)
+
+    def test_raw(self):
+        page = FakePage(per_day=lambda day: 150 if day == date(2023, 1, 20) else 30)
+        entities = list(starkinfra.shard.query(page, after=date(2023, 1, 1), before=date(2023, 1, 31), raw=True))
+        self.assertEqual(len(entities), 30 * 30 + 150)
+        self.assertEqual(len(set(entity["id"] for entity in entities)), len(entities))
+
+    def test_limit(self):
+        page = FakePage(per_day=lambda day: 50)
+        entities = list(starkinfra.shard.query(page, after=date(2023, 1, 1), before=date(2023, 3, 1), limit=120))
+        self.assertEqual(len(entities), 120)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+from starkinfra.utils.api import from_api_json
+from starkinfra.event.__event import _resource as _event_resource
+
+
+_entityNames = {"pix-request.in": "request", "pix-request.out": "request", "issuing-invoice": "invoice"}
+
+
+def generateEventJson(id, entity, subscription="pix-request.in"):
+    return {
+        "id": str(id), "subscription": subscription, "isDelivered": False, "workspaceId": "5656565656565656",
+        "created": "2023-01-01T12:00:00.000000+00:00", "log": {
+            "id": str(id), "type": "created", "errors": [], "created": "2023-01-01T12:00:00.000000+00:00",
+            _entityNames[subscription]: {"id": str(entity), "amount": entity} if entity is not None else None,
+        },
+    }
+
+
+def generateEvent(id, entity, subscription="pix-request.in"):
+    return from_api_json(_event_resource, generateEventJson(id, entity, subscription))
@@ -0,0 +1,29 @@
+from time import sleep
+from threading import Lock
+from starkcore.error import InputErrors
+
+
+class FakeCreate:
+
+    def __init__(self, invalid=(), error=None, delay=0):
+        self.invalid = invalid
+        self.error = error
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.concurrency = 0
+        self.lock = Lock()
+
+    def __call__(self, entities, user=None):
+        with self.lock:
+            self.calls.append(list(entities))
+            self.running += 1
+            self.concurrency = max(self.concurrency, self.running)
+        sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if self.error:
+            raise self.error
+        if any(entity in self.invalid for entity in entities):
+            raise InputErrors([{"code": "invalidJson", "message": "invalid entity"}])
+        return ["created-{}".format(entity) for entity in entities]
@@ -0,0 +1,49 @@
+from json import dumps
+from time import time
+from threading import Lock
+from starkcore.error import InternalServerError
+from starkinfra.utils.request import Response
+from .event import generateEventJson
+
+
+class FakeFetch:
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+        self.payloads = []
+
+    def __call__(self, host, sdk_version, user, method, path, payload=None, query=None, api_version="v2", language="en-US", timeout=15):
+        self.queries.append(dict(query or {}))
+        self.payloads.append(payload)
+        index = int(query.get("cursor") or 0)
+        cursor = str(index + 1) if index + 1 < len(self.pages) else None
+        content = dumps(dict(self.pages[index], cursor=cursor))
+        return Response(status=200, content=content.encode("utf-8"))
+
+
+class FakeEventApi:
+
+    def __init__(self, count, page_size=10, failing=()):
+        self.undelivered = [str(id) for id in range(count)]
+        self.page_size = page_size
+        self.failing = set(failing)
+        self.patched = []
+        self.lock = Lock()
+
+    def __call__(self, host, sdk_version, user, method, path, payload=None, query=None, api_version="v2", language="en-US", timeout=15):
+        if method == "PATCH":
+            id = path.split("/")[-1]
+            if id in self.failing:
+                raise InternalServerError()
+            with self.lock:
+                self.patched.append((id, time()))
+                self.undelivered.remove(id)
+            event = dict(generateEventJson(id, entity=int(id)), isDelivered=True)
+            return Response(status=200, content=dumps({"event": event}).encode("utf-8"))
+        index = int(query.get("cursor") or 0)
+        with self.lock:
+            ids = self.undelivered[index:index + self.page_size]
+        cursor = str(index + self.page_size) if ids else None
+        events = [generateEventJson(id, entity=int(id)) for id in ids]
+        return Response(status=200, content=dumps({"events": events, "cursor": cursor}).encode("utf-8"))
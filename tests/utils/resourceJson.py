@@ -0,0 +1,32 @@
+pixRequest = {
+    "id": "5656565656565656", "amount": 1000, "externalId": "my-external-id", "senderName": "Tony Stark",
+    "status": "success", "tags": ["reconciliation"], "created": "2023-01-01T12:00:00.000000+00:00",
+}
+pixRequestLog = {
+    "id": "6262626262626262", "type": "success", "errors": [], "created": "2023-01-01T12:00:00.000000+00:00",
+    "request": pixRequest,
+}
+issuingCard = {
+    "id": "5656565656565656", "holderName": "Tony Stark", "holderTaxId": "012.345.678-90",
+    "holderExternalId": "my-holder", "rules": [{"name": "general", "amount": 1000}],
+}
+fullPixRequest = {
+    "id": "5656565656565656", "amount": 1000, "externalId": "my-external-id", "endToEndId": "E20018183202201201450u34sDGd1",
+    "senderName": "Tony Stark", "senderTaxId": "012.345.678-90", "senderBankCode": "20018183", "senderBranchCode": "0001",
+    "senderAccountNumber": "000001", "senderAccountType": "checking", "receiverName": "Edward Stark",
+    "receiverTaxId": "012.345.678-90", "receiverBankCode": "20018183", "receiverBranchCode": "0001",
+    "receiverAccountNumber": "000002", "receiverAccountType": "checking", "status": "success", "flow": "in",
+    "fee": 0, "tags": ["reconciliation"], "method": "manual", "created": "2023-01-01T12:00:00.000000+00:00",
+    "updated": "2023-01-01T12:00:01.000000+00:00",
+}
+fullIssuingPurchase = {
+    "id": "5656565656565656", "holderName": "Tony Stark", "cardId": "6262626262626262", "cardEnding": "1234",
+    "amount": 1000, "tax": 0, "issuerAmount": 1000, "issuerCurrencyCode": "BRL", "merchantAmount": 1000,
+    "merchantCurrencyCode": "BRL", "merchantCategoryCode": "fastFoodRestaurants", "merchantCountryCode": "BRA",
+    "merchantName": "Stark Burgers", "status": "confirmed", "tags": [], "created": "2023-01-01T12:00:00.000000+00:00",
+    "updated": "2023-01-01T12:00:01.000000+00:00",
+}
+fullPixRequestLog = {
+    "id": "5656565656565656", "type": "success", "errors": [], "created": "2023-01-01T12:00:00.000000+00:00",
+    "request": fullPixRequest,
+}
@@ -0,0 +1,36 @@
+import starkinfra
+from datetime import datetime, date, timedelta
+from starkinfra.creditnote import Invoice, Transfer
+from starkinfra.creditsigner import CreditSigner
+
+
+def pixRequest():
+    return starkinfra.PixRequest(
+        amount=1000, external_id="my-external-id", sender_name="Tony Stark", sender_tax_id="012.345.678-90",
+        sender_branch_code="0001", sender_account_number="000001", sender_account_type="checking",
+        receiver_name="Edward Stark", receiver_tax_id="012.345.678-90", receiver_bank_code="20018183",
+        receiver_account_number="000002", receiver_branch_code="0001", receiver_account_type="checking",
+        end_to_end_id="E20018183202201201450u34sDGd1", tags=["reconciliation"],
+    )
+
+
+def creditNote():
+    return starkinfra.CreditNote(
+        template_id="5656565656565656", name="Jamie Lannister", tax_id="012.345.678-90", nominal_amount=100000,
+        scheduled=datetime(2022, 4, 28, 12), invoices=[Invoice(due=date(2023, 6, 25), amount=120000)],
+        payment=Transfer(bank_code="00000000", branch_code="1234", account_number="129340-1",
+                         name="Jamie Lannister", tax_id="012.345.678-90"),
+        signers=[CreditSigner(name="Jamie Lannister", contact="jamie.lannister@gmail.com", method="link")],
+        external_id="1234", street_line_1="Rua ABC", street_line_2="Ap 123", district="Jardim Paulista",
+        city="Sao Paulo", state_code="SP", zip_code="01234-567", tags=["test"], expiration=timedelta(days=7),
+    )
+
+
+def issuingCard():
+    return starkinfra.IssuingCard(
+        holder_name="Tony Stark", holder_tax_id="012.345.678-90", holder_external_id="1234",
+        rules=[starkinfra.IssuingRule(
+            name="Example Rule", interval="day", amount=100000, currency_code="USD",
+            categories=[starkinfra.MerchantCategory(type="food")],
+        )],
+    )
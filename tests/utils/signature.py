@@ -0,0 +1,26 @@
+import starkinfra
+from json import dumps
+from time import time
+from ellipticcurve import PrivateKey
+from starkcore.utils.host import StarkHost
+from starkinfra.utils import crypto, publickey
+
+
+privateKey = PrivateKey()
+privateKeyPem = privateKey.toPem()
+publicKeyPem = privateKey.publicKey().toPem()
+
+offlineUser = starkinfra.Project(environment="sandbox", id="5656565656565656", private_key=privateKeyPem)
+
+
+def sign(content):
+    return crypto.sign(message=content, pem=privateKeyPem)
+
+
+def signed(json):
+    content = dumps(json)
+    return content, sign(content)
+
+
+def trustPublicKey(user=offlineUser, pem=publicKeyPem):
+    publickey._entries[publickey._key(StarkHost.infra, user)] = publickey._Entry(pem=pem, fetched=time())